@@ -72,6 +72,7 @@ import {
     useModule,
 } from "../../utils/hooks";
 import TableFilter, { FilterDesc } from "./TableFilter";
+import TableSearch from "./TableSearch";
 import { getSuffixedClassNames } from "./utils";
 
 interface RowData {
@@ -189,6 +190,7 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
     const [orderBy, setOrderBy] = useState("");
     const [order, setOrder] = useState<Order>("asc");
     const [appliedFilters, setAppliedFilters] = useState<FilterDesc[]>([]);
+    const [appliedSearch, setAppliedSearch] = useState("");
     const [visibleStartIndex, setVisibleStartIndex] = useState(0);
     const [aggregates, setAggregates] = useState<string[]>([]);
     const infiniteLoaderRef = useRef<InfiniteLoader>(null);
@@ -236,6 +238,12 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
         [orderBy, order]
     );
 
+    const onSearch = useCallback((search: string) => {
+        setAppliedSearch(search);
+        setRows([]);
+        setTimeout(() => infiniteLoaderRef.current?.resetloadMoreItemsCache(true), 1); // So that the state can be changed
+    }, []);
+
     useEffect(() => {
         if (refresh) {
             setRows([]);
@@ -274,7 +282,10 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
                         col.tooltip = props.tooltip;
                     }
                 });
-                addDeleteColumn((active && (onAdd || onDelete) ? 1 : 0) + (active && filter ? 1 : 0), baseColumns);
+                addDeleteColumn(
+                    (active && (onAdd || onDelete) ? 1 : 0) + (active && filter ? 1 : 0) + (active && props.search ? 1 : 0),
+                    baseColumns
+                );
                 const colsOrder = Object.keys(baseColumns).sort(getsortByIndex(baseColumns));
                 const styTt = colsOrder.reduce<Record<string, Record<string, string>>>((pv, col) => {
                     if (baseColumns[col].style) {
@@ -305,7 +316,18 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
             hNan,
             false,
         ];
-    }, [active, editable, onAdd, onDelete, baseColumns, props.lineStyle, props.tooltip, props.nanValue, props.filter]);
+    }, [
+        active,
+        editable,
+        onAdd,
+        onDelete,
+        baseColumns,
+        props.lineStyle,
+        props.tooltip,
+        props.nanValue,
+        props.filter,
+        props.search,
+    ]);
 
     const boxBodySx = useMemo(() => ({ height: height }), [height]);
 
@@ -342,7 +364,7 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
                 const afs = appliedFilters.filter((fd) => Object.values(columns).some((cd) => cd.dfid === fd.col));
                 const key = `Infinite-${cols.join()}-${orderBy}-${order}${agg}${afs.map(
                     (af) => `${af.col}${af.action}${af.value}`
-                )}`;
+                )}${appliedSearch ? `-search-${appliedSearch}` : ""}`;
                 page.current = {
                     key: key,
                     promises: { ...page.current.promises, [startIndex]: { resolve: resolve, reject: reject } },
@@ -371,7 +393,10 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
                         styles,
                         tooltips,
                         handleNan,
-                        afs
+                        afs,
+                        appliedSearch,
+                        props.compression,
+                        props.dataFormat
                     )
                 );
             });
@@ -388,6 +413,9 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
             columns,
             handleNan,
             appliedFilters,
+            appliedSearch,
+            props.compression,
+            props.dataFormat,
             dispatch,
             module,
         ]
@@ -550,6 +578,14 @@ const AutoLoadingTable = (props: TaipyTableProps) => {
                                                             className={className}
                                                         />
                                                     ) : null,
+                                                    active && props.search ? (
+                                                        <TableSearch
+                                                            key="search"
+                                                            onValidate={onSearch}
+                                                            appliedSearch={appliedSearch}
+                                                            className={className}
+                                                        />
+                                                    ) : null,
                                                 ]
                                             ) : (
                                                 <TableSortLabel
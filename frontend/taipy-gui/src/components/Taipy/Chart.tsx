@@ -53,6 +53,8 @@ interface ChartProp extends TaipyActiveProps, TaipyChangeProps {
     template?: string;
     template_Dark_?: string;
     template_Light_?: string;
+    compression?: boolean;
+    dataFormat?: string;
     //[key: `selected_${number}`]: number[];
 }
 
@@ -278,7 +280,9 @@ const Chart = (props: ChartProp) => {
                             config.modes,
                             config.columns,
                             config.traces
-                        )
+                        ),
+                        props.compression,
+                        props.dataFormat
                     )
                 );
             }
@@ -478,7 +482,9 @@ const Chart = (props: ChartProp) => {
                                 config.columns,
                                 config.traces,
                                 eventData
-                            )
+                            ),
+                            props.compression,
+                            props.dataFormat
                         )
                     );
                 }
@@ -78,6 +78,7 @@ import {
     useModule,
 } from "../../utils/hooks";
 import TableFilter, { FilterDesc } from "./TableFilter";
+import TableSearch from "./TableSearch";
 import { getSuffixedClassNames } from "./utils";
 
 const loadingStyle: CSSProperties = { width: "100%", height: "3em", textAlign: "right", verticalAlign: "center" };
@@ -112,8 +113,11 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
     const [loading, setLoading] = useState(true);
     const [aggregates, setAggregates] = useState<string[]>([]);
     const [appliedFilters, setAppliedFilters] = useState<FilterDesc[]>([]);
+    const [appliedSearch, setAppliedSearch] = useState("");
     const dispatch = useDispatch();
     const pageKey = useRef("no-page");
+    // key and fingerprint of the displayed page
+    const heldPage = useRef<{ key: string; etag?: string }>({ key: "" });
     const selectedRowRef = useRef<HTMLTableRowElement | null>(null);
     const formatConfig = useFormatConfig();
     const module = useModule();
@@ -142,7 +146,10 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
                         col.tooltip = props.tooltip;
                     }
                 });
-                addDeleteColumn((active && (onAdd || onDelete) ? 1 : 0) + (active && filter ? 1 : 0), baseColumns);
+                addDeleteColumn(
+                    (active && (onAdd || onDelete) ? 1 : 0) + (active && filter ? 1 : 0) + (active && props.search ? 1 : 0),
+                    baseColumns
+                );
                 const colsOrder = Object.keys(baseColumns).sort(getsortByIndex(baseColumns));
                 const styTt = colsOrder.reduce<Record<string, Record<string, string>>>((pv, col) => {
                     if (baseColumns[col].style) {
@@ -173,7 +180,18 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
             hNan,
             false,
         ];
-    }, [active, editable, onAdd, onDelete, baseColumns, props.lineStyle, props.tooltip, props.nanValue, props.filter]);
+    }, [
+        active,
+        editable,
+        onAdd,
+        onDelete,
+        baseColumns,
+        props.lineStyle,
+        props.tooltip,
+        props.nanValue,
+        props.filter,
+        props.search,
+    ]);
 
     useDispatchRequestUpdateOnFirstRender(dispatch, id, module, updateVars);
 
@@ -188,7 +206,12 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
 
     useEffect(() => {
         if (!refresh && props.data && props.data[pageKey.current] !== undefined) {
-            setValue(props.data[pageKey.current]);
+            const newValue = props.data[pageKey.current];
+            // a page that was not modified is the one that is displayed
+            if (!newValue.notModified) {
+                setValue(newValue);
+                heldPage.current = { key: pageKey.current, etag: newValue.etag };
+            }
             setLoading(false);
         }
     }, [refresh, props.data]);
@@ -207,8 +230,10 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
         const afs = appliedFilters.filter((fd) => Object.values(columns).some((cd) => cd.dfid === fd.col));
         pageKey.current = `${startIndex}-${endIndex}-${cols.join()}-${orderBy}-${order}${agg}${afs.map(
             (af) => `${af.col}${af.action}${af.value}`
-        )}`;
-        if (refresh || !props.data || props.data[pageKey.current] === undefined) {
+        )}${appliedSearch ? `-search-${appliedSearch}` : ""}`;
+        const pageValue = props.data && props.data[pageKey.current];
+        const held = heldPage.current.key === pageKey.current;
+        if (refresh || !pageValue || (pageValue.notModified && !held)) {
             setLoading(true);
             const applies = aggregates.length
                 ? colsOrder.reduce<Record<string, unknown>>((pv, col) => {
@@ -234,11 +259,19 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
                     styles,
                     tooltips,
                     handleNan,
-                    afs
+                    afs,
+                    appliedSearch,
+                    // an empty etag requests the fingerprint of a held page
+                    refresh && held ? heldPage.current.etag || "" : undefined,
+                    props.compression,
+                    props.dataFormat
                 )
             );
         } else {
-            setValue(props.data[pageKey.current]);
+            if (!pageValue.notModified) {
+                setValue(pageValue);
+                heldPage.current = { key: pageKey.current, etag: pageValue.etag };
+            }
             setLoading(false);
         }
         // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -256,6 +289,9 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
         id,
         handleNan,
         appliedFilters,
+        appliedSearch,
+        props.compression,
+        props.dataFormat,
         dispatch,
         module,
     ]);
@@ -441,6 +477,14 @@ const PaginatedTable = (props: TaipyPaginatedTableProps) => {
                                                             className={className}
                                                         />
                                                     ) : null,
+                                                    active && props.search ? (
+                                                        <TableSearch
+                                                            key="search"
+                                                            onValidate={setAppliedSearch}
+                                                            appliedSearch={appliedSearch}
+                                                            className={className}
+                                                        />
+                                                    ) : null,
                                                 ]
                                             ) : (
                                                 <TableSortLabel
@@ -0,0 +1,41 @@
+/*
+ * Copyright 2023 Avaiga Private Limited
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+ * the License. You may obtain a copy of the License at
+ *
+ *        http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+ */
+
+import React from "react";
+import { render, waitFor } from "@testing-library/react";
+import "@testing-library/jest-dom";
+import userEvent from "@testing-library/user-event";
+
+import TableSearch from "./TableSearch";
+
+describe("Table Search Component", () => {
+    it("renders an icon", async () => {
+        const { getByTestId } = render(<TableSearch onValidate={jest.fn()} />);
+        const elt = getByTestId("SearchIcon");
+        expect(elt.parentElement?.tagName).toBe("BUTTON");
+    });
+    it("renders popover when clicked", async () => {
+        const { getByTestId, getAllByText } = render(<TableSearch onValidate={jest.fn()} appliedSearch="abc" />);
+        await userEvent.click(getByTestId("SearchIcon"));
+        expect(getAllByText("Search")).toHaveLength(2);
+        expect(document.querySelector("input")).toHaveValue("abc");
+    });
+    it("validates the typed text once", async () => {
+        const onValidate = jest.fn();
+        const { getByTestId } = render(<TableSearch onValidate={onValidate} />);
+        await userEvent.click(getByTestId("SearchIcon"));
+        await userEvent.keyboard("alice");
+        await waitFor(() => expect(onValidate).toHaveBeenCalledWith("alice"));
+        expect(onValidate).toHaveBeenCalledTimes(1);
+    });
+});
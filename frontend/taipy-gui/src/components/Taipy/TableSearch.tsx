@@ -0,0 +1,109 @@
+/*
+ * Copyright 2023 Avaiga Private Limited
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+ * the License. You may obtain a copy of the License at
+ *
+ *        http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+ * an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+ * specific language governing permissions and limitations under the License.
+ */
+
+import React, { ChangeEvent, useCallback, useEffect, useRef, useState } from "react";
+import SearchIcon from "@mui/icons-material/Search";
+import IconButton from "@mui/material/IconButton";
+import Popover, { PopoverOrigin } from "@mui/material/Popover";
+import TextField from "@mui/material/TextField";
+import Tooltip from "@mui/material/Tooltip";
+
+import { iconInRowSx } from "./tableUtils";
+import { getSuffixedClassNames } from "./utils";
+
+interface TableSearchProps {
+    onValidate: (search: string) => void;
+    appliedSearch?: string;
+    className?: string;
+}
+
+const anchorOrigin = {
+    vertical: "bottom",
+    horizontal: "right",
+} as PopoverOrigin;
+
+const textFieldSx = { m: 1, minWidth: "20em" };
+
+// delay before the typed text is searched
+const SEARCH_DELAY = 300;
+
+const TableSearch = (props: TableSearchProps) => {
+    const { onValidate, appliedSearch = "", className = "" } = props;
+
+    const [showSearch, setShowSearch] = useState(false);
+    const [search, setSearch] = useState(appliedSearch);
+    const searchRef = useRef<HTMLButtonElement | null>(null);
+    const delayRef = useRef(-1);
+
+    const onShowSearchClick = useCallback(() => setShowSearch((s) => !s), []);
+
+    const onSearchChange = useCallback(
+        (e: ChangeEvent<HTMLInputElement>) => {
+            const val = e.target.value;
+            setSearch(val);
+            if (delayRef.current > -1) {
+                window.clearTimeout(delayRef.current);
+            }
+            delayRef.current = window.setTimeout(() => {
+                delayRef.current = -1;
+                onValidate(val);
+            }, SEARCH_DELAY);
+        },
+        [onValidate]
+    );
+
+    useEffect(() => setSearch(appliedSearch), [appliedSearch]);
+
+    useEffect(
+        () => () => {
+            delayRef.current > -1 && window.clearTimeout(delayRef.current);
+        },
+        []
+    );
+
+    return (
+        <>
+            <Tooltip title="Search">
+                <IconButton
+                    onClick={onShowSearchClick}
+                    size="small"
+                    ref={searchRef}
+                    sx={iconInRowSx}
+                    color={appliedSearch ? "primary" : "default"}
+                    className={getSuffixedClassNames(className, "-search-icon")}
+                >
+                    <SearchIcon fontSize="inherit" />
+                </IconButton>
+            </Tooltip>
+            <Popover
+                anchorEl={searchRef.current}
+                anchorOrigin={anchorOrigin}
+                open={showSearch}
+                onClose={onShowSearchClick}
+                className={getSuffixedClassNames(className, "-search")}
+            >
+                <TextField
+                    value={search}
+                    onChange={onSearchChange}
+                    label="Search"
+                    type="search"
+                    size="small"
+                    autoFocus
+                    sx={textFieldSx}
+                />
+            </Popover>
+        </>
+    );
+};
+
+export default TableSearch;
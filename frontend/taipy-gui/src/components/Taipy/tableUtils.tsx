@@ -110,6 +110,9 @@ export interface TaipyTableProps extends TaipyActiveProps, TaipyMultiSelectProps
     cellTooltip?: string;
     nanValue?: string;
     filter?: boolean;
+    search?: boolean;
+    compression?: boolean;
+    dataFormat?: string;
     size?: "small" | "medium";
     defaultKey?: string; // for testing purposes only
     userData?: unknown;
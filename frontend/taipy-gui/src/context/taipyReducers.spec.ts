@@ -14,6 +14,7 @@
 import "@testing-library/jest-dom";
 
 import { taipyReducer, INITIAL_STATE, TaipyBaseAction, createAlertAction, AlertMessage } from "./taipyReducers";
+import { parseData } from "../utils/dataFormat";
 
 describe("reducer", () => {
     it("store socket connected", async () => {
@@ -22,6 +23,24 @@ describe("reducer", () => {
     it("returns update", async () => {
         expect(taipyReducer({...INITIAL_STATE}, {type: "UPDATE", name: "name", payload: {value: "value"}} as TaipyBaseAction).data.name).toBeDefined();
     });
+    it("appends rows", async () => {
+        const data = {name: {key: {rowcount: 2, start: 0, data: [{a: 1}, {a: 2}]}}};
+        let state = taipyReducer({...INITIAL_STATE, data: data}, {type: "UPDATE", name: "name", payload: {pagekey: "key", append: true, value: {rowcount: 3, data: [{a: 3}]}}} as TaipyBaseAction);
+        expect((state.data.name as Record<string, Record<string, unknown>>).key).toEqual({rowcount: 3, start: 0, data: [{a: 1}, {a: 2}, {a: 3}]});
+        expect(taipyReducer(state, {type: "UPDATE", name: "name", payload: {pagekey: "other", append: true, value: {data: []}}} as TaipyBaseAction)).toBe(state);
+    });
+    it("appends chart rows", async () => {
+        // chart payloads as the server sends them, once parsed
+        const chartValue = await parseData({format: "JSON", dataExtraction: true, data: {a: [1, 2], b: ["x", "y"]}});
+        let state = taipyReducer({...INITIAL_STATE}, {type: "UPDATE", name: "name", payload: {pagekey: "chart", alldata: true, value: chartValue}} as TaipyBaseAction);
+        const appendedValue = await parseData({format: "JSON", dataExtraction: true, data: {a: [3], b: ["z"]}});
+        state = taipyReducer(state, {type: "UPDATE", name: "name", payload: {pagekey: "chart", alldata: true, append: true, value: appendedValue}} as TaipyBaseAction);
+        expect((state.data.name as Record<string, unknown>).chart).toEqual({a: [1, 2, 3], b: ["x", "y", "z"]});
+    });
+    it("does not append rows to a page that was not sent", async () => {
+        const state = {...INITIAL_STATE, data: {name: {key: {notModified: true, etag: "etag"}}}};
+        expect(taipyReducer(state, {type: "UPDATE", name: "name", payload: {pagekey: "key", append: true, value: {rowcount: 3, data: [{a: 3}]}}} as TaipyBaseAction)).toBe(state);
+    });
     it("store locations", async () => {
         expect(taipyReducer({...INITIAL_STATE}, {type: "SET_LOCATIONS", payload: {value: {loc: "loc"}}} as TaipyBaseAction).locations).toBeDefined();
     });
@@ -299,6 +299,24 @@ const addRows = (previousRows: Record<string, unknown>[], newRows: Record<string
         return arr;
     }, previousRows.concat([]));
 
+// charts hold the columns that parseData extracted from the payload
+const appendColumns = (previousCols: unknown, newCols: unknown): unknown => {
+    if (Array.isArray(previousCols)) {
+        // one set of columns per data set
+        return Array.isArray(newCols)
+            ? previousCols.map((cols, idx) => (idx < newCols.length ? appendColumns(cols, newCols[idx]) : cols))
+            : previousCols;
+    }
+    if (previousCols && typeof previousCols === "object" && newCols && typeof newCols === "object") {
+        return Object.entries(previousCols as Record<string, unknown>).reduce((cols, [col, values]) => {
+            const newValues = (newCols as Record<string, unknown>)[col];
+            cols[col] = Array.isArray(values) && Array.isArray(newValues) ? values.concat(newValues) : values;
+            return cols;
+        }, {} as Record<string, unknown>);
+    }
+    return previousCols;
+};
+
 const storeBlockUi = (block?: BlockMessage) => () => {
     if (localStorage) {
         if (block) {
@@ -330,9 +348,31 @@ export const taipyReducer = (state: TaipyState, baseAction: TaipyBaseAction): Ta
         case Types.SocketConnected:
             return !!state.isSocketConnected ? state : { ...state, isSocketConnected: true };
         case Types.Update:
-            const newValue = action.payload.value as Record<string, unknown>;
+            let newValue = action.payload.value as Record<string, unknown>;
             const oldValue = (state.data[action.name] as Record<string, unknown>) || {};
-            if (typeof action.payload.infinite === "boolean" && action.payload.infinite) {
+            if (action.payload.append) {
+                // rows appended to the data that was received for this page key
+                const previous =
+                    typeof oldValue === "object" &&
+                    (oldValue[action.payload.pagekey as string] as Record<string, unknown> | undefined);
+                if (!previous || previous.notModified) {
+                    return state;
+                }
+                if (typeof action.payload.alldata === "boolean" && action.payload.alldata) {
+                    newValue = appendColumns(previous, newValue) as Record<string, unknown>;
+                } else {
+                    newValue = {
+                        ...previous,
+                        // the fingerprint of the page does not match its content anymore
+                        etag: undefined,
+                        rowcount: newValue.rowcount === undefined ? previous.rowcount : newValue.rowcount,
+                        data:
+                            Array.isArray(previous.data) && Array.isArray(newValue.data)
+                                ? previous.data.concat(newValue.data)
+                                : previous.data,
+                    };
+                }
+            } else if (typeof action.payload.infinite === "boolean" && action.payload.infinite) {
                 const start = newValue.start;
                 if (typeof start === "number") {
                     const rows = ((oldValue[action.payload.pagekey as string] &&
@@ -574,7 +614,9 @@ export const createRequestChartUpdateAction = (
     context: string | undefined,
     columns: string[],
     pageKey: string,
-    decimatorPayload: unknown | undefined
+    decimatorPayload: unknown | undefined,
+    compression?: boolean,
+    dataFormat?: string
 ): TaipyAction =>
     createRequestDataUpdateAction(
         name,
@@ -584,6 +626,8 @@ export const createRequestChartUpdateAction = (
         pageKey,
         {
             decimatorPayload: decimatorPayload,
+            compression: compression,
+            dataformat: dataFormat,
         },
         true
     );
@@ -603,7 +647,11 @@ export const createRequestTableUpdateAction = (
     styles?: Record<string, string>,
     tooltips?: Record<string, string>,
     handleNan?: boolean,
-    filters?: Array<FilterDesc>
+    filters?: Array<FilterDesc>,
+    search?: string,
+    etag?: string,
+    compression?: boolean,
+    dataFormat?: string
 ): TaipyAction =>
     createRequestDataUpdateAction(name, id, context, columns, pageKey, {
         start: start,
@@ -616,6 +664,10 @@ export const createRequestTableUpdateAction = (
         tooltips: tooltips,
         handlenan: handleNan,
         filters: filters,
+        search: search || undefined,
+        etag: etag,
+        compression: compression,
+        dataformat: dataFormat,
     });
 
 export const createRequestInfiniteTableUpdateAction = (
@@ -633,7 +685,10 @@ export const createRequestInfiniteTableUpdateAction = (
     styles?: Record<string, string>,
     tooltips?: Record<string, string>,
     handleNan?: boolean,
-    filters?: Array<FilterDesc>
+    filters?: Array<FilterDesc>,
+    search?: string,
+    compression?: boolean,
+    dataFormat?: string
 ): TaipyAction =>
     createRequestDataUpdateAction(name, id, context, columns, pageKey, {
         infinite: true,
@@ -647,6 +702,9 @@ export const createRequestInfiniteTableUpdateAction = (
         tooltips: tooltips,
         handlenan: handleNan,
         filters: filters,
+        search: search || undefined,
+        compression: compression,
+        dataformat: dataFormat,
     });
 
 /**
@@ -22,6 +22,7 @@ const ipcTable = tableToIPC(tableFromArrays({i32 : new Int32Array([1, 2, 3]), st
 
 const arrowRecordsData = { format: DataFormat.APACHE_ARROW, orient: "records", data: ipcTable };
 const arrowListData = { format: DataFormat.APACHE_ARROW, orient: "list", data: ipcTable };
+const jsonBytesData = { format: DataFormat.JSON, data: new TextEncoder().encode('[{"i32":1,"str":null}]') };
 
 describe("does nothing", () => {
     it("returns straight", async () => {
@@ -36,4 +37,7 @@ describe("does nothing", () => {
     it("returns list from arrow", async () => {
         expect(await parseData(arrowListData)).toStrictEqual({ data: {i32: [1, 2, 3], str: ["One", "Two", "Three"]}, format: "ARROW", orient: "list" });
     });
+    it("returns records from encoded json", async () => {
+        expect(await parseData(jsonBytesData)).toStrictEqual({ data: [{i32: 1, str: null}], format: "JSON" });
+    });
 });
@@ -29,15 +29,30 @@ const coerceBigInt = (val: unknown) => {
     return val;
 }
 
+// Arrow streams that the server compressed as a whole
+const decompress = (data: unknown, compression: unknown): Promise<ArrayBuffer> =>
+    compression === "gzip"
+        ? new Response(
+              new Blob([data as ArrayBuffer]).stream().pipeThrough(new DecompressionStream("gzip"))
+          ).arrayBuffer()
+        : Promise.resolve(data as ArrayBuffer);
+
+// JSON data that the server encoded itself is received as a binary attachment
+const decodeJson = (data: unknown) =>
+    data instanceof ArrayBuffer || ArrayBuffer.isView(data) ? JSON.parse(new TextDecoder().decode(data)) : data;
+
 export const parseData = (data: Record<string, unknown>): Promise<Record<string, unknown>> => {
     if (data?.format === DataFormat.APACHE_ARROW) {
         const multi = typeof data.multi === "boolean" && data.multi;
         const orient = data.orient;
         const pData = multi ? (data.data as Array<unknown>) : [data.data];
         return new Promise((resolve, reject) => {
-            import("apache-arrow").then(({tableFromIPC}) => {
-                const res = pData.map((d) => {
-                    const arrowData = tableFromIPC(new Uint8Array(d as ArrayBuffer));
+            Promise.all([
+                import("apache-arrow"),
+                Promise.all(pData.map((d) => decompress(d, data.compression))),
+            ]).then(([{tableFromIPC}, buffers]) => {
+                const res = buffers.map((d) => {
+                    const arrowData = tableFromIPC(new Uint8Array(d));
                     const tableHeading = arrowData.schema.fields.map((f) => f.name);
                     if (orient === "records") {
                         const convertedData: Array<unknown> = [];
@@ -66,7 +81,13 @@ export const parseData = (data: Record<string, unknown>): Promise<Record<string,
                 resolve(data);
             }).catch(reject);
         });
-    } else if (typeof data?.dataExtraction === "boolean" && data.dataExtraction) {
+    }
+    if (data?.format === DataFormat.JSON) {
+        data.data = typeof data.multi === "boolean" && data.multi && Array.isArray(data.data)
+            ? data.data.map(decodeJson)
+            : decodeJson(data.data);
+    }
+    if (typeof data?.dataExtraction === "boolean" && data.dataExtraction) {
         data = data.data as Record<string, unknown>;
     }
     return new Promise((resolve) => {
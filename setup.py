@@ -56,6 +56,8 @@ extras_require = {
         "python-magic-bin>=0.4.14,<0.5;platform_system=='Windows'",
     ],
     "arrow": ["pyarrow>=10.0.1,<11.0"],
+    "orjson": ["orjson>=3.8.3,<4.0"],
+    "polars": ["polars>=1.0"],
 }
 
 
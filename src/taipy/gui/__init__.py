@@ -55,8 +55,15 @@ application.
     - [`pyarrow`](https://pypi.org/project/pyarrow/): can improve the performance of your
       application by reducing the volume of data transferred between the web server and the
       clients. This is relevant if your application uses large tabular data.<br/>
+      It is also needed to display data sets that do not fit in memory (see
+      `taipy.gui.data.ArrowDataset`) or memory-mapped Arrow files (see
+      `taipy.gui.data.ArrowFile`).<br/>
       You can install that package with the regular `pip install pyarrow` command,
       or install Taipy GUI using: `pip install taipy-gui[arrow]`.
+    - [`polars`](https://pypi.org/project/polars/): lets tables and charts be bound to
+      Polars DataFrame and LazyFrame objects without any conversion to pandas.<br/>
+      You can install that package with the regular `pip install polars` command,
+      or install Taipy GUI using: `pip install taipy-gui[polars]`.
     - [`simple-websocket`](https://pypi.org/project/simple-websocket/): enables the
       debugging of the WebSocket part of the server execution.<br/>
       You can install that package with the regular `pip install simple-websocket` command,
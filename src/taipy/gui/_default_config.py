@@ -42,12 +42,17 @@ _default_stylekit: Stylekit = {
 # Default config loaded by app.py
 default_config: Config = {
     "allow_unsafe_werkzeug": False,
+    "arrow_min_cells": None,
     "async_mode": "gevent",
     "change_delay": None,
     "chart_dark_template": None,
     "base_url": "/",
     "dark_mode": True,
     "dark_theme": None,
+    "data_cache_max_size": 256 * 1024 * 1024,
+    "data_compression": False,
+    "data_compression_threshold": 256 * 1024,
+    "data_read_ahead_pages": 0,
     "debug": False,
     "extended_status": False,
     "favicon": None,
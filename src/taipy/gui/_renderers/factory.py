@@ -96,6 +96,8 @@ class _Factory:
                 ("layout", PropertyType.dynamic_dict),
                 ("plot_config", PropertyType.dict),
                 ("on_range_change", PropertyType.function),
+                ("compression", PropertyType.boolean),
+                ("data_format",),
                 ("active", PropertyType.dynamic_boolean, True),
                 ("render", PropertyType.dynamic_boolean, True),
                 ("hover_text", PropertyType.dynamic_string),
@@ -476,6 +478,9 @@ class _Factory:
                 ("on_action", PropertyType.function),
                 ("nan_value",),
                 ("filter", PropertyType.boolean),
+                ("search", PropertyType.boolean),
+                ("compression", PropertyType.boolean),
+                ("data_format",),
                 ("hover_text", PropertyType.dynamic_string),
                 ("size",),
             ]
@@ -10,8 +10,11 @@
 # specific language governing permissions and limitations under the License.
 from __future__ import annotations
 
+import re
+import typing as t
 from datetime import date, datetime, time
-from json import JSONEncoder
+from importlib import util
+from json import JSONEncoder, dumps
 from pathlib import Path
 
 from flask.json.provider import DefaultJSONProvider
@@ -20,6 +23,14 @@ from .._warnings import _warn
 from ..icon import Icon
 from ..utils import _date_to_string, _MapDict, _TaipyBase
 
+_has_orjson_module = util.find_spec("orjson") is not None
+
+if _has_orjson_module:
+    import orjson
+
+    # Taipy types and dates are encoded by _default, as they are by the standard encoder
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
 
 def _default(o):
     if isinstance(o, Icon):
@@ -44,6 +55,45 @@ class _TaipyJsonEncoder(JSONEncoder):
         return _default(o)
 
 
+class _TaipyJsonFragment(object):
+    """A value that is already encoded, written as it is in the encoded messages."""
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: t.Union[bytes, str]) -> None:
+        self.encoded = encoded.decode("utf-8") if isinstance(encoded, bytes) else encoded
+
+
 class _TaipyJsonProvider(DefaultJSONProvider):
     default = staticmethod(_default)  # type: ignore
     sort_keys = False
+
+    # fragments are encoded as a marker string, then replaced by their content
+    __FRAGMENT_MARKER = "\0tp_fragment:"
+    __FRAGMENT_RE = re.compile(f'"{re.escape(dumps(__FRAGMENT_MARKER)[1:-1])}(\\d+)"')
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        fragments: t.List[str] = []
+        default = kwargs.pop("default", self.default)
+
+        def fragment_default(o):
+            if isinstance(o, _TaipyJsonFragment):
+                fragments.append(o.encoded)
+                return f"{_TaipyJsonProvider.__FRAGMENT_MARKER}{len(fragments) - 1}"
+            return default(o)
+
+        encoded = super().dumps(obj, default=fragment_default, **kwargs)
+        if not fragments:
+            return encoded
+        return _TaipyJsonProvider.__FRAGMENT_RE.sub(lambda m: fragments[int(m.group(1))], encoded)
+
+
+def _dumps(o: t.Any) -> bytes:
+    # orjson, if installed, is much faster and encodes NaN and infinite values as null
+    if _has_orjson_module:
+        try:
+            return orjson.dumps(o, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # integers out of the 64 bits range, unsupported NumPy types...
+            pass
+    return dumps(o, cls=_TaipyJsonEncoder, separators=(",", ":")).encode()
@@ -29,12 +29,17 @@ from .utils import _is_in_notebook
 
 ConfigParameter = t.Literal[
     "allow_unsafe_werkzeug",
+    "arrow_min_cells",
     "async_mode",
     "change_delay",
     "chart_dark_template",
     "base_url",
     "dark_mode",
     "dark_theme",
+    "data_cache_max_size",
+    "data_compression",
+    "data_compression_threshold",
+    "data_read_ahead_pages",
     "data_url_max_size",
     "debug",
     "extended_status",
@@ -100,12 +105,17 @@ Config = t.TypedDict(
     "Config",
     {
         "allow_unsafe_werkzeug": bool,
+        "arrow_min_cells": t.Optional[int],
         "async_mode": str,
         "change_delay": t.Optional[int],
         "chart_dark_template": t.Optional[t.Dict[str, t.Any]],
         "base_url": t.Optional[str],
         "dark_mode": bool,
         "dark_theme": t.Optional[t.Dict[str, t.Any]],
+        "data_cache_max_size": int,
+        "data_compression": bool,
+        "data_compression_threshold": int,
+        "data_read_ahead_pages": int,
         "data_url_max_size": t.Optional[int],
         "debug": bool,
         "extended_status": bool,
@@ -9,6 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from .arrow_dataset import ArrowDataset, ArrowFile
 from .data_accessor import _DataAccessor
 from .decimator import LTTB, RDP, MinMaxDecimator, ScatterDecimator
+from .ring_buffer import RingBuffer
+from .sql_query import SqlQuery
 from .utils import Decimator
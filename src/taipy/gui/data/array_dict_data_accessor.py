@@ -11,10 +11,13 @@
 
 import typing as t
 
+import numpy as np
 import pandas as pd
 
 from ..gui import Gui
 from ..utils import _MapDict
+from .data_accessor import _AppendedRows
+from .data_cache import _DataCache
 from .data_format import _DataFormat
 from .pandas_data_accessor import _PandasDataAccessor
 
@@ -26,7 +29,18 @@ class _ArrayDictDataAccessor(_PandasDataAccessor):
     def get_supported_classes() -> t.List[str]:
         return [t.__name__ for t in _ArrayDictDataAccessor.__types]  # type: ignore
 
-    def __get_dataframe(self, value: t.Any) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
+    def __get_dataframe(
+        self, var_name: str, value: t.Any, cache: t.Optional[_DataCache]
+    ) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
+        # the conversion is done once per value, until the variable is updated
+        df = None if cache is None else cache.get(var_name, value, ("dataframe",))
+        if df is None:
+            df = self.__convert(value)
+            if cache is not None:
+                cache.set(var_name, value, ("dataframe",), df)
+        return df
+
+    def __convert(self, value: t.Any) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
         if isinstance(value, list):
             if not value or isinstance(value[0], (str, int, float, bool)):
                 return pd.DataFrame({"0": value})
@@ -53,14 +67,51 @@ class _ArrayDictDataAccessor(_PandasDataAccessor):
             return pd.DataFrame(value._dict)
         return pd.DataFrame(value)
 
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[_AppendedRows]:
+        if isinstance(value, list):
+            # only lists of values hold a single table
+            if value and not isinstance(value[0], (str, int, float, bool)):
+                return None
+            rows = list(rows)
+            return _AppendedRows([*value, *rows], rows, len(value), len(value) + len(rows))
+        if isinstance(value, _MapDict):
+            value = value._dict
+        if (
+            not isinstance(value, dict)
+            or not value
+            or not all(isinstance(v, (list, tuple, np.ndarray)) for v in value.values())
+        ):
+            return None
+        if isinstance(rows, list):
+            # rows given as records
+            rows = {k: [r.get(k) for r in rows] for k in value.keys()}
+        rows = {k: list(rows.get(k, [])) for k in value.keys()}
+        start = len(next(iter(value.values())))
+        nb_rows = len(next(iter(rows.values())))
+        if any(len(v) != nb_rows for v in rows.values()):
+            return None
+        value = {
+            k: np.concatenate([v, rows[k]]) if isinstance(v, np.ndarray) else [*v, *rows[k]] for k, v in value.items()
+        }
+        return _AppendedRows(value, rows, start, start + nb_rows)
+
+    def get_row_count(self, var_name: str, value: t.Any) -> t.Optional[int]:
+        if not isinstance(value, _ArrayDictDataAccessor.__types):  # type: ignore
+            return None
+        df = self.__get_dataframe(var_name, value, self._cache)
+        return sum(len(d) for d in df) if isinstance(df, list) else len(df)
+
     def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
         if isinstance(value, _ArrayDictDataAccessor.__types):  # type: ignore
-            return super().get_col_types(var_name, self.__get_dataframe(value))
+            return super().get_col_types(var_name, self.__get_dataframe(var_name, value, self._cache))
         return None
 
     def get_data(  # noqa: C901
         self, guiApp: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
     ) -> t.Dict[str, t.Any]:
         if isinstance(value, _ArrayDictDataAccessor.__types):  # type: ignore
-            return super().get_data(guiApp, var_name, self.__get_dataframe(value), payload, data_format)
+            cache = guiApp._accessors._get_cache()
+            return super().get_data(
+                guiApp, var_name, self.__get_dataframe(var_name, value, cache), payload, data_format
+            )
         return {}
@@ -0,0 +1,120 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    import pyarrow
+    import pyarrow.dataset
+
+
+class ArrowDataset:
+    """Tabular data read from files when it is displayed.
+
+    An `ArrowDataset` can be bound to the *data* property of tables and charts to display
+    data sets that do not fit in memory, such as a directory of Parquet files.<br/>
+    Only the rows that are displayed are read from the files: filters and column selections
+    are pushed down to the [pyarrow](https://arrow.apache.org/docs/python/dataset.html) scanner.
+
+    This class requires the `pyarrow` package to be installed.
+
+    Attributes:
+        source (Any): The path(s) to the files holding the data, as accepted by
+            `pyarrow.dataset.dataset()`.
+        format (str): The format of the files.
+    """
+
+    def __init__(self, source: t.Any, format: str = "parquet", **kwargs) -> None:
+        """Initialize a new ArrowDataset.
+
+        Arguments:
+            source (Any): The path to a file or a directory, a list of paths, or any source
+                that `pyarrow.dataset.dataset()` accepts.
+            format (str): The format of the files ("parquet", "ipc", "feather", "csv"...).<br/>
+                The default value is "parquet".
+            **kwargs: Additional arguments passed to `pyarrow.dataset.dataset()` (*partitioning*,
+                *filesystem*...).
+        """
+        self.source = source
+        self.format = format
+        self.__kwargs = kwargs
+        self.__dataset: t.Optional["pyarrow.dataset.Dataset"] = None
+
+    def get_dataset(self) -> "pyarrow.dataset.Dataset":
+        """Return the underlying dataset.
+
+        The files are only opened the first time this method is called.
+
+        Returns:
+            The `pyarrow.dataset.Dataset` that this object represents.
+        """
+        if self.__dataset is None:
+            import pyarrow.dataset as ds
+
+            self.__dataset = ds.dataset(self.source, format=self.format, **self.__kwargs)
+        return self.__dataset
+
+
+class ArrowFile(ArrowDataset):
+    """Tabular data held in a memory-mapped Arrow IPC (Feather V2) file.
+
+    An `ArrowFile` can be bound to the *data* property of tables and charts. The file is
+    memory-mapped: its record batches are never copied in the process memory, and the pages
+    displayed by tables are slices of these batches, that are sent to the browser as is
+    when the Arrow data format is used.<br/>
+    The operating system pages the data in and out of memory as needed, and shares it
+    between the processes that open the same file.
+
+    Compressed files cannot be memory-mapped without being decompressed: use uncompressed
+    files (`compression="uncompressed"` when writing Feather files) to benefit from this class.
+
+    This class requires the `pyarrow` package to be installed.
+
+    Attributes:
+        source (Any): The path to the file.
+    """
+
+    def __init__(self, source: t.Any) -> None:
+        """Initialize a new ArrowFile.
+
+        Arguments:
+            source (Any): The path to an Arrow IPC or Feather V2 file.
+        """
+        super().__init__(source, format="ipc")
+        self.__table: t.Optional["pyarrow.Table"] = None
+        self.__dataset: t.Optional["pyarrow.dataset.Dataset"] = None
+
+    def get_table(self) -> "pyarrow.Table":
+        """Return the table that is mapped to the file.
+
+        The file is only mapped the first time this method is called.
+
+        Returns:
+            The `pyarrow.Table` which buffers point to the mapped file.
+        """
+        if self.__table is None:
+            import pyarrow as pa
+
+            with pa.ipc.open_file(pa.memory_map(str(self.source), "r")) as reader:
+                self.__table = reader.read_all()
+        return self.__table
+
+    def get_dataset(self) -> "pyarrow.dataset.Dataset":
+        """Return the mapped table as a dataset.
+
+        Returns:
+            An in-memory `pyarrow.dataset.Dataset` that wraps the mapped table.
+        """
+        if self.__dataset is None:
+            import pyarrow.dataset as ds
+
+            self.__dataset = ds.dataset(self.get_table())
+        return self.__dataset
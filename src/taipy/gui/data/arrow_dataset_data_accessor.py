@@ -0,0 +1,583 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from datetime import datetime
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from .._warnings import _warn
+from ..gui import Gui
+from ..types import PropertyType
+from ..utils import _get_date_col_str_name
+from .arrow_dataset import ArrowDataset, ArrowFile
+from .data_accessor import _DataAccessor
+from .data_format import _DataFormat
+from .utils import _get_arrow_stream
+
+# ordered aggregations (first, last) and single-threaded group_by need pyarrow 13
+_has_ordered_group_by = int(pa.__version__.split(".")[0]) >= 13
+
+
+class _ArrowDatasetDataAccessor(_DataAccessor):
+    """Data accessor for pyarrow datasets.
+
+    Projections and filters are pushed down to the dataset scanner, and rows are read
+    fragment by fragment (row group by row group for Parquet files) so that only the
+    requested page is materialized.
+    Sorting reads the sort columns of the filtered rows only.
+    The index column holds the positions of the rows in the dataset, or in the aggregated rows.
+    """
+
+    __types = (ds.FileSystemDataset, ds.InMemoryDataset, ds.UnionDataset, ArrowDataset, ArrowFile)
+
+    __INDEX_COL = "_tp_index"
+    __MASK_COL = "_tp_mask"
+
+    __AGGREGATE_FUNCTIONS: t.Dict[str, str] = {
+        "count": "count",
+        "sum": "sum",
+        "mean": "mean",
+        "median": "approximate_median",
+        "min": "min",
+        "max": "max",
+        "std": "stddev",
+        "first": "first",
+        "last": "last",
+    }
+
+    __FILTER_OPERATORS: t.Dict[str, str] = {
+        "==": "__eq__",
+        "!=": "__ne__",
+        "<": "__lt__",
+        "<=": "__le__",
+        ">": "__gt__",
+        ">=": "__ge__",
+    }
+
+    @staticmethod
+    def get_supported_classes() -> t.List[str]:
+        return [
+            t.__name__ if issubclass(t, ArrowDataset) else f"{t.__module__}.{t.__qualname__}"
+            for t in _ArrowDatasetDataAccessor.__types  # type: ignore
+        ]
+
+    @staticmethod
+    def __get_dataset(value: t.Any) -> ds.Dataset:
+        return value.get_dataset() if isinstance(value, ArrowDataset) else value
+
+    @staticmethod
+    def __get_type_name(pa_type: pa.DataType) -> str:
+        # names follow the pandas dtypes expected by the front-end
+        if pa.types.is_timestamp(pa_type):
+            return f"datetime64[{pa_type.unit}, {pa_type.tz}]" if pa_type.tz else f"datetime64[{pa_type.unit}]"
+        if pa.types.is_date(pa_type):
+            return "datetime64[ms]"
+        if pa.types.is_boolean(pa_type):
+            return "bool"
+        if pa.types.is_integer(pa_type) or pa.types.is_floating(pa_type):
+            return np.dtype(pa_type.to_pandas_dtype()).name
+        return "object"
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if isinstance(value, _ArrowDatasetDataAccessor.__types):  # type: ignore
+            schema = _ArrowDatasetDataAccessor.__get_dataset(value).schema
+            return {f.name: _ArrowDatasetDataAccessor.__get_type_name(f.type) for f in schema}
+        return None
+
+    @staticmethod
+    def __get_filter_expr(schema: pa.Schema, fd: t.Dict[str, t.Any]) -> ds.Expression:
+        col = fd.get("col")
+        val = fd.get("value")
+        action = fd.get("action")
+        pa_type = schema.field(col).type
+        if isinstance(val, str) and (pa.types.is_timestamp(pa_type) or pa.types.is_date(pa_type)):
+            val = datetime.fromisoformat(val[:-1])
+        if action == "contains":
+            return pc.match_substring_regex(pc.field(col).cast(pa.string()), str(val))
+        op = _ArrowDatasetDataAccessor.__FILTER_OPERATORS.get(action)  # type: ignore
+        if op is None:
+            raise ValueError(f"Unknown filter action '{action}'")
+        return getattr(pc.field(col), op)(pc.scalar(val))
+
+    def __get_pieces(
+        self, gui: Gui, var_name: str, value: t.Any, dataset: ds.Dataset, filter: t.Any, view_key: t.Tuple
+    ) -> t.List[t.Tuple[ds.Fragment, int, int]]:
+        # fragments (or Parquet row groups), the position of their first row and their number of filtered rows
+        pieces: t.List[ds.Fragment] = []
+        for fragment in dataset.get_fragments():
+            if isinstance(fragment, ds.ParquetFileFragment):
+                pieces.extend(fragment.split_by_row_group(schema=dataset.schema))
+            else:
+                pieces.append(fragment)
+        cache = gui._accessors._get_cache()
+        rowcounts = cache.get(var_name, value, ("piece_rowcounts", view_key))
+        if rowcounts is None or rowcounts.shape[1] != len(pieces):
+            # numbers of rows are read from the metadata, filtered pieces are only counted once
+            nb_rows = np.array(
+                [
+                    (
+                        piece.row_groups[0].num_rows
+                        if isinstance(piece, ds.ParquetFileFragment)
+                        else ds.Scanner.from_fragment(piece, schema=dataset.schema).count_rows()
+                    )
+                    for piece in pieces
+                ],
+                dtype=np.int64,
+            )
+            nb_filtered_rows = (
+                nb_rows
+                if filter is None
+                else np.array(
+                    [
+                        ds.Scanner.from_fragment(piece, schema=dataset.schema, filter=filter).count_rows()
+                        for piece in pieces
+                    ],
+                    dtype=np.int64,
+                )
+            )
+            rowcounts = np.stack([np.cumsum(nb_rows) - nb_rows, nb_filtered_rows])
+            rowcounts.flags.writeable = False
+            cache.set(var_name, value, ("piece_rowcounts", view_key), rowcounts)
+        return list(zip(pieces, *rowcounts.tolist()))
+
+    @staticmethod
+    def __read_rows(
+        dataset: ds.Dataset,
+        columns: t.List[str],
+        filter: t.Optional[ds.Expression],
+        pieces: t.List[t.Tuple[ds.Fragment, int, int]],
+        positions: np.ndarray,
+    ) -> t.Tuple[pa.Table, np.ndarray]:
+        # positions are relative to the filtered rows, only the pieces that hold them are scanned
+        # the rows are returned with their positions in the dataset
+        order = np.argsort(positions, kind="stable")
+        sorted_positions = positions[order]
+        batches: t.List[pa.RecordBatch] = []
+        row_numbers: t.List[np.ndarray] = [np.empty(0, dtype=np.int64)]
+        schema = pa.schema([dataset.schema.field(c) for c in columns])
+        projection = {c: pc.field(c) for c in columns}
+        if filter is not None:
+            # the filtered rows are located in the piece
+            projection[_ArrowDatasetDataAccessor.__MASK_COL] = filter
+        offset = 0
+        if len(sorted_positions):
+            for piece, first_row, nb_rows in pieces:
+                first, last = np.searchsorted(sorted_positions, [offset, offset + nb_rows])
+                if first < last:
+                    indexes = sorted_positions[first:last] - offset
+                    scanner = ds.Scanner.from_fragment(piece, schema=dataset.schema, columns=projection)
+                    batch_offset = 0
+                    batch_row = first_row
+                    for batch in scanner.to_batches():
+                        if filter is None:
+                            nb_batch_rows = batch.num_rows
+                        else:
+                            mask = batch.column(_ArrowDatasetDataAccessor.__MASK_COL)
+                            rows = np.flatnonzero(pc.fill_null(mask, False).to_numpy(zero_copy_only=False))
+                            nb_batch_rows = len(rows)
+                        b_first, b_last = np.searchsorted(indexes, [batch_offset, batch_offset + nb_batch_rows])
+                        if b_first < b_last:
+                            batch_indexes = indexes[b_first:b_last] - batch_offset
+                            if filter is not None:
+                                batch_indexes = rows[batch_indexes]
+                            rows_batch = batch.take(pa.array(batch_indexes))
+                            if filter is not None:
+                                rows_batch = pa.RecordBatch.from_arrays(
+                                    rows_batch.columns[: len(columns)], schema=schema
+                                )
+                            batches.append(rows_batch)
+                            row_numbers.append(batch_row + batch_indexes)
+                        batch_offset += nb_batch_rows
+                        batch_row += batch.num_rows
+                        if b_last == len(indexes):
+                            break
+                offset += nb_rows
+                if offset > sorted_positions[-1]:
+                    break
+        table = pa.Table.from_batches(batches, schema=schema)
+        # back to the requested order
+        reorder = np.argsort(order, kind="stable")
+        return table.take(pa.array(reorder)), np.concatenate(row_numbers)[reorder]
+
+    def __get_rowcount(
+        self, gui: Gui, var_name: str, value: t.Any, dataset: ds.Dataset, filter: t.Any, view_key: t.Tuple
+    ) -> int:
+        cache = gui._accessors._get_cache()
+        rowcount = cache.get(var_name, value, ("rowcount", view_key))
+        if rowcount is None:
+            # Parquet metadata holds the number of rows of each file
+            rowcount = cache.set(var_name, value, ("rowcount", view_key), dataset.count_rows(filter=filter))
+        return rowcount
+
+    def __get_sorted_indexes(
+        self,
+        gui: Gui,
+        var_name: str,
+        value: t.Any,
+        dataset: ds.Dataset,
+        filter: t.Any,
+        view_key: t.Tuple,
+        order_by: t.List[str],
+        descendings: t.List[bool],
+        nan_position: t.Optional[str],
+    ) -> np.ndarray:
+        cache = gui._accessors._get_cache()
+        sort_key = ("sort", view_key, tuple(order_by), tuple(descendings), nan_position)
+        indexes = cache.get(var_name, value, sort_key)
+        if indexes is None:
+            # only the sort columns are read
+            table = dataset.to_table(columns=list(dict.fromkeys(order_by)), filter=filter)
+            # NaN and null values come last when ascending and first when descending unless specified
+            nan_first = descendings[0] if nan_position is None else nan_position == "first"
+            indexes = pc.sort_indices(
+                table,
+                sort_keys=[(c, "descending" if d else "ascending") for c, d in zip(order_by, descendings)],
+                null_placement="at_start" if nan_first else "at_end",
+            ).to_numpy()
+            indexes.flags.writeable = False
+            cache.set(var_name, value, sort_key, indexes)
+        return indexes
+
+    def __aggregate(
+        self,
+        dataset: ds.Dataset,
+        filter: t.Any,
+        aggregates: t.List[str],
+        applies: t.Dict[str, str],
+    ) -> pa.Table:
+        aggs = []
+        for col, apply in applies.items():
+            if col in aggregates:
+                continue
+            function = _ArrowDatasetDataAccessor.__AGGREGATE_FUNCTIONS.get(apply)
+            if function is None:
+                raise ValueError(f"Unsupported aggregate function '{apply}'")
+            aggs.append((col, function))
+        table = dataset.to_table(columns=list(dict.fromkeys([*aggregates, *applies.keys()])), filter=filter)
+        if not _has_ordered_group_by:
+            # pandas aggregates the rows that were read (the aggregates hold the pandas function names)
+            df = table.to_pandas().groupby(aggregates, sort=True).agg({c: applies[c] for c, _ in aggs})
+            table = pa.Table.from_pandas(df.reset_index(), preserve_index=False)
+            return table.select([c for c in applies.keys() if c in table.column_names])
+        # rows with a null key are dropped, as pandas does
+        for col in aggregates:
+            table = table.filter(pc.is_valid(table[col]))
+        # first and last need an ordered aggregation
+        table = table.group_by(aggregates, use_threads=False).aggregate(aggs)
+        names = {f"{c}_{f}": c for c, f in aggs}
+        table = table.rename_columns([names.get(c, c) for c in table.column_names])
+        table = table.sort_by([(c, "ascending") for c in aggregates])
+        return table.select([c for c in applies.keys() if c in table.column_names])
+
+    @staticmethod
+    def __apply_user_function(
+        gui: Gui,
+        user_function: t.Callable,
+        column_name: t.Optional[str],
+        function_name: str,
+        rows: t.List[t.Dict[str, t.Any]],
+    ) -> t.List[str]:
+        values = []
+        for row in rows:
+            args = [row[column_name]] if column_name else []
+            args.extend((row.get(_ArrowDatasetDataAccessor.__INDEX_COL), row))
+            if column_name:
+                args.append(column_name)
+            try:
+                ret = gui._call_function_with_state(user_function, args)
+                values.append("" if ret is None else str(ret))
+            except Exception as e:
+                _warn(f"Exception raised when calling user function {function_name}()", e)
+                values.append("")
+        return values
+
+    def __build_transferred_cols(
+        self,
+        gui: Gui,
+        payload_cols: t.Any,
+        table: pa.Table,
+        styles: t.Optional[t.Dict[str, str]] = None,
+        tooltips: t.Optional[t.Dict[str, str]] = None,
+        handle_nan: t.Optional[bool] = False,
+    ) -> pa.Table:
+        if isinstance(payload_cols, list) and len(payload_cols):
+            cols = [c for c in table.column_names if c in payload_cols]
+        else:
+            cols = list(table.column_names)
+        col_types = {c: table.schema.field(c).type for c in cols}
+        if styles or tooltips:
+            rows = table.to_pylist()
+            for user_functions, prefix in ((styles, "tps__"), (tooltips, "tpt__")):
+                for k, v in (user_functions or {}).items():
+                    func = gui._get_user_function(v)
+                    if callable(func):
+                        new_col_name = f"{prefix}{k}__{v}" if k in cols else v
+                        values = _ArrowDatasetDataAccessor.__apply_user_function(
+                            gui, func, k if k in cols else None, v, rows
+                        )
+                        table = table.append_column(new_col_name, pa.array(values, type=pa.string()))
+                    elif prefix == "tps__":
+                        new_col_name = v
+                        table = table.append_column(v, pa.array([v] * table.num_rows, type=pa.string()))
+                    else:
+                        continue
+                    cols.append(new_col_name)
+        # deal with dates
+        datecols = [c for c, ct in col_types.items() if pa.types.is_timestamp(ct) or pa.types.is_date(ct)]
+        if len(datecols) != 0:
+            tz = Gui._get_timezone()
+            for col in datecols:
+                newcol = _get_date_col_str_name(cols, col)
+                cols.append(newcol)
+                values = table[col]
+                if pa.types.is_date(col_types[col]):
+                    values = values.cast(pa.timestamp("ms"))
+                if not values.type.tz:
+                    values = pc.assume_timezone(values, tz, ambiguous="earliest", nonexistent="earliest")
+                # %S includes the fraction of seconds in the unit of the column
+                values = pc.strftime(values.cast(pa.timestamp("us", "UTC")), format="%Y-%m-%dT%H:%M:%SZ")
+                table = table.append_column(newcol, pc.fill_null(values, "NaT") if handle_nan else values)
+            # remove the date columns from the list of columns
+            cols = [c for c in cols if c not in datecols]
+        return table.select([c for c in table.column_names if c in cols])
+
+    def __format_data(
+        self,
+        table: pa.Table,
+        data_format: _DataFormat,
+        orient: str,
+        start: t.Optional[int] = None,
+        rowcount: t.Optional[int] = None,
+        data_extraction: t.Optional[bool] = None,
+    ) -> t.Dict[str, t.Any]:
+        ret: t.Dict[str, t.Any] = {
+            "format": str(data_format.value),
+        }
+        if rowcount is not None:
+            ret["rowcount"] = rowcount
+        if start is not None:
+            ret["start"] = start
+        if data_extraction is not None:
+            ret["dataExtraction"] = data_extraction  # Extract data out of dictionary on front-end
+        if data_format == _DataFormat.APACHE_ARROW:
+            ret["data"] = _get_arrow_stream(table)
+            ret["orient"] = orient
+        else:
+            # NaN can't be represented in JSON
+            for i, field in enumerate(table.schema):
+                if pa.types.is_floating(field.type):
+                    column = table.column(i)
+                    table = table.set_column(i, field, pc.if_else(pc.is_nan(column), None, column))
+            ret["data"] = table.to_pylist() if orient == "records" else table.to_pydict()
+        return ret
+
+    @staticmethod
+    def __get_int_value(value: t.Any, default: int) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value), base=10)
+        except Exception:
+            return default
+
+    def __get_data(  # noqa: C901
+        self,
+        gui: Gui,
+        var_name: str,
+        value: t.Any,
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+    ) -> t.Dict[str, t.Any]:
+        dataset = _ArrowDatasetDataAccessor.__get_dataset(value)
+        # memory-mapped tables are sliced without reading them
+        table = value.get_table() if isinstance(value, ArrowFile) else None
+        schema = dataset.schema
+        columns = [c for c in payload.get("columns", []) if c in schema.names]
+        if not columns:
+            columns = list(schema.names)
+        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
+        paged = not payload.get("alldata", False)
+        view_key: t.Tuple[t.Any, ...] = ()
+
+        # filtering
+        filter_expr: t.Optional[ds.Expression] = None
+        filters = payload.get("filters")
+        if isinstance(filters, list) and len(filters) > 0:
+            filters_key = tuple((fd.get("col"), fd.get("action"), repr(fd.get("value"))) for fd in filters)
+            try:
+                for fd in filters:
+                    expr = _ArrowDatasetDataAccessor.__get_filter_expr(schema, fd)
+                    filter_expr = expr if filter_expr is None else filter_expr & expr
+                # type errors are only raised when the data is scanned
+                pa.Table.from_batches([], schema=schema).filter(filter_expr)
+                view_key += ("filters", filters_key)
+            except Exception as e:
+                _warn(f"Dataframe filtering: invalid filters {filters} on {var_name}", e)
+                filter_expr = None
+
+        if paged:
+            aggregates = payload.get("aggregates")
+            applies = payload.get("applies")
+            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
+                applies = dict(applies)
+                for col in columns:
+                    if col not in applies.keys():
+                        applies[col] = "first"
+                aggregates_key = ("aggregates", tuple(aggregates), tuple(applies.items()))
+                cache = gui._accessors._get_cache()
+                aggregated = cache.get(var_name, value, view_key + aggregates_key)
+                if aggregated is None:
+                    try:
+                        aggregated = self.__aggregate(dataset, filter_expr, aggregates, applies)
+                        cache.set(var_name, value, view_key + aggregates_key, aggregated)
+                    except Exception as e:
+                        _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.", e)
+                if aggregated is not None:
+                    table = aggregated
+                    dataset = ds.dataset(aggregated)
+                    filter_expr = None
+                    view_key += aggregates_key
+                    columns = [c for c in columns if c in dataset.schema.names]
+            inf = payload.get("infinite")
+            if inf is not None:
+                ret_payload["infinite"] = inf
+            # real number of rows is needed to calculate the number of pages
+            rowcount = self.__get_rowcount(gui, var_name, value, dataset, filter_expr, view_key)
+            start = _ArrowDatasetDataAccessor.__get_int_value(payload.get("start"), 0)
+            end = _ArrowDatasetDataAccessor.__get_int_value(payload.get("end"), -1)
+            if start < 0 or start >= rowcount:
+                start = 0
+            if end < 0 or end >= rowcount:
+                end = rowcount - 1
+            # deal with sort
+            order_by = payload.get("orderby")
+            if isinstance(order_by, str):
+                order_by = [order_by] if len(order_by) else []
+            elif not isinstance(order_by, list):
+                order_by = []
+            sort = payload.get("sort")
+            sorts = sort if isinstance(sort, list) else [sort] * len(order_by)
+            descendings = [i < len(sorts) and sorts[i] == "desc" for i in range(len(order_by))]
+            indexes: t.Optional[np.ndarray] = None
+            if len(order_by):
+                try:
+                    indexes = self.__get_sorted_indexes(
+                        gui,
+                        var_name,
+                        value,
+                        dataset,
+                        filter_expr,
+                        view_key,
+                        order_by,
+                        descendings,
+                        payload.get("nanposition"),
+                    )[slice(start, end + 1)]
+                except Exception as e:
+                    _warn(f"Cannot sort {var_name} on columns {', '.join(str(c) for c in order_by)}.", e)
+            page_columns = [c for c in columns if c != _ArrowDatasetDataAccessor.__INDEX_COL]
+            if table is not None and filter_expr is None:
+                # record batches are sliced with no copy, a sorted page only copies its rows
+                table = table.select(page_columns)
+                if indexes is None:
+                    table = table.slice(start, end + 1 - start)
+                else:
+                    table = table.take(pa.array(indexes))
+            else:
+                # only the page is read
+                table, indexes = _ArrowDatasetDataAccessor.__read_rows(
+                    dataset,
+                    page_columns,
+                    filter_expr,
+                    self.__get_pieces(gui, var_name, value, dataset, filter_expr, view_key),
+                    np.arange(start, end + 1) if indexes is None else indexes,
+                )
+            if indexes is None:
+                indexes = np.arange(start, start + table.num_rows)
+            if _ArrowDatasetDataAccessor.__INDEX_COL not in table.column_names:
+                table = table.append_column(_ArrowDatasetDataAccessor.__INDEX_COL, pa.array(indexes))
+            table = self.__build_transferred_cols(
+                gui,
+                [*columns, _ArrowDatasetDataAccessor.__INDEX_COL],
+                table,
+                styles=payload.get("styles"),
+                tooltips=payload.get("tooltips"),
+                handle_nan=payload.get("handlenan", False),
+            )
+            dictret = self.__format_data(table, data_format, "records", start, rowcount)
+        else:
+            ret_payload["alldata"] = True
+            decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
+            decimators = decimator_payload.get("decimators", [])
+            nb_rows_max = decimator_payload.get("width")
+            # only the columns used by the chart are read
+            table = dataset.to_table(columns=columns, filter=filter_expr)
+            for decimator_pl in decimators:
+                decimator = decimator_pl.get("decimator")
+                decimator_instance = (
+                    gui._get_user_instance(decimator, PropertyType.decimator.value) if decimator is not None else None
+                )
+                if isinstance(decimator_instance, PropertyType.decimator.value):
+                    x_column, y_column, z_column = (
+                        decimator_pl.get("xAxis", ""),
+                        decimator_pl.get("yAxis", ""),
+                        decimator_pl.get("zAxis", ""),
+                    )
+                    chart_mode = decimator_pl.get("chartMode", "")
+                    if decimator_instance._zoom and "relayoutData" in decimator_payload and not z_column:
+                        relayoutData = decimator_payload.get("relayoutData", {})
+                        x0 = relayoutData.get("xaxis.range[0]")
+                        x1 = relayoutData.get("xaxis.range[1]")
+                        y0 = relayoutData.get("yaxis.range[0]")
+                        y1 = relayoutData.get("yaxis.range[1]")
+                        if (
+                            chart_mode in ["lines+markers", "markers"]
+                            and x0 is not None
+                            and x1 is not None
+                            and y0 is not None
+                            and y1 is not None
+                        ):
+                            x_values = table[x_column] if x_column else pa.array(np.arange(table.num_rows))
+                            mask = pc.and_(pc.greater(x_values, x0), pc.less(x_values, x1))
+                            if chart_mode == "markers":
+                                mask = pc.and_(
+                                    mask, pc.and_(pc.greater(table[y_column], y0), pc.less(table[y_column], y1))
+                                )
+                            table = table.filter(mask)
+
+                    if nb_rows_max and decimator_instance._is_applicable(table, nb_rows_max, chart_mode):
+                        try:
+                            # the decimator only reads the columns of the trace
+                            points = np.column_stack(
+                                [
+                                    table[c].to_numpy() if c else np.arange(table.num_rows)
+                                    for c in ([x_column, y_column, z_column] if z_column else [x_column, y_column])
+                                ]
+                            )
+                            mask = decimator_instance.decimate(points, decimator_payload)
+                            table = table.filter(pa.array(np.asarray(mask, dtype=bool)))
+                            gui._call_on_change(f"{var_name}.{decimator}.nb_rows", table.num_rows)
+                        except Exception as e:
+                            _warn(f"Limit rows error with {decimator} for Dataset", e)
+            table = self.__build_transferred_cols(gui, columns, table)
+            dictret = self.__format_data(table, data_format, "list", data_extraction=True)
+        ret_payload["value"] = dictret
+        return ret_payload
+
+    def get_data(
+        self, gui: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if isinstance(value, _ArrowDatasetDataAccessor.__types):  # type: ignore
+            return self.__get_data(gui, var_name, value, payload, data_format)
+        return {}
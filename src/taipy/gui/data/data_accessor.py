@@ -9,17 +9,32 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import gzip
 import inspect
 import typing as t
 from abc import ABC, abstractmethod
+from importlib import util
 
 from .._warnings import _warn
 from ..utils import _TaipyData
+from .data_cache import _DataCache
 from .data_format import _DataFormat
 
 
+class _AppendedRows(t.NamedTuple):
+    # the bound value with the rows appended
+    value: t.Any
+    # the appended rows, with the type of the bound value
+    rows: t.Any
+    # number of rows before and after the append
+    start: int
+    end: int
+
+
 class _DataAccessor(ABC):
     _WS_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+    # cache of the registry this accessor belongs to (for calls that don't receive the Gui)
+    _cache: t.Optional[_DataCache] = None
 
     @staticmethod
     @abstractmethod
@@ -36,6 +51,17 @@ class _DataAccessor(ABC):
     def get_col_types(self, var_name: str, value: t.Any) -> t.Dict[str, str]:
         pass
 
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[_AppendedRows]:
+        # accessors that can't grow their values let the clients request all the data again
+        return None
+
+    def get_row_count(self, var_name: str, value: t.Any) -> t.Optional[int]:
+        # used to pick the format of the transfers: None if the number of rows is unknown
+        try:
+            return len(value)
+        except TypeError:
+            return None
+
 
 class _InvalidDataAccessor(_DataAccessor):
     @staticmethod
@@ -52,20 +78,53 @@ class _InvalidDataAccessor(_DataAccessor):
 
 
 class _DataAccessors(object):
+    # fast compression: the transfers that are compressed are the large ones
+    __COMPRESSION_LEVEL = 1
+    # number of cells above which the automatic format is Apache Arrow, if not configured
+    __DEFAULT_ARROW_MIN_CELLS = 10_000
+
     def __init__(self) -> None:
         self.__access_4_type: t.Dict[str, _DataAccessor] = {}
+        # accessors resolved for each class that was bound
+        self.__access_4_class: t.Dict[type, _DataAccessor] = {}
 
         self.__invalid_data_accessor = _InvalidDataAccessor()
 
         self.__data_format = _DataFormat.JSON
+        # the format is picked from the size of each transfer if set
+        self.__arrow_min_cells: t.Optional[int] = None
+        self.__has_arrow = util.find_spec("pyarrow") is not None
+        # number of transfers in each format
+        self.__transfers: t.Dict[str, int] = {f.value: 0 for f in _DataFormat}
+        # Arrow data compression, for transfers of at least the threshold size (in bytes)
+        self.__compression = False
+        self.__compression_threshold = 0
+
+        self.__cache = _DataCache()
 
         from .array_dict_data_accessor import _ArrayDictDataAccessor
+        from .interchange_data_accessor import _InterchangeDataAccessor
         from .numpy_data_accessor import _NumpyDataAccessor
         from .pandas_data_accessor import _PandasDataAccessor
+        from .ring_buffer_data_accessor import _RingBufferDataAccessor
+        from .sql_data_accessor import _SqlDataAccessor
 
         self._register(_PandasDataAccessor)
         self._register(_ArrayDictDataAccessor)
         self._register(_NumpyDataAccessor)
+        self._register(_SqlDataAccessor)
+        self._register(_RingBufferDataAccessor)
+        # objects that no registered accessor supports can still expose their data through a protocol
+        self.__interchange_data_accessor = _InterchangeDataAccessor()
+        self.__interchange_data_accessor._cache = self.__cache
+        if util.find_spec("pyarrow"):
+            from .arrow_dataset_data_accessor import _ArrowDatasetDataAccessor
+
+            self._register(_ArrowDatasetDataAccessor)
+        if util.find_spec("polars"):
+            from .polars_data_accessor import _PolarsDataAccessor
+
+            self._register(_PolarsDataAccessor)
 
     def _register(self, cls: t.Type[_DataAccessor]) -> None:
         if not inspect.isclass(cls):
@@ -87,24 +146,116 @@ class _DataAccessors(object):
             except Exception as e:
                 raise TypeError(f"Class {cls.__name__} cannot be instanciated") from e
             if inst:
+                inst._cache = self.__cache
                 for name in names:
                     self.__access_4_type[name] = inst  # type: ignore
+                self.__access_4_class.clear()
+
+    def __get_class_instance(self, cls: type) -> t.Optional[_DataAccessor]:
+        # subclasses are served by the accessor of their closest registered base class
+        for base in cls.__mro__:
+            # fully qualified names differentiate classes sharing the same name (pandas and polars DataFrame)
+            access = self.__access_4_type.get(f"{base.__module__}.{base.__qualname__}")
+            if access is None:
+                access = self.__access_4_type.get(base.__name__)
+            if access is not None:
+                return access
+        return None
 
     def __get_instance(self, value: _TaipyData) -> _DataAccessor:  # type: ignore
         value = value.get()
-        access = self.__access_4_type.get(type(value).__name__)
+        cls = type(value)
+        access = self.__access_4_class.get(cls)
         if access is None:
-            _warn(f"Can't find Data Accessor for type {type(value).__name__}.")
-            return self.__invalid_data_accessor
+            access = self.__get_class_instance(cls)
+            if access is None and self.__interchange_data_accessor.is_supported(value):
+                access = self.__interchange_data_accessor
+            if access is None:
+                _warn(f"Can't find Data Accessor for type {cls.__name__}.")
+                return self.__invalid_data_accessor
+            self.__access_4_class[cls] = access
         return access
 
     def _get_data(
         self, guiApp: t.Any, var_name: str, value: _TaipyData, payload: t.Dict[str, t.Any]
     ) -> t.Dict[str, t.Any]:
-        return self.__get_instance(value).get_data(guiApp, var_name, value.get(), payload, self.__data_format)
+        access = self.__get_instance(value)
+        data_format = self.__get_data_format(access, var_name, value.get(), payload)
+        ret_payload = access.get_data(guiApp, var_name, value.get(), payload, data_format)
+        self.__transfers[data_format.value] += 1
+        compression = payload.get("compression")
+        if self.__compression if compression is None else compression:
+            _DataAccessors.__compress(ret_payload, self.__compression_threshold)
+        return ret_payload
+
+    def __get_data_format(
+        self, access: _DataAccessor, var_name: str, value: t.Any, payload: t.Dict[str, t.Any]
+    ) -> _DataFormat:
+        # the element can ask for a format, else the configuration applies
+        requested = str(payload.get("dataformat") or "").lower()
+        if requested == "json" or (requested and not self.__has_arrow):
+            return _DataFormat.JSON
+        if requested == "arrow":
+            return _DataFormat.APACHE_ARROW
+        if requested != "auto" and self.__arrow_min_cells is None:
+            return self.__data_format
+        # Apache Arrow is only worth its overhead for the large transfers
+        nb_rows = access.get_row_count(var_name, value)
+        if nb_rows is None:
+            return self.__data_format
+        if not payload.get("alldata"):
+            try:
+                start = max(int(payload.get("start", 0)), 0)
+                end = int(payload.get("end", -1))
+                if end >= start:
+                    nb_rows = min(nb_rows, end + 1 - start)
+            except (TypeError, ValueError):
+                pass
+        columns = payload.get("columns")
+        nb_cells = nb_rows * (len(columns) if isinstance(columns, list) and columns else 1)
+        min_cells = (
+            _DataAccessors.__DEFAULT_ARROW_MIN_CELLS if self.__arrow_min_cells is None else self.__arrow_min_cells
+        )
+        return _DataFormat.APACHE_ARROW if self.__has_arrow and nb_cells >= min_cells else _DataFormat.JSON
+
+    @staticmethod
+    def __compress(ret_payload: t.Dict[str, t.Any], threshold: int) -> None:
+        # Arrow streams are compressed as a whole: the front-end Arrow decoder can't read compressed IPC buffers
+        value = ret_payload.get("value")
+        if not isinstance(value, dict) or value.get("format") != _DataFormat.APACHE_ARROW.value:
+            return
+        data = value.get("data")
+        streams = data if isinstance(data, list) else [data]
+        if not all(isinstance(s, bytes) for s in streams) or sum(len(s) for s in streams) < threshold:
+            return
+        streams = [gzip.compress(s, compresslevel=_DataAccessors.__COMPRESSION_LEVEL, mtime=0) for s in streams]
+        value["data"] = streams if isinstance(data, list) else streams[0]
+        value["compression"] = "gzip"
 
     def _get_col_types(self, var_name: str, value: _TaipyData) -> t.Dict[str, str]:
         return self.__get_instance(value).get_col_types(var_name, value.get())
 
+    def _append_rows(self, value: _TaipyData, rows: t.Any) -> t.Optional[_AppendedRows]:
+        return self.__get_instance(value).append_rows(value.get(), rows)
+
     def _set_data_format(self, data_format: _DataFormat):
         self.__data_format = data_format
+
+    def _set_arrow_min_cells(self, min_cells: t.Optional[int]):
+        self.__arrow_min_cells = None if min_cells is None else int(min_cells)
+
+    def _get_transfers(self) -> t.Dict[str, int]:
+        return dict(self.__transfers)
+
+    def _set_compression(self, compression: bool, threshold: int):
+        self.__compression = compression
+        self.__compression_threshold = threshold
+
+    def _get_cache(self) -> _DataCache:
+        return self.__cache
+
+    def _set_cache_max_size(self, max_size: int):
+        self.__cache.set_max_size(max_size)
+
+    def _invalidate(self, var_name: str):
+        self.__cache.invalidate(var_name)
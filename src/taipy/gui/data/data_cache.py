@@ -0,0 +1,126 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+import typing as t
+import weakref
+from collections import OrderedDict
+from threading import RLock
+
+import numpy as np
+import pandas as pd
+
+
+class _DataCache(object):
+    """LRU cache for values computed from bound data variables.
+
+    Entries are indexed by the bound variable name, a stamp of the variable value
+    (identity and length) and a computation key.
+    They are dropped when the variable is invalidated or when the memory budget is exceeded.
+    """
+
+    _DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    def __init__(self, max_size: t.Optional[int] = None) -> None:
+        self.__max_size = _DataCache._DEFAULT_MAX_SIZE if max_size is None else max_size
+        self.__size = 0
+        self.__entries: t.OrderedDict[t.Tuple[t.Any, ...], t.Tuple[t.Any, t.Any, int]] = OrderedDict()
+        self.__lock = RLock()
+
+    @staticmethod
+    def _get_size(data: t.Any) -> int:
+        if isinstance(data, np.ndarray):
+            return data.nbytes
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return int(data.memory_usage(index=True, deep=False).sum())
+        nbytes = getattr(data, "nbytes", None)
+        if isinstance(nbytes, int):
+            # pyarrow tables and arrays
+            return nbytes
+        if isinstance(data, (tuple, list)):
+            return sys.getsizeof(data) + sum(_DataCache._get_size(d) for d in data)
+        if isinstance(data, dict):
+            return sys.getsizeof(data) + sum(_DataCache._get_size(d) for d in data.values())
+        return sys.getsizeof(data)
+
+    @staticmethod
+    def __get_stamp(value: t.Any) -> t.Tuple[int, int]:
+        try:
+            length = len(value)
+        except Exception:
+            length = -1
+        return (id(value), length)
+
+    @staticmethod
+    def __get_ref(value: t.Any) -> t.Any:
+        try:
+            return weakref.ref(value)
+        except TypeError:
+            # Some types (list, dict...) can't be weakly referenced: keep a strong reference
+            return lambda: value
+
+    def get_max_size(self) -> int:
+        return self.__max_size
+
+    def set_max_size(self, max_size: int) -> None:
+        with self.__lock:
+            self.__max_size = max_size
+            self.__evict()
+
+    def get(self, var_name: str, value: t.Any, key: t.Tuple[t.Any, ...]) -> t.Any:
+        entry_key = (var_name, *_DataCache.__get_stamp(value), *key)
+        with self.__lock:
+            entry = self.__entries.get(entry_key)
+            if entry is None:
+                return None
+            if entry[0]() is not value:
+                # the stamped object is gone and its id was reused
+                self.__remove(entry_key)
+                return None
+            self.__entries.move_to_end(entry_key)
+            return entry[1]
+
+    def set(self, var_name: str, value: t.Any, key: t.Tuple[t.Any, ...], data: t.Any) -> t.Any:
+        size = _DataCache._get_size(data)
+        if size > self.__max_size:
+            return data
+        entry_key = (var_name, *_DataCache.__get_stamp(value), *key)
+        with self.__lock:
+            self.__remove(entry_key)
+            self.__entries[entry_key] = (_DataCache.__get_ref(value), data, size)
+            self.__size += size
+            self.__evict()
+        return data
+
+    def invalidate(self, var_name: t.Optional[str] = None) -> None:
+        with self.__lock:
+            if var_name is None:
+                self.__entries.clear()
+                self.__size = 0
+                return
+            for entry_key in [k for k in self.__entries.keys() if k[0] == var_name]:
+                self.__remove(entry_key)
+
+    def get_size(self) -> int:
+        return self.__size
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __remove(self, entry_key: t.Tuple[t.Any, ...]) -> None:
+        entry = self.__entries.pop(entry_key, None)
+        if entry is not None:
+            self.__size -= entry[2]
+
+    def __evict(self) -> None:
+        while self.__size > self.__max_size and self.__entries:
+            _, entry = self.__entries.popitem(last=False)
+            self.__size -= entry[2]
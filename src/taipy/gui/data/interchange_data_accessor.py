@@ -0,0 +1,120 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import typing as t
+from importlib import util
+
+import pandas as pd
+
+from .._warnings import _warn
+from ..gui import Gui
+from .data_accessor import _DataAccessor
+from .data_cache import _DataCache
+from .data_format import _DataFormat
+
+
+class _InterchangeDataAccessor(_DataAccessor):
+    """Data accessor for the objects that no other accessor supports but that expose their data
+    through the Arrow PyCapsule interface (`__arrow_c_stream__`) or the dataframe interchange
+    protocol (`__dataframe__`).
+
+    When the installed pyarrow supports the protocol, the data is imported as a `pyarrow.Table`
+    (without copy when the producer allows it) and served as an in-memory dataset. Otherwise
+    objects that implement the interchange protocol are converted to a pandas DataFrame.
+    """
+
+    __PROTOCOLS = ("__arrow_c_stream__", "__dataframe__")
+
+    def __init__(self) -> None:
+        has_arrow = util.find_spec("pyarrow") is not None
+        # the Arrow PyCapsule interface needs pyarrow 14, pyarrow.interchange pyarrow 11
+        self.__has_arrow_stream = has_arrow and _InterchangeDataAccessor.__has_arrow_stream_import()
+        self.__has_arrow_interchange = has_arrow and util.find_spec("pyarrow.interchange") is not None
+        self.__arrow_delegate: t.Optional[_DataAccessor] = None
+        self.__pandas_delegate: t.Optional[_DataAccessor] = None
+
+    @staticmethod
+    def __has_arrow_stream_import() -> bool:
+        import pyarrow as pa
+
+        return hasattr(pa.Table, "__arrow_c_stream__")
+
+    @staticmethod
+    def get_supported_classes() -> t.List[str]:
+        # not registered by class name: see is_supported()
+        return list(_InterchangeDataAccessor.__PROTOCOLS)
+
+    def is_supported(self, value: t.Any) -> bool:
+        if inspect.isclass(value):
+            return False
+        if hasattr(value, "__dataframe__"):
+            return True
+        return self.__has_arrow_stream and hasattr(value, "__arrow_c_stream__")
+
+    def __get_delegate(self, data: t.Any) -> _DataAccessor:
+        if isinstance(data, pd.DataFrame):
+            if self.__pandas_delegate is None:
+                from .pandas_data_accessor import _PandasDataAccessor
+
+                self.__pandas_delegate = _PandasDataAccessor()
+            return self.__pandas_delegate
+        if self.__arrow_delegate is None:
+            from .arrow_dataset_data_accessor import _ArrowDatasetDataAccessor
+
+            self.__arrow_delegate = _ArrowDatasetDataAccessor()
+        return self.__arrow_delegate
+
+    def __import(self, value: t.Any) -> t.Any:
+        # Arrow data is returned with the dataset that serves it: the table measures the memory used
+        if self.__has_arrow_stream and hasattr(value, "__arrow_c_stream__"):
+            import pyarrow as pa
+            import pyarrow.dataset as ds
+
+            table = pa.table(value)
+            return (table, ds.dataset(table))
+        if self.__has_arrow_interchange:
+            import pyarrow.dataset as ds
+            from pyarrow.interchange import from_dataframe
+
+            table = from_dataframe(value)
+            return (table, ds.dataset(table))
+        return pd.api.interchange.from_dataframe(value)
+
+    def __get_data_source(self, var_name: str, value: t.Any, cache: t.Optional[_DataCache]) -> t.Any:
+        # the import is done once per value, until the variable is updated
+        data = None if cache is None else cache.get(var_name, value, ("interchange",))
+        if data is None:
+            data = self.__import(value)
+            if cache is not None:
+                cache.set(var_name, value, ("interchange",), data)
+        return data[1] if isinstance(data, tuple) else data
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if self.is_supported(value):
+            try:
+                data = self.__get_data_source(var_name, value, self._cache)
+                return self.__get_delegate(data).get_col_types(var_name, data)
+            except Exception as e:
+                _warn(f"Cannot import the data of {var_name} ({type(value).__name__})", e)
+        return None
+
+    def get_data(
+        self, guiApp: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if self.is_supported(value):
+            try:
+                data = self.__get_data_source(var_name, value, guiApp._accessors._get_cache())
+            except Exception as e:
+                _warn(f"Cannot import the data of {var_name} ({type(value).__name__})", e)
+                return {}
+            return self.__get_delegate(data).get_data(guiApp, var_name, data, payload, data_format)
+        return {}
@@ -0,0 +1,81 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from .._renderers.json import _dumps, _has_orjson_module
+
+if _has_orjson_module:
+    import orjson
+
+
+def _get_json_data(data: pd.DataFrame, orient: str) -> bytes:
+    """JSON encoding of a DataFrame, written from its column buffers.
+
+    *orient* is "records" (a list of rows) or "list" (a dict of columns). NaN, NaT, infinite and
+    missing values are encoded as null.
+    The encoded bytes are sent as they are, as a binary attachment of the Socket.IO message.
+    """
+    keys = [_dumps(str(c)) + b":" for c in data.columns]
+    columns = [data.iloc[:, i] for i in range(data.shape[1])]
+    if orient == "records":
+        if not columns:
+            return _dumps([{}] * len(data))
+        cells = [_get_cells(c, k) for c, k in zip(columns, keys)]
+        return b"[" + b",".join(b"{" + b",".join(row) + b"}" for row in zip(*cells)) + b"]"
+    return b"{" + b",".join(k + _get_array(c) for c, k in zip(columns, keys)) + b"}"
+
+
+def _is_numeric(column: pd.Series) -> bool:
+    # the nullable extension types hold pd.NA: they are handled as objects
+    return isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf"
+
+
+def _dumps_numbers(values: np.ndarray) -> bytes:
+    if _has_orjson_module:
+        try:
+            return orjson.dumps(np.ascontiguousarray(values), option=orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # float16...
+            pass
+    if values.dtype.kind == "f":
+        values = np.where(np.isfinite(values), values, None)
+    return json.dumps(values.tolist(), separators=(",", ":")).encode()
+
+
+def _get_objects(column: pd.Series) -> t.Tuple[np.ndarray, np.ndarray]:
+    values = column.to_numpy(dtype=object)
+    return values, np.asarray(pd.isna(values), dtype=bool)
+
+
+def _get_array(column: pd.Series) -> bytes:
+    if _is_numeric(column):
+        return _dumps_numbers(column.to_numpy())
+    values, missing = _get_objects(column)
+    if missing.any():
+        values = values.copy()
+        values[missing] = None
+    return _dumps(values.tolist())
+
+
+def _get_cells(column: pd.Series, key: bytes) -> t.List[bytes]:
+    # the '"key":value' fragments of the column
+    if not len(column):
+        return []
+    if _is_numeric(column):
+        # numbers, booleans and null hold no comma: the array is split without decoding it
+        return [key + v for v in _dumps_numbers(column.to_numpy())[1:-1].split(b",")]
+    values, missing = _get_objects(column)
+    return [key + (b"null" if m else _dumps(v)) for v, m in zip(values.tolist(), missing.tolist())]
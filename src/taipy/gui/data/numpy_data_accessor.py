@@ -15,6 +15,8 @@ import numpy
 import pandas as pd
 
 from ..gui import Gui
+from .data_accessor import _AppendedRows
+from .data_cache import _DataCache
 from .data_format import _DataFormat
 from .pandas_data_accessor import _PandasDataAccessor
 
@@ -26,17 +28,59 @@ class _NumpyDataAccessor(_PandasDataAccessor):
     def get_supported_classes() -> t.List[str]:
         return [t.__name__ for t in _NumpyDataAccessor.__types]  # type: ignore
 
-    def __get_dataframe(self, value: t.Any) -> pd.DataFrame:
-        return pd.DataFrame(value)
+    # the rows of the page are enough when nothing is computed on the whole array
+    __WHOLE_DATA_KEYS = ("alldata", "filters", "search", "aggregates", "orderby")
+
+    def __get_dataframe(self, var_name: str, value: t.Any, cache: t.Optional[_DataCache]) -> pd.DataFrame:
+        df = None if cache is None else cache.get(var_name, value, ("dataframe",))
+        if df is None:
+            df = pd.DataFrame(value)
+            if cache is not None:
+                cache.set(var_name, value, ("dataframe",), df)
+        return df
+
+    @staticmethod
+    def __get_int_value(value: t.Any, default: int) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value), base=10)
+        except Exception:
+            return default
+
+    def __get_page(
+        self, guiApp: Gui, var_name: str, value: numpy.ndarray, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        rowcount = len(value)
+        start = _NumpyDataAccessor.__get_int_value(payload.get("start"), 0)
+        end = _NumpyDataAccessor.__get_int_value(payload.get("end"), -1)
+        if start < 0 or start >= rowcount:
+            start = 0
+        if end < 0 or end >= rowcount:
+            end = rowcount - 1
+        # slicing doesn't copy the array, only the page is converted
+        page = pd.DataFrame(value[start : end + 1], index=pd.RangeIndex(start, end + 1))
+        return self._get_page_data(guiApp, var_name, page, payload, data_format, start, rowcount)
+
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[_AppendedRows]:
+        if not isinstance(value, _NumpyDataAccessor.__types) or value.ndim == 0:  # type: ignore
+            return None
+        rows = numpy.asarray(rows, dtype=value.dtype).reshape((-1, *value.shape[1:]))
+        return _AppendedRows(numpy.concatenate([value, rows]), rows, len(value), len(value) + len(rows))
 
     def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
         if isinstance(value, _NumpyDataAccessor.__types):  # type: ignore
-            return super().get_col_types(var_name, self.__get_dataframe(value))
+            return super().get_col_types(var_name, self.__get_dataframe(var_name, value, self._cache))
         return None
 
     def get_data(  # noqa: C901
         self, guiApp: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
     ) -> t.Dict[str, t.Any]:
         if isinstance(value, _NumpyDataAccessor.__types):  # type: ignore
-            return super().get_data(guiApp, var_name, self.__get_dataframe(value), payload, data_format)
+            if value.ndim in (1, 2) and not any(payload.get(k) for k in _NumpyDataAccessor.__WHOLE_DATA_KEYS):
+                return self.__get_page(guiApp, var_name, value, payload, data_format)
+            cache = guiApp._accessors._get_cache()
+            return super().get_data(
+                guiApp, var_name, self.__get_dataframe(var_name, value, cache), payload, data_format
+            )
         return {}
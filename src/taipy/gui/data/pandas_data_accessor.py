@@ -9,6 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
+import inspect
+import operator
 import typing as t
 from datetime import datetime
 from importlib import util
@@ -20,9 +23,11 @@ from .._warnings import _warn
 from ..gui import Gui
 from ..types import PropertyType
 from ..utils import _RE_PD_TYPE, _get_date_col_str_name
-from .data_accessor import _DataAccessor
+from .data_accessor import _AppendedRows, _DataAccessor
 from .data_format import _DataFormat
-from .utils import _df_data_filter, _df_relayout
+from .json_encoder import _get_json_data
+from .search_index import _SearchIndex
+from .utils import _df_data_filter, _df_relayout, _get_arrow_stream
 
 _has_arrow_module = False
 if util.find_spec("pyarrow"):
@@ -37,6 +42,24 @@ class _PandasDataAccessor(_DataAccessor):
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
 
+    __FILTER_OPERATORS: t.Dict[str, t.Callable[[t.Any, t.Any], t.Any]] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    # pages that end before 1/__PARTIAL_SORT_RATIO of the rows don't need a full sort
+    __PARTIAL_SORT_RATIO = 10
+
+    # results of a user function kept for the rows that were sent
+    __MAX_USER_FUNCTION_RESULTS = 10000
+
+    __VECTORIZED_TYPES = (pd.DataFrame, pd.Series, pd.Index)
+    __VECTORIZED_TYPE_NAMES = [t.__name__ for t in __VECTORIZED_TYPES]
+
     @staticmethod
     def get_supported_classes() -> t.List[str]:
         return [t.__name__ for t in _PandasDataAccessor.__types]  # type: ignore
@@ -57,9 +80,32 @@ class _PandasDataAccessor(_DataAccessor):
             _warn(f"Exception raised when calling user function {function_name}()", e)
         return ""
 
-    def __is_date_column(self, data: pd.DataFrame, col_name: str) -> bool:
-        col_types = data.dtypes[data.dtypes.index.astype(str) == col_name]
-        return len(col_types[col_types.astype(str).str.startswith("datetime")]) > 0  # type: ignore
+    @staticmethod
+    def __is_vectorized(user_function: t.Callable) -> bool:
+        # functions that declare a pandas parameter are called once with all the rows
+        try:
+            parameters = inspect.signature(user_function).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            p.annotation in _PandasDataAccessor.__VECTORIZED_TYPES
+            or str(p.annotation).split(".")[-1] in _PandasDataAccessor.__VECTORIZED_TYPE_NAMES
+            for p in parameters
+        )
+
+    @staticmethod
+    def __get_projection(
+        dataframe: pd.DataFrame, columns: t.Any, extra_columns: t.Iterable[t.Any] = ()
+    ) -> t.Optional[np.ndarray]:
+        # positions of the columns that are needed, None if they all are
+        if not isinstance(columns, list) or not len(columns):
+            return None
+        names = dataframe.columns.astype(str)
+        mask = names.isin(columns) | names.isin([str(c) for c in extra_columns if c])
+        return None if mask.all() else np.flatnonzero(mask)
+
+    def __has_user_function(self, gui: Gui, *functions: t.Optional[t.Dict[str, str]]) -> bool:
+        return any(callable(gui._get_user_function(v)) for f in functions if f for v in f.values())
 
     def __build_transferred_cols(
         self,
@@ -69,14 +115,22 @@ class _PandasDataAccessor(_DataAccessor):
         styles: t.Optional[t.Dict[str, str]] = None,
         tooltips: t.Optional[t.Dict[str, str]] = None,
         is_copied: t.Optional[bool] = False,
-        new_indexes: t.Optional[np.ndarray] = None,
         handle_nan: t.Optional[bool] = False,
+        rows_ref: t.Optional[t.Tuple[str, t.Any, t.Tuple[t.Any, ...], np.ndarray]] = None,
     ) -> pd.DataFrame:
+        # dataframe only holds the rows that are sent: derived columns are computed on these rows only
+        # rows_ref (var_name, bound value, view key, row positions) identifies these rows for cached results
         if isinstance(payload_cols, list) and len(payload_cols):
             col_types = dataframe.dtypes[dataframe.dtypes.index.astype(str).isin(payload_cols)]
         else:
             col_types = dataframe.dtypes
         cols = col_types.index.astype(str).tolist()
+        # user functions read whole rows, but only the sent columns are copied and completed
+        source = dataframe
+        projection = _PandasDataAccessor.__get_projection(dataframe, payload_cols)
+        if projection is not None:
+            dataframe = dataframe.take(projection, axis=1)
+            is_copied = True
         if styles:
             if not is_copied:
                 # copy the df so that we don't "mess" with the user's data
@@ -86,7 +140,9 @@ class _PandasDataAccessor(_DataAccessor):
                 col_applied = False
                 func = gui._get_user_function(v)
                 if callable(func):
-                    col_applied = self.__apply_user_function(gui, func, k if k in cols else None, v, dataframe, "tps__")
+                    col_applied = self.__apply_user_function(
+                        gui, func, k if k in cols else None, v, source, dataframe, "tps__", rows_ref
+                    )
                 if not col_applied:
                     dataframe[v] = v
                 cols.append(col_applied or v)
@@ -99,7 +155,9 @@ class _PandasDataAccessor(_DataAccessor):
                 col_applied = False
                 func = gui._get_user_function(v)
                 if callable(func):
-                    col_applied = self.__apply_user_function(gui, func, k if k in cols else None, v, dataframe, "tpt__")
+                    col_applied = self.__apply_user_function(
+                        gui, func, k if k in cols else None, v, source, dataframe, "tpt__", rows_ref
+                    )
                 cols.append(col_applied or v)
         # deal with dates
         datecols = col_types[col_types.astype(str).str.startswith("datetime")].index.tolist()  # type: ignore
@@ -133,7 +191,6 @@ class _PandasDataAccessor(_DataAccessor):
 
             # remove the date columns from the list of columns
             cols = list(set(cols) - set(datecols))
-        dataframe = dataframe.iloc[new_indexes] if new_indexes is not None else dataframe
         dataframe = dataframe.loc[:, dataframe.dtypes[dataframe.dtypes.index.astype(str).isin(cols)].index]  # type: ignore
         return dataframe
 
@@ -144,20 +201,314 @@ class _PandasDataAccessor(_DataAccessor):
         column_name: t.Optional[str],
         function_name: str,
         data: pd.DataFrame,
+        target: pd.DataFrame,
         prefix: t.Optional[str],
+        rows_ref: t.Optional[t.Tuple[str, t.Any, t.Tuple[t.Any, ...], np.ndarray]] = None,
     ):
         try:
             new_col_name = f"{prefix}{column_name}__{function_name}" if column_name else function_name
-            data[new_col_name] = data.apply(
-                _PandasDataAccessor.__user_function,
-                axis=1,
-                args=(gui, column_name, user_function, function_name),
-            )
+            if _PandasDataAccessor.__is_vectorized(user_function):
+                # a single call for all the rows
+                args = [data[column_name], data.index, data, column_name] if column_name else [data.index, data]
+                ret = gui._call_function_with_state(user_function, args)
+                values = ret.to_numpy() if isinstance(ret, (pd.Series, pd.Index)) else ret
+                target[new_col_name] = pd.Series(values, index=data.index, dtype=object).fillna("").astype(str)
+            elif rows_ref is not None and len(data):
+                var_name, bound_value, view_key, positions = rows_ref
+                cache = gui._accessors._get_cache()
+                # the functions receive the state of the client: their results are kept while this state is unchanged
+                cache_key = (
+                    "user_function",
+                    gui._get_client_id(),
+                    gui._get_state_version(),
+                    view_key,
+                    prefix,
+                    function_name,
+                    user_function,
+                    column_name,
+                )
+                results: t.Dict[int, str] = cache.get(var_name, bound_value, cache_key) or {}
+                row_ids = positions.tolist()
+                missing = [i for i, r in enumerate(row_ids) if r not in results]
+                if missing:
+                    computed = data.iloc[missing].apply(
+                        _PandasDataAccessor.__user_function,
+                        axis=1,
+                        args=(gui, column_name, user_function, function_name),
+                    )
+                    if len(results) + len(missing) > _PandasDataAccessor.__MAX_USER_FUNCTION_RESULTS:
+                        # only the results of the sent rows are kept
+                        results = {r: results[r] for r in row_ids if r in results}
+                    else:
+                        results = dict(results)
+                    results.update(zip([row_ids[i] for i in missing], computed.tolist()))
+                    cache.set(var_name, bound_value, cache_key, results)
+                target[new_col_name] = [results[r] for r in row_ids]
+            else:
+                target[new_col_name] = data.apply(
+                    _PandasDataAccessor.__user_function,
+                    axis=1,
+                    args=(gui, column_name, user_function, function_name),
+                )
             return new_col_name
         except Exception as e:
             _warn(f"Exception raised when invoking user function {function_name}()", e)
         return False
 
+    @staticmethod
+    def __get_filter_mask(column: pd.Series, action: str, val: t.Any) -> np.ndarray:
+        if action == "contains":
+            mask = column.str.contains(val, na=False)
+        else:
+            op = _PandasDataAccessor.__FILTER_OPERATORS.get(action)
+            if op is None:
+                raise ValueError(f"Unknown filter action '{action}'")
+            mask = op(column, val)
+        return mask.to_numpy(dtype=bool, na_value=False)
+
+    def __get_filtered_rows(
+        self,
+        gui: Gui,
+        var_name: str,
+        bound_value: t.Any,
+        value: pd.DataFrame,
+        filters: t.List[t.Dict[str, t.Any]],
+        filters_key: t.Tuple[t.Any, ...],
+    ) -> t.Optional[np.ndarray]:
+        cache = gui._accessors._get_cache()
+        rows = cache.get(var_name, bound_value, ("filters", filters_key))
+        if rows is not None:
+            return rows
+        # date columns and date values are resolved once per request
+        date_cols = {str(c) for c, dt in value.dtypes.items() if str(dt).startswith("datetime")}
+        dates: t.Dict[str, datetime] = {}
+        mask: t.Optional[np.ndarray] = None
+        for fd, fd_key in zip(filters, filters_key):
+            col = fd.get("col")
+            val = fd.get("value")
+            action = fd.get("action")
+            try:
+                if col not in value.columns and value.columns.dtype.name == "int64":
+                    col = int(col)
+                if isinstance(val, str) and str(col) in date_cols:
+                    if val not in dates:
+                        dates[val] = datetime.fromisoformat(val[:-1])
+                    val = dates[val]
+                col_mask = cache.get(var_name, bound_value, ("filter", fd_key))
+                if col_mask is None:
+                    col_mask = _PandasDataAccessor.__get_filter_mask(value[col], action, val)
+                    col_mask.flags.writeable = False
+                    cache.set(var_name, bound_value, ("filter", fd_key), col_mask)
+                mask = col_mask if mask is None else mask & col_mask
+            except Exception as e:
+                _warn(f"Dataframe filtering: invalid filter '{col} {action} {val}' on {var_name}", e)
+                return None
+        if mask is None:
+            return None
+        rows = np.flatnonzero(mask)
+        rows.flags.writeable = False
+        return cache.set(var_name, bound_value, ("filters", filters_key), rows)
+
+    def __get_searched_rows(
+        self,
+        gui: Gui,
+        var_name: str,
+        bound_value: t.Any,
+        value: pd.DataFrame,
+        columns: t.List[t.Any],
+        search: str,
+    ) -> np.ndarray:
+        # the string columns that are displayed are searched
+        cols = [
+            c
+            for c, dt in value.dtypes.items()
+            if (not columns or str(c) in columns) and pd.api.types.is_string_dtype(dt)
+        ]
+        cache = gui._accessors._get_cache()
+        search_key = ("search", search, tuple(cols))
+        rows = cache.get(var_name, bound_value, search_key)
+        if rows is not None:
+            return rows
+        col_rows = []
+        for col in cols:
+            # the index of a column is built the first time it is searched, and dropped when the variable changes
+            index = cache.get(var_name, bound_value, ("search_index", col))
+            if index is None:
+                index = cache.set(var_name, bound_value, ("search_index", col), _SearchIndex(value[col]))
+            col_rows.append(index.search(search))
+        rows = np.unique(np.concatenate(col_rows)) if col_rows else np.empty(0, dtype=np.int64)
+        rows.flags.writeable = False
+        return cache.set(var_name, bound_value, search_key, rows)
+
+    @staticmethod
+    def __get_partial_sort(values: t.Any, nb_rows: int, descending: bool) -> t.Optional[np.ndarray]:
+        # first nb_rows positions of the (reversed if descending) stable sort, without sorting all the values
+        if not isinstance(values, np.ndarray) or values.ndim != 1 or values.dtype.kind not in "biufmM":
+            return None
+        if values.dtype.kind == "f" and np.isnan(values).any() or values.dtype.kind in "mM" and np.isnat(values).any():
+            # NaN placement is left to the full sort
+            return None
+        if descending:
+            kth = np.partition(values, len(values) - nb_rows)[len(values) - nb_rows]
+            selected = np.flatnonzero(values > kth)
+            ties = np.flatnonzero(values == kth)
+            # the stable sort orders ties by position: the last ones come first when reversed
+            ties = ties[len(ties) - (nb_rows - len(selected)) :]
+        else:
+            kth = np.partition(values, nb_rows - 1)[nb_rows - 1]
+            selected = np.flatnonzero(values < kth)
+            ties = np.flatnonzero(values == kth)
+            ties = ties[: nb_rows - len(selected)]
+        positions = np.sort(np.concatenate((selected, ties)))
+        positions = positions[values[positions].argsort(kind="stable")]
+        return positions[::-1] if descending else positions
+
+    @staticmethod
+    def __get_column_values(value: pd.DataFrame, col: t.Any) -> t.Any:
+        if col == _PandasDataAccessor.__INDEX_COL and col not in value.columns:
+            return value.index.values
+        return value[col].values
+
+    def __get_sort_codes(
+        self,
+        gui: Gui,
+        var_name: str,
+        bound_value: t.Any,
+        value: pd.DataFrame,
+        col: t.Any,
+        codes_key: t.Tuple[t.Any, ...],
+    ) -> np.ndarray:
+        # order-preserving integer codes of the column values (-1 for NaN)
+        cache = gui._accessors._get_cache()
+        cache_key = ("sort_codes", codes_key, col)
+        codes = cache.get(var_name, bound_value, cache_key)
+        if codes is None:
+            col_values = _PandasDataAccessor.__get_column_values(value, col)
+            try:
+                codes, _ = pd.factorize(col_values, sort=True)
+            except TypeError:
+                # values of mixed types are ordered by their string representation
+                codes, uniques = pd.factorize(col_values)
+                ranks = np.empty(len(uniques), dtype=codes.dtype)
+                ranks[np.argsort(np.asarray(uniques, dtype=str), kind="stable")] = np.arange(len(uniques))
+                codes = np.where(codes < 0, codes, ranks[codes])
+            codes.flags.writeable = False
+            cache.set(var_name, bound_value, cache_key, codes)
+        return codes
+
+    def __get_multi_sorted_indexes(
+        self,
+        gui: Gui,
+        var_name: str,
+        bound_value: t.Any,
+        value: pd.DataFrame,
+        order_by: t.List[t.Any],
+        descendings: t.List[bool],
+        nan_first: t.Optional[bool],
+        rows: t.Optional[np.ndarray],
+        view_key: t.Tuple[t.Any, ...],
+    ) -> np.ndarray:
+        cache = gui._accessors._get_cache()
+        cache_key = ("multi_sort", view_key, tuple(order_by), tuple(descendings), nan_first)
+        indexes = cache.get(var_name, bound_value, cache_key)
+        if indexes is None:
+            # codes of the bound value columns don't depend on the filters
+            codes_key = view_key if value is not bound_value else ()
+            keys = []
+            for col, descending in zip(order_by, descendings):
+                codes = self.__get_sort_codes(gui, var_name, bound_value, value, col, codes_key)
+                codes = codes if rows is None else codes[rows]
+                nb_codes = int(codes.max()) + 1 if len(codes) else 0
+                sort_codes = nb_codes - 1 - codes if descending else codes
+                # by default, NaNs are last in ascending order and first in descending order
+                nan_code = -1 if (descending if nan_first is None else nan_first) else nb_codes
+                keys.append(np.where(codes < 0, nan_code, sort_codes))
+            # np.lexsort is stable and uses the last key as the primary one
+            indexes = np.lexsort(keys[::-1]) if keys else np.arange(len(rows) if rows is not None else len(value))
+            indexes = indexes if rows is None else rows[indexes]
+            indexes.flags.writeable = False
+            cache.set(var_name, bound_value, cache_key, indexes)
+        return indexes
+
+    def __get_sorted_indexes(
+        self,
+        gui: Gui,
+        var_name: str,
+        bound_value: t.Any,
+        value: pd.DataFrame,
+        order_by: t.Any,
+        rows: t.Optional[np.ndarray],
+        view_key: t.Tuple[t.Any, ...],
+        start: int,
+        end: int,
+        descending: bool,
+    ) -> np.ndarray:
+        # the ascending permutation is cached: descending order is a reversed view of it
+        cache = gui._accessors._get_cache()
+        cache_key = ("sort", view_key, order_by)
+        indexes = cache.get(var_name, bound_value, cache_key)
+        if indexes is None:
+            col_values = _PandasDataAccessor.__get_column_values(value, order_by)
+            values = col_values if rows is None else col_values[rows]
+            if (end + 1) * _PandasDataAccessor.__PARTIAL_SORT_RATIO <= len(values):
+                # top of the table: only the first rows are sorted
+                prefix_key = ("sort_prefix", view_key, order_by, descending)
+                prefix = cache.get(var_name, bound_value, prefix_key)
+                if prefix is None or len(prefix) <= end:
+                    nb_rows = min(max(end + 1, 2 * len(prefix) if prefix is not None else 0), len(values))
+                    prefix = _PandasDataAccessor.__get_partial_sort(values, nb_rows, descending)
+                    if prefix is not None:
+                        prefix = prefix if rows is None else rows[prefix]
+                        prefix.flags.writeable = False
+                        cache.set(var_name, bound_value, prefix_key, prefix)
+                if prefix is not None:
+                    return prefix[slice(start, end + 1)]
+            indexes = values.argsort(axis=0, kind="stable")
+            indexes = indexes if rows is None else rows[indexes]
+            indexes.flags.writeable = False
+            cache.set(var_name, bound_value, cache_key, indexes)
+        if descending:
+            # reverse order
+            indexes = indexes[::-1]
+        return indexes[slice(start, end + 1)]
+
+    @staticmethod
+    def __get_etag(value: pd.DataFrame, *parts: t.Any) -> t.Optional[str]:
+        # fingerprint of the content of a page, computed before it is formatted
+        try:
+            hashes = pd.util.hash_pandas_object(value, index=False).to_numpy()
+        except TypeError:
+            # unhashable values (lists...)
+            return None
+        digest = hashlib.blake2b(
+            repr(([str(c) for c in value.columns], [str(d) for d in value.dtypes]) + parts).encode(), digest_size=16
+        )
+        digest.update(hashes.tobytes())
+        return digest.hexdigest()
+
+    def _get_page_data(
+        self,
+        gui: Gui,
+        var_name: str,
+        page: pd.DataFrame,
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+        start: int,
+        rowcount: int,
+    ) -> t.Dict[str, t.Any]:
+        # page holds the rows of a larger source, from start: its fingerprint also holds its range in the source
+        etag = payload.get("etag")
+        local_payload = {**payload, "start": 0, "end": -1, "etag": None if etag is None else ""}
+        ret = _PandasDataAccessor.get_data(self, gui, var_name, page, local_payload, data_format)
+        value = ret["value"]
+        value.update({"start": start, "rowcount": rowcount})
+        if value.get("etag") is not None:
+            digest = hashlib.blake2b(repr((value["etag"], start, start + len(page), rowcount)).encode(), digest_size=16)
+            value["etag"] = digest.hexdigest()
+            if value["etag"] == etag:
+                ret["value"] = {"notModified": True, "etag": value["etag"]}
+        return ret
+
     def __format_data(
         self,
         data: pd.DataFrame,
@@ -180,23 +531,12 @@ class _PandasDataAccessor(_DataAccessor):
         if data_format == _DataFormat.APACHE_ARROW:
             if not _has_arrow_module:
                 raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
-            # Convert from pandas to Arrow
-            table = pa.Table.from_pandas(data)
-            # Create sink buffer stream
-            sink = pa.BufferOutputStream()
-            # Create Stream writer
-            writer = pa.ipc.new_stream(sink, table.schema)
-            # Write data to table
-            writer.write_table(table)
-            writer.close()
-            # End buffer stream
-            buf = sink.getvalue()
-            # Convert buffer to Python bytes and return
-            ret["data"] = buf.to_pybytes()
+            # Convert from pandas to Arrow (the row positions are sent in the index column)
+            ret["data"] = _get_arrow_stream(pa.Table.from_pandas(data, preserve_index=False))
             ret["orient"] = orient
         else:
-            # Workaround for Python built in JSON encoder that does not yet support ignore_nan
-            ret["data"] = data.replace([np.nan, pd.NA], [None, None]).to_dict(orient=orient)  # type: ignore
+            # Encoded from the columns, without building the rows as dicts
+            ret["data"] = _get_json_data(data, orient)
         return ret
 
     def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
@@ -209,6 +549,21 @@ class _PandasDataAccessor(_DataAccessor):
             return ret_dict
         return None
 
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[_AppendedRows]:
+        if not isinstance(value, _PandasDataAccessor.__types):  # type: ignore
+            return None
+        if not isinstance(rows, pd.DataFrame):
+            rows = pd.DataFrame(rows)
+            if isinstance(rows.columns, pd.RangeIndex) and len(rows.columns) == len(value.columns):
+                # rows given as sequences of values
+                rows.columns = value.columns
+        start = len(value)
+        if isinstance(value.index, pd.RangeIndex):
+            # the index keeps holding the row positions
+            rows = rows.set_axis(pd.RangeIndex(start, start + len(rows)))
+        value = pd.concat([value, rows])
+        return _AppendedRows(value, rows, start, len(value))
+
     def __get_data(  # noqa: C901
         self,
         gui: Gui,
@@ -224,39 +579,43 @@ class _PandasDataAccessor(_DataAccessor):
         ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
         paged = not payload.get("alldata", False)
         is_copied = False
+        # the user's value and the transformations applied to it identify cached computations
+        bound_value = value
+        view_key: t.Tuple[t.Any, ...] = ()
 
-        # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in value.columns:
-                value = value.copy()
-                is_copied = True
-                value[_PandasDataAccessor.__INDEX_COL] = value.index
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
+        # add index if not chart (the column is only built for the rows that are sent)
+        if paged and columns and _PandasDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PandasDataAccessor.__INDEX_COL)
+
+        # charts only copy the sent columns and the axes of their decimators
+        projection = None
+        if not paged:
+            decimators = payload.get("decimatorPayload", {}).get("decimators", [])
+            axes = [d.get(a) for d in decimators for a in ("xAxis", "yAxis", "zAxis")]
+            projection = _PandasDataAccessor.__get_projection(value, columns, axes)
 
         # filtering
+        rows: t.Optional[np.ndarray] = None
         filters = payload.get("filters")
         if isinstance(filters, list) and len(filters) > 0:
-            query = ""
-            vars = []
-            for fd in filters:
-                col = fd.get("col")
-                val = fd.get("value")
-                action = fd.get("action")
-                if isinstance(val, str):
-                    if self.__is_date_column(value, col):
-                        val = datetime.fromisoformat(val[:-1])
-                    vars.append(val)
-                val = f"@vars[{len(vars) - 1}]" if isinstance(val, (str, datetime)) else val
-                right = f".str.contains({val})" if action == "contains" else f" {action} {val}"
-                if query:
-                    query += " and "
-                query += f"`{col}`{right}"
-            try:
-                value = value.query(query)
-                is_copied = True
-            except Exception as e:
-                _warn(f"Dataframe filtering: invalid query '{query}' on {value.head()}", e)
+            filters_key = tuple((fd.get("col"), fd.get("action"), repr(fd.get("value"))) for fd in filters)
+            rows = self.__get_filtered_rows(gui, var_name, bound_value, value, filters, filters_key)
+            if rows is not None:
+                view_key += ("filters", filters_key)
+        # global search, resolved from the search indexes of the string columns
+        search = payload.get("search")
+        if isinstance(search, str) and len(search):
+            searched_rows = self.__get_searched_rows(gui, var_name, bound_value, value, columns, search)
+            rows = searched_rows if rows is None else np.intersect1d(rows, searched_rows, assume_unique=True)
+            view_key += ("search", search, tuple(columns))
+        if rows is not None and not paged:
+            value = value.take(rows) if projection is None else value.iloc[rows, projection]
+            is_copied = True
+            rows = None
+            projection = None
+        if projection is not None:
+            value = value.take(projection, axis=1)
+            is_copied = True
 
         if paged:
             aggregates = payload.get("aggregates")
@@ -270,15 +629,30 @@ class _PandasDataAccessor(_DataAccessor):
                 for col in columns:
                     if col not in applies_with_fn.keys():
                         applies_with_fn[col] = "first"
-                try:
-                    value = value.groupby(aggregates).agg(applies_with_fn)
-                except Exception:
-                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+                # aggregated frames are shared by all pages, sorts and clients of the same value
+                aggregates_key = ("aggregates", tuple(aggregates), tuple(applies_with_fn.items()))
+                cache = gui._accessors._get_cache()
+                aggregated = cache.get(var_name, bound_value, view_key + aggregates_key)
+                if aggregated is None:
+                    if rows is not None:
+                        value = value.take(rows)
+                    if _PandasDataAccessor.__INDEX_COL not in value.columns:
+                        # aggregated rows are indexed by their first row
+                        value = value.assign(**{_PandasDataAccessor.__INDEX_COL: value.index})
+                    try:
+                        aggregated = value.groupby(aggregates).agg(applies_with_fn)
+                        cache.set(var_name, bound_value, view_key + aggregates_key, aggregated)
+                    except Exception:
+                        _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+                if aggregated is not None:
+                    value = aggregated
+                    view_key += aggregates_key
+                rows = None
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
             # real number of rows is needed to calculate the number of pages
-            rowcount = len(value)
+            rowcount = len(value) if rows is None else len(rows)
             # here we'll deal with start and end values from payload if present
             if isinstance(payload["start"], int):
                 start = int(payload["start"])
@@ -301,33 +675,93 @@ class _PandasDataAccessor(_DataAccessor):
                 end = rowcount - 1
             # deal with sort
             order_by = payload.get("orderby")
-            if isinstance(order_by, str) and len(order_by):
+            if isinstance(order_by, str):
+                order_by = [order_by] if len(order_by) else []
+            elif not isinstance(order_by, list):
+                order_by = []
+            sort = payload.get("sort")
+            sorts = sort if isinstance(sort, list) else [sort] * len(order_by)
+            descendings = [i < len(sorts) and sorts[i] == "desc" for i in range(len(order_by))]
+            nan_position = payload.get("nanposition")
+            if len(order_by):
                 try:
                     if value.columns.dtype.name == "int64":
-                        order_by = int(order_by)
-                    new_indexes = value[order_by].values.argsort(axis=0)
-                    if payload.get("sort") == "desc":
-                        # reverse order
-                        new_indexes = new_indexes[::-1]
-                    new_indexes = new_indexes[slice(start, end + 1)]
+                        order_by = [int(c) for c in order_by]
+                    new_indexes = None
+                    if len(order_by) == 1 and nan_position is None:
+                        try:
+                            new_indexes = self.__get_sorted_indexes(
+                                gui,
+                                var_name,
+                                bound_value,
+                                value,
+                                order_by[0],
+                                rows,
+                                view_key,
+                                start,
+                                end,
+                                descendings[0],
+                            )
+                        except TypeError:
+                            # values that can't be compared (mixed types) are sorted through their codes
+                            pass
+                    if new_indexes is None:
+                        new_indexes = self.__get_multi_sorted_indexes(
+                            gui,
+                            var_name,
+                            bound_value,
+                            value,
+                            order_by,
+                            descendings,
+                            None if nan_position is None else nan_position == "first",
+                            rows,
+                            view_key,
+                        )[slice(start, end + 1)]
                 except Exception:
-                    _warn(f"Cannot sort {var_name} on columns {order_by}.")
-                    new_indexes = slice(start, end + 1)  # type: ignore
+                    _warn(f"Cannot sort {var_name} on columns {', '.join(str(c) for c in order_by)}.")
+                    new_indexes = None
             else:
-                new_indexes = slice(start, end + 1)  # type: ignore
+                new_indexes = None
+            if new_indexes is None:
+                new_indexes = rows[slice(start, end + 1)] if rows is not None else np.arange(start, end + 1)
+            # positions are relative to the bound value unless it was replaced (aggregation)
+            rows_ref = (var_name, bound_value, view_key if value is not bound_value else (), new_indexes)
+            styles = payload.get("styles")
+            tooltips = payload.get("tooltips")
+            # only the page is copied, with the sent columns unless user functions need whole rows
+            projection = (
+                None
+                if self.__has_user_function(gui, styles, tooltips)
+                else _PandasDataAccessor.__get_projection(value, columns)
+            )
+            value = value.take(new_indexes) if projection is None else value.iloc[new_indexes, projection]
+            if _PandasDataAccessor.__INDEX_COL not in value.columns:
+                value[_PandasDataAccessor.__INDEX_COL] = value.index
             value = self.__build_transferred_cols(
                 gui,
                 columns,
                 value,
-                styles=payload.get("styles"),
-                tooltips=payload.get("tooltips"),
-                is_copied=is_copied,
-                new_indexes=new_indexes,
+                styles=styles,
+                tooltips=tooltips,
+                is_copied=True,
                 handle_nan=payload.get("handlenan", False),
+                rows_ref=rows_ref,
             )
-            dictret = self.__format_data(
-                value, data_format, "records", start, rowcount, handle_nan=payload.get("handlenan", False)
+            # the page is not formatted again if the front-end already holds it
+            # pages are only fingerprinted when the front-end refreshes the page it holds
+            etag = (
+                _PandasDataAccessor.__get_etag(value, data_format.value, start, rowcount, payload.get("handlenan"))
+                if inf is None and payload.get("etag") is not None
+                else None
             )
+            if etag is not None and etag == payload.get("etag"):
+                dictret = {"notModified": True, "etag": etag}
+            else:
+                dictret = self.__format_data(
+                    value, data_format, "records", start, rowcount, handle_nan=payload.get("handlenan", False)
+                )
+                if etag is not None:
+                    dictret["etag"] = etag
         else:
             ret_payload["alldata"] = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
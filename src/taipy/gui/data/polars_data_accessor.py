@@ -0,0 +1,445 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import typing as t
+from datetime import datetime
+from importlib import util
+
+import numpy as np
+import polars as pl
+
+from .._warnings import _warn
+from ..gui import Gui
+from ..types import PropertyType
+from ..utils import _get_date_col_str_name
+from .data_accessor import _AppendedRows, _DataAccessor
+from .data_format import _DataFormat
+from .utils import _get_arrow_stream
+
+_has_arrow_module = util.find_spec("pyarrow") is not None
+
+
+class _PolarsDataAccessor(_DataAccessor):
+    """Data accessor for Polars DataFrame and LazyFrame.
+
+    Filters, sorts, slices and aggregations are applied on a lazy query so that only the
+    rows and columns that are sent to the front-end are materialized.
+    """
+
+    __types = (pl.DataFrame, pl.LazyFrame)
+
+    __INDEX_COL = "_tp_index"
+
+    __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
+
+    __FILTER_OPERATORS: t.Dict[str, str] = {
+        "==": "eq",
+        "!=": "ne",
+        "<": "lt",
+        "<=": "le",
+        ">": "gt",
+        ">=": "ge",
+    }
+
+    # chrono's %f gives nanoseconds: %.6f matches the microseconds of _DataAccessor._WS_DATE_FORMAT
+    __WS_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S%.6fZ"
+
+    __VECTORIZED_TYPE_NAMES = [t.__name__ for t in (pl.DataFrame, pl.Series)]
+
+    @staticmethod
+    def get_supported_classes() -> t.List[str]:
+        # pandas also has a DataFrame class: Polars classes are registered with their qualified names
+        return [f"{t.__module__}.{t.__qualname__}" for t in _PolarsDataAccessor.__types]  # type: ignore
+
+    @staticmethod
+    def __get_schema(value: t.Union[pl.DataFrame, pl.LazyFrame]) -> t.Dict[str, t.Any]:
+        return dict(value.collect_schema() if isinstance(value, pl.LazyFrame) else value.schema)
+
+    @staticmethod
+    def __get_type_name(dtype: t.Any) -> str:
+        # names follow the pandas dtypes expected by the front-end
+        if dtype == pl.Boolean:
+            return "bool"
+        if dtype.is_numeric():
+            return str(dtype).lower()
+        if dtype == pl.Date:
+            return "datetime64[ms]"
+        if isinstance(dtype, pl.Datetime):
+            return (
+                f"datetime64[{dtype.time_unit}, {dtype.time_zone}]"
+                if dtype.time_zone
+                else f"datetime64[{dtype.time_unit}]"
+            )
+        return "object"
+
+    def append_rows(self, value: t.Any, rows: t.Any) -> t.Optional[_AppendedRows]:
+        # lazy frames don't know their number of rows
+        if not isinstance(value, pl.DataFrame):
+            return None
+        if not isinstance(rows, pl.DataFrame):
+            rows = pl.DataFrame(rows, schema=value.schema, orient="row" if isinstance(rows, (list, tuple)) else None)
+        value = pl.concat([value, rows], how="vertical_relaxed")
+        return _AppendedRows(value, rows, value.height - rows.height, value.height)
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if isinstance(value, _PolarsDataAccessor.__types):  # type: ignore
+            return {
+                str(k): _PolarsDataAccessor.__get_type_name(v)
+                for k, v in _PolarsDataAccessor.__get_schema(value).items()
+            }
+        return None
+
+    @staticmethod
+    def __is_vectorized(user_function: t.Callable) -> bool:
+        # functions that declare a Polars parameter are called once with all the rows
+        try:
+            parameters = inspect.signature(user_function).parameters.values()
+        except (TypeError, ValueError):
+            return False
+        return any(
+            p.annotation in (pl.DataFrame, pl.Series)
+            or str(p.annotation).split(".")[-1] in _PolarsDataAccessor.__VECTORIZED_TYPE_NAMES
+            for p in parameters
+        )
+
+    def __apply_user_function(
+        self,
+        gui: Gui,
+        user_function: t.Callable,
+        column_name: t.Optional[str],
+        function_name: str,
+        data: pl.DataFrame,
+        prefix: t.Optional[str],
+    ) -> t.Tuple[pl.DataFrame, t.Union[str, bool]]:
+        try:
+            new_col_name = f"{prefix}{column_name}__{function_name}" if column_name else function_name
+            index = data[_PolarsDataAccessor.__INDEX_COL] if _PolarsDataAccessor.__INDEX_COL in data.columns else None
+            if _PolarsDataAccessor.__is_vectorized(user_function):
+                args = [data[column_name], index, data, column_name] if column_name else [index, data]
+                ret = gui._call_function_with_state(user_function, args)
+                values = ret.to_list() if isinstance(ret, pl.Series) else list(ret)
+            else:
+                values = []
+                for i, row in enumerate(data.iter_rows(named=True)):
+                    args = [row[column_name]] if column_name else []
+                    args.extend((i if index is None else index[i], row))
+                    if column_name:
+                        args.append(column_name)
+                    try:
+                        values.append(gui._call_function_with_state(user_function, args))
+                    except Exception as e:
+                        _warn(f"Exception raised when calling user function {function_name}()", e)
+                        values.append("")
+            values = ["" if v is None else str(v) for v in values]
+            return data.with_columns(pl.Series(new_col_name, values, dtype=pl.String)), new_col_name
+        except Exception as e:
+            _warn(f"Exception raised when invoking user function {function_name}()", e)
+        return data, False
+
+    def __has_user_function(self, gui: Gui, *functions: t.Optional[t.Dict[str, str]]) -> bool:
+        return any(callable(gui._get_user_function(v)) for f in functions if f for v in f.values())
+
+    def __build_transferred_cols(
+        self,
+        gui: Gui,
+        payload_cols: t.Any,
+        data: pl.DataFrame,
+        styles: t.Optional[t.Dict[str, str]] = None,
+        tooltips: t.Optional[t.Dict[str, str]] = None,
+        handle_nan: t.Optional[bool] = False,
+    ) -> pl.DataFrame:
+        if isinstance(payload_cols, list) and len(payload_cols):
+            cols = [c for c in data.columns if c in payload_cols]
+        else:
+            cols = list(data.columns)
+        col_types = {c: data.schema[c] for c in cols}
+        for user_functions, prefix in ((styles, "tps__"), (tooltips, "tpt__")):
+            for k, v in (user_functions or {}).items():
+                col_applied: t.Union[str, bool] = False
+                func = gui._get_user_function(v)
+                if callable(func):
+                    data, col_applied = self.__apply_user_function(gui, func, k if k in cols else None, v, data, prefix)
+                if not col_applied and prefix == "tps__":
+                    data = data.with_columns(pl.lit(v).alias(v))
+                cols.append(col_applied or v)
+        # deal with dates
+        datecols = [c for c, dt in col_types.items() if dt == pl.Date or isinstance(dt, pl.Datetime)]
+        if len(datecols) != 0:
+            tz = Gui._get_timezone()
+            date_exprs = []
+            for col in datecols:
+                newcol = _get_date_col_str_name(cols, col)
+                cols.append(newcol)
+                expr = pl.col(col).cast(pl.Datetime) if col_types[col] == pl.Date else pl.col(col)
+                if not getattr(col_types[col], "time_zone", None):
+                    expr = expr.dt.replace_time_zone(tz, ambiguous="earliest", non_existent="null")
+                expr = expr.dt.convert_time_zone("UTC").dt.strftime(_PolarsDataAccessor.__WS_DATE_FORMAT).alias(newcol)
+                date_exprs.append(expr.fill_null("NaT") if handle_nan else expr)
+            data = data.with_columns(date_exprs)
+            # remove the date columns from the list of columns
+            cols = [c for c in cols if c not in datecols]
+        return data.select([c for c in data.columns if c in cols])
+
+    @staticmethod
+    def __get_filter_expr(schema: t.Dict[str, t.Any], fd: t.Dict[str, t.Any]) -> pl.Expr:
+        col = fd.get("col")
+        val = fd.get("value")
+        action = fd.get("action")
+        if col not in schema:
+            raise KeyError(col)
+        if isinstance(val, str) and (schema[col] == pl.Date or isinstance(schema[col], pl.Datetime)):
+            val = datetime.fromisoformat(val[:-1])
+        if action == "contains":
+            return pl.col(col).cast(pl.String).str.contains(str(val))
+        op = _PolarsDataAccessor.__FILTER_OPERATORS.get(action)  # type: ignore
+        if op is None:
+            raise ValueError(f"Unknown filter action '{action}'")
+        return getattr(pl.col(col), op)(val)
+
+    def __get_aggregate_expr(self, gui: Gui, col: str, apply: t.Any) -> pl.Expr:
+        if apply in _PolarsDataAccessor.__AGGREGATE_FUNCTIONS:
+            return getattr(pl.col(col), apply)()
+        user_function = gui._get_user_function(apply)
+        if not callable(user_function):
+            raise ValueError(f"Unknown aggregate function '{apply}'")
+        return pl.col(col).map_elements(user_function, returns_scalar=True)
+
+    @staticmethod
+    def __checked(query: pl.LazyFrame, transform: t.Callable[[pl.LazyFrame], pl.LazyFrame]) -> pl.LazyFrame:
+        # type errors are only raised when a query runs: the transformation is tried on an empty frame first
+        transform(pl.LazyFrame(schema=query.collect_schema())).collect()
+        return transform(query)
+
+    @staticmethod
+    def __get_int_value(value: t.Any, default: int) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value), base=10)
+        except Exception:
+            return default
+
+    def __format_data(
+        self,
+        data: pl.DataFrame,
+        data_format: _DataFormat,
+        orient: str,
+        start: t.Optional[int] = None,
+        rowcount: t.Optional[int] = None,
+        data_extraction: t.Optional[bool] = None,
+    ) -> t.Dict[str, t.Any]:
+        ret: t.Dict[str, t.Any] = {
+            "format": str(data_format.value),
+        }
+        if rowcount is not None:
+            ret["rowcount"] = rowcount
+        if start is not None:
+            ret["start"] = start
+        if data_extraction is not None:
+            ret["dataExtraction"] = data_extraction  # Extract data out of dictionary on front-end
+        if data_format == _DataFormat.APACHE_ARROW:
+            if not _has_arrow_module:
+                raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
+            # Polars data already is in the Arrow format: the oldest layout is the one the front-end can read
+            table = data.to_arrow(compat_level=pl.CompatLevel.oldest())
+            ret["data"] = _get_arrow_stream(table)
+            ret["orient"] = orient
+        else:
+            # NaN can't be represented in JSON
+            data = data.with_columns(pl.col(pl.Float32, pl.Float64).fill_nan(None))
+            ret["data"] = data.to_dicts() if orient == "records" else data.to_dict(as_series=False)
+        return ret
+
+    def __get_rowcount(self, gui: Gui, var_name: str, value: t.Any, query: pl.LazyFrame, view_key: t.Tuple) -> int:
+        if not view_key and isinstance(value, pl.DataFrame):
+            return len(value)
+        # counting may run the whole query: the result is shared by all the pages of the same view
+        cache = gui._accessors._get_cache()
+        rowcount = cache.get(var_name, value, ("rowcount", view_key))
+        if rowcount is None:
+            rowcount = cache.set(var_name, value, ("rowcount", view_key), query.select(pl.len()).collect().item())
+        return rowcount
+
+    def __get_data(  # noqa: C901
+        self,
+        gui: Gui,
+        var_name: str,
+        value: t.Union[pl.DataFrame, pl.LazyFrame],
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+    ) -> t.Dict[str, t.Any]:
+        columns = list(payload.get("columns", []))
+        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
+        paged = not payload.get("alldata", False)
+        schema = _PolarsDataAccessor.__get_schema(value)
+        query = value.lazy()
+        # the index column holds the row positions in the bound value
+        has_index = _PolarsDataAccessor.__INDEX_COL in schema
+        if not has_index:
+            query = query.with_row_index(_PolarsDataAccessor.__INDEX_COL)
+        view_key: t.Tuple[t.Any, ...] = ()
+
+        # add index if not chart
+        if paged and columns and _PolarsDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PolarsDataAccessor.__INDEX_COL)
+
+        # filtering
+        filters = payload.get("filters")
+        if isinstance(filters, list) and len(filters) > 0:
+            try:
+                filter_expr = pl.all_horizontal([self.__get_filter_expr(schema, fd) for fd in filters])
+                query = _PolarsDataAccessor.__checked(query, lambda q: q.filter(filter_expr))
+                view_key += (
+                    "filters",
+                    tuple((fd.get("col"), fd.get("action"), repr(fd.get("value"))) for fd in filters),
+                )
+            except Exception as e:
+                _warn(f"Dataframe filtering: invalid filters {filters} on {var_name}", e)
+
+        if paged:
+            aggregates = payload.get("aggregates")
+            applies = payload.get("applies")
+            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
+                applies = dict(applies)
+                for col in columns:
+                    if col not in applies.keys():
+                        applies[col] = "first"
+                try:
+                    agg_exprs = [
+                        self.__get_aggregate_expr(gui, k, v) for k, v in applies.items() if k not in aggregates
+                    ]
+                    # rows with a null key are dropped, as pandas does
+                    query = _PolarsDataAccessor.__checked(
+                        query,
+                        lambda q: q.drop_nulls(aggregates)
+                        .group_by(aggregates)
+                        .agg(agg_exprs)
+                        .sort(aggregates, maintain_order=True),
+                    )
+                    view_key += ("aggregates", tuple(aggregates), tuple(applies.items()))
+                except Exception as e:
+                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.", e)
+            inf = payload.get("infinite")
+            if inf is not None:
+                ret_payload["infinite"] = inf
+            # real number of rows is needed to calculate the number of pages
+            rowcount = self.__get_rowcount(gui, var_name, value, query, view_key)
+            start = _PolarsDataAccessor.__get_int_value(payload.get("start"), 0)
+            end = _PolarsDataAccessor.__get_int_value(payload.get("end"), -1)
+            if start < 0 or start >= rowcount:
+                start = 0
+            if end < 0 or end >= rowcount:
+                end = rowcount - 1
+            # deal with sort
+            order_by = payload.get("orderby")
+            if isinstance(order_by, str):
+                order_by = [order_by] if len(order_by) else []
+            elif not isinstance(order_by, list):
+                order_by = []
+            sort = payload.get("sort")
+            sorts = sort if isinstance(sort, list) else [sort] * len(order_by)
+            descendings = [i < len(sorts) and sorts[i] == "desc" for i in range(len(order_by))]
+            nan_position = payload.get("nanposition")
+            query_schema = query.collect_schema()
+            # only the columns that are sent are collected, user functions receive whole rows
+            if columns and not self.__has_user_function(gui, payload.get("styles"), payload.get("tooltips")):
+                query = query.select([c for c in query_schema.names() if c in columns or c in order_by])
+            data = None
+            if len(order_by):
+                try:
+                    # NaN values are sorted as nulls: last when ascending and first when descending unless specified
+                    data = (
+                        query.sort(
+                            [pl.col(c).fill_nan(None) if query_schema[c].is_float() else pl.col(c) for c in order_by],
+                            descending=descendings,
+                            nulls_last=[not d if nan_position is None else nan_position == "last" for d in descendings],
+                            maintain_order=True,
+                        )
+                        .slice(start, end + 1 - start)
+                        .collect()
+                    )
+                except Exception as e:
+                    _warn(f"Cannot sort {var_name} on columns {', '.join(str(c) for c in order_by)}.", e)
+            if data is None:
+                data = query.slice(start, end + 1 - start).collect()
+            data = self.__build_transferred_cols(
+                gui,
+                columns,
+                data,
+                styles=payload.get("styles"),
+                tooltips=payload.get("tooltips"),
+                handle_nan=payload.get("handlenan", False),
+            )
+            dictret = self.__format_data(data, data_format, "records", start, rowcount)
+        else:
+            ret_payload["alldata"] = True
+            decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
+            decimators = decimator_payload.get("decimators", [])
+            nb_rows_max = decimator_payload.get("width")
+            # only the columns used by the chart are collected
+            if not columns:
+                columns = list(schema.keys())
+            # the index column is used as x values by the decimators
+            query = query.select(
+                [c for c in query.collect_schema().names() if c in columns or c == _PolarsDataAccessor.__INDEX_COL]
+            )
+            data = query.collect()
+            for decimator_pl in decimators:
+                decimator = decimator_pl.get("decimator")
+                decimator_instance = (
+                    gui._get_user_instance(decimator, PropertyType.decimator.value) if decimator is not None else None
+                )
+                if isinstance(decimator_instance, PropertyType.decimator.value):
+                    x_column, y_column, z_column = (
+                        decimator_pl.get("xAxis", "") or _PolarsDataAccessor.__INDEX_COL,
+                        decimator_pl.get("yAxis", ""),
+                        decimator_pl.get("zAxis", ""),
+                    )
+                    chart_mode = decimator_pl.get("chartMode", "")
+                    if decimator_instance._zoom and "relayoutData" in decimator_payload and not z_column:
+                        relayoutData = decimator_payload.get("relayoutData", {})
+                        x0 = relayoutData.get("xaxis.range[0]")
+                        x1 = relayoutData.get("xaxis.range[1]")
+                        y0 = relayoutData.get("yaxis.range[0]")
+                        y1 = relayoutData.get("yaxis.range[1]")
+                        if (
+                            chart_mode in ["lines+markers", "markers"]
+                            and x0 is not None
+                            and x1 is not None
+                            and y0 is not None
+                            and y1 is not None
+                        ):
+                            expr = (pl.col(x_column) > x0) & (pl.col(x_column) < x1)
+                            if chart_mode == "markers":
+                                expr = expr & (pl.col(y_column) > y0) & (pl.col(y_column) < y1)
+                            data = data.filter(expr)
+
+                    if nb_rows_max and decimator_instance._is_applicable(data, nb_rows_max, chart_mode):
+                        try:
+                            # the decimator only reads the columns of the trace
+                            points = data.select([c for c in (x_column, y_column, z_column) if c]).to_numpy()
+                            mask = decimator_instance.decimate(points, decimator_payload)
+                            data = data.filter(pl.Series(np.asarray(mask, dtype=bool)))
+                            gui._call_on_change(f"{var_name}.{decimator}.nb_rows", len(data))
+                        except Exception as e:
+                            _warn(f"Limit rows error with {decimator} for Dataframe", e)
+            data = self.__build_transferred_cols(gui, columns, data)
+            dictret = self.__format_data(data, data_format, "list", data_extraction=True)
+        ret_payload["value"] = dictret
+        return ret_payload
+
+    def get_data(
+        self, gui: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if isinstance(value, _PolarsDataAccessor.__types):  # type: ignore
+            return self.__get_data(gui, var_name, value, payload, data_format)
+        return {}
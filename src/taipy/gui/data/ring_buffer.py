@@ -0,0 +1,157 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from threading import Lock
+
+import numpy as np
+
+
+class RingBuffer:
+    """The last rows of tabular data that is continuously produced.
+
+    A `RingBuffer` holds at most *capacity* rows. Its columns are Numpy arrays that are
+    allocated once: when the buffer is full, appending rows overwrites the oldest ones.
+
+    A `RingBuffer` can be bound to the *data* property of tables and charts. Pages and
+    chart data are read from the buffer itself: only the rows that are sent are copied.
+
+    Rows can be appended from any thread. Because the buffer is modified in place, the
+    user interface must be notified that the data has changed, with
+    `State.refresh()^` or `Gui.broadcast_change()^` for example.
+
+    Attributes:
+        capacity (int): The maximum number of rows the buffer holds.
+        columns (List[str]): The names of the columns.
+    """
+
+    __slots__ = ("__capacity", "__arrays", "__start", "__size", "__lock")
+
+    def __init__(self, columns: t.Union[t.Dict[str, t.Any], t.Sequence[str]], capacity: int) -> None:
+        """Initialize a new RingBuffer.
+
+        Arguments:
+            columns (Union[Dict[str, Any], Sequence[str]]): The columns of the buffer.<br/>
+                This can be a dictionary that maps the column names to their Numpy data
+                type (use `object` for text columns), or a sequence of column names: these
+                columns hold floating-point numbers.
+            capacity (int): The maximum number of rows the buffer holds.
+        """
+        if capacity < 1:
+            raise ValueError("The capacity of a RingBuffer must be at least 1")
+        if not isinstance(columns, dict):
+            columns = {c: np.float64 for c in columns}
+        if not columns:
+            raise ValueError("A RingBuffer must have at least one column")
+        self.__capacity = capacity
+        self.__arrays: t.Dict[str, np.ndarray] = {
+            str(n): np.empty(capacity, dtype=object if d is str else d) for n, d in columns.items()
+        }
+        # position of the oldest row in the arrays
+        self.__start = 0
+        self.__size = 0
+        self.__lock = Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    @property
+    def columns(self) -> t.List[str]:
+        return list(self.__arrays.keys())
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def append(self, row: t.Union[t.Dict[str, t.Any], t.Sequence[t.Any]]) -> None:
+        """Append a row.
+
+        Arguments:
+            row (Union[Dict[str, Any], Sequence[Any]]): The values of the row, indexed by
+                column name or in the order of the columns.
+        """
+        self.extend([row])
+
+    def extend(self, rows: t.Union[t.Dict[str, t.Any], t.Sequence[t.Any]]) -> None:
+        """Append several rows.
+
+        If there are more rows than the capacity of the buffer, only the last ones are kept.
+
+        Arguments:
+            rows (Union[Dict[str, Any], Sequence[Any]]): A dictionary that maps the column
+                names to the sequences of their values, or a sequence of rows, each row
+                being a dictionary or a sequence of values in the order of the columns.
+        """
+        names = list(self.__arrays.keys())
+        if isinstance(rows, dict):
+            values = [np.asarray(rows[n]) for n in names]
+        else:
+            values = [
+                np.asarray([r[n] if isinstance(r, dict) else r[i] for r in rows], dtype=self.__arrays[n].dtype)
+                for i, n in enumerate(names)
+            ]
+        nb_rows = len(values[0])
+        if any(len(v) != nb_rows for v in values):
+            raise ValueError("All the columns must have the same number of values")
+        capacity = self.__capacity
+        if nb_rows > capacity:
+            values = [v[-capacity:] for v in values]
+        count = min(nb_rows, capacity)
+        with self.__lock:
+            first = (self.__start + self.__size) % capacity
+            # at most two copies per column: up to the end of the array, then from its beginning
+            head = min(count, capacity - first)
+            for n, v in zip(names, values):
+                array = self.__arrays[n]
+                array[first : first + head] = v[:head]
+                array[: count - head] = v[head:]
+            overwritten = max(0, self.__size + count - capacity)
+            self.__start = (self.__start + overwritten) % capacity
+            self.__size = min(self.__size + count, capacity)
+
+    def clear(self) -> None:
+        """Remove all the rows."""
+        with self.__lock:
+            self.__start = 0
+            self.__size = 0
+
+    def to_dict(self) -> t.Dict[str, np.ndarray]:
+        """Return a copy of the rows.
+
+        Returns:
+            A dictionary that maps the column names to arrays holding their values, from the
+                oldest to the latest row.
+        """
+        return self._read(self.columns)[2]
+
+    def _get_dtypes(self) -> t.Dict[str, np.dtype]:
+        return {n: a.dtype for n, a in self.__arrays.items()}
+
+    def _read(self, columns: t.List[str], start: int = 0, end: int = -1) -> t.Tuple[int, int, t.Dict[str, np.ndarray]]:
+        # rows start to end (included) of columns are copied while no row is appended
+        # returns the number of rows, the actual start and the values
+        with self.__lock:
+            size = self.__size
+            if start < 0 or start >= size:
+                start = 0
+            if end < 0 or end >= size:
+                end = size - 1
+            count = end + 1 - start
+            first = (self.__start + start) % self.__capacity
+            head = min(count, self.__capacity - first)
+            values = {}
+            for c in columns:
+                array = self.__arrays[c]
+                if head == count:
+                    values[c] = array[first : first + count].copy()
+                else:
+                    values[c] = np.concatenate((array[first:], array[: count - head]))
+            return size, start, values
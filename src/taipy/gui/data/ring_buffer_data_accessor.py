@@ -0,0 +1,368 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import operator
+import re
+import typing as t
+
+import numpy as np
+import pandas as pd
+
+from .._warnings import _warn
+from ..gui import Gui
+from ..types import PropertyType
+from ..utils import _get_date_col_str_name
+from .data_accessor import _DataAccessor
+from .data_format import _DataFormat
+from .ring_buffer import RingBuffer
+from .utils import _get_arrow_stream
+
+
+class _RingBufferDataAccessor(_DataAccessor):
+    """Data accessor for ring buffers.
+
+    Pages are copied out of the buffer arrays with no intermediate DataFrame. Filters and
+    sorts are computed on copies of the columns they need, read with the page columns while
+    no row can be appended.
+    Aggregation is not supported.
+    The index column holds the row positions in the buffer, from the oldest row.
+    """
+
+    __types = (RingBuffer,)
+
+    __INDEX_COL = "_tp_index"
+
+    __FILTER_OPERATORS: t.Dict[str, t.Callable] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+    }
+
+    @staticmethod
+    def get_supported_classes() -> t.List[str]:
+        return [t.__name__ for t in _RingBufferDataAccessor.__types]  # type: ignore
+
+    @staticmethod
+    def __get_type_name(dtype: np.dtype) -> str:
+        return "object" if dtype.kind in "OUS" else dtype.name
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if isinstance(value, _RingBufferDataAccessor.__types):  # type: ignore
+            return {n: _RingBufferDataAccessor.__get_type_name(d) for n, d in value._get_dtypes().items()}
+        return None
+
+    @staticmethod
+    def __get_nan_mask(values: np.ndarray) -> np.ndarray:
+        if values.dtype.kind in "fc":
+            return np.isnan(values)
+        if values.dtype.kind in "mM":
+            return np.isnat(values)
+        if values.dtype.kind == "O":
+            return np.fromiter((v is None or v != v for v in values), dtype=bool, count=len(values))
+        return np.zeros(len(values), dtype=bool)
+
+    @staticmethod
+    def __get_filter_mask(values: np.ndarray, fd: t.Dict[str, t.Any]) -> np.ndarray:
+        val = fd.get("value")
+        action = fd.get("action")
+        if isinstance(val, str) and values.dtype.kind == "M":
+            val = np.datetime64(val[:-1] if val.endswith("Z") else val)
+        if action == "contains":
+            pattern = re.compile(str(val))
+            return np.fromiter(
+                (v is not None and pattern.search(str(v)) is not None for v in values), dtype=bool, count=len(values)
+            )
+        op = _RingBufferDataAccessor.__FILTER_OPERATORS.get(action)  # type: ignore
+        if op is None:
+            raise ValueError(f"Unknown filter action '{action}'")
+        return np.asarray(op(values, val), dtype=bool)
+
+    @staticmethod
+    def __get_sorted_positions(
+        values: t.Dict[str, np.ndarray],
+        order_by: t.List[str],
+        descendings: t.List[bool],
+        nan_position: t.Optional[str],
+    ) -> np.ndarray:
+        keys = []
+        for col, descending in zip(order_by, descendings):
+            column = values[col]
+            nans = _RingBufferDataAccessor.__get_nan_mask(column)
+            # ranks of the values, NaN and None last when ascending and first when descending unless specified
+            uniques, ranks = np.unique(column[~nans], return_inverse=True)
+            key = np.empty(len(column), dtype=np.int64)
+            key[~nans] = len(uniques) - 1 - ranks.reshape(-1) if descending else ranks.reshape(-1)
+            nan_first = descending if nan_position is None else nan_position == "first"
+            key[nans] = -1 if nan_first else len(uniques)
+            keys.append(key)
+        # the last key is the primary key of lexsort, that is stable
+        return np.lexsort(keys[::-1])
+
+    @staticmethod
+    def __apply_user_function(
+        gui: Gui,
+        user_function: t.Callable,
+        column_name: t.Optional[str],
+        function_name: str,
+        rows: t.List[t.Dict[str, t.Any]],
+    ) -> np.ndarray:
+        values = []
+        for row in rows:
+            args = [row[column_name]] if column_name else []
+            args.extend((row.get(_RingBufferDataAccessor.__INDEX_COL), row))
+            if column_name:
+                args.append(column_name)
+            try:
+                ret = gui._call_function_with_state(user_function, args)
+                values.append("" if ret is None else str(ret))
+            except Exception as e:
+                _warn(f"Exception raised when calling user function {function_name}()", e)
+                values.append("")
+        return np.array(values, dtype=object)
+
+    def __build_transferred_cols(
+        self,
+        gui: Gui,
+        payload_cols: t.List[str],
+        values: t.Dict[str, np.ndarray],
+        styles: t.Optional[t.Dict[str, str]] = None,
+        tooltips: t.Optional[t.Dict[str, str]] = None,
+        handle_nan: t.Optional[bool] = False,
+    ) -> t.Dict[str, np.ndarray]:
+        cols = [c for c in values.keys() if c in payload_cols]
+        nb_rows = len(next(iter(values.values()))) if values else 0
+        ret = {c: values[c] for c in cols}
+        if styles or tooltips:
+            rows = [dict(zip(ret.keys(), r)) for r in zip(*ret.values())]
+            for user_functions, prefix in ((styles, "tps__"), (tooltips, "tpt__")):
+                for k, v in (user_functions or {}).items():
+                    func = gui._get_user_function(v)
+                    if callable(func):
+                        ret[f"{prefix}{k}__{v}" if k in cols else v] = _RingBufferDataAccessor.__apply_user_function(
+                            gui, func, k if k in cols else None, v, rows
+                        )
+                    elif prefix == "tps__":
+                        ret[v] = np.full(nb_rows, v, dtype=object)
+        # deal with dates
+        datecols = [c for c in cols if values[c].dtype.kind == "M"]
+        if len(datecols) != 0:
+            tz = Gui._get_timezone()
+            for col in datecols:
+                newcol = _get_date_col_str_name(list(ret.keys()), col)
+                dates = pd.DatetimeIndex(ret.pop(col)).tz_localize(tz).tz_convert("UTC")
+                strings = np.asarray(dates.strftime(_DataAccessor._WS_DATE_FORMAT), dtype=object)
+                strings[np.asarray(dates.isna())] = "NaT" if handle_nan else None
+                ret[newcol] = strings
+        return ret
+
+    def __format_data(
+        self,
+        values: t.Dict[str, np.ndarray],
+        data_format: _DataFormat,
+        orient: str,
+        start: t.Optional[int] = None,
+        rowcount: t.Optional[int] = None,
+        data_extraction: t.Optional[bool] = None,
+    ) -> t.Dict[str, t.Any]:
+        ret: t.Dict[str, t.Any] = {
+            "format": str(data_format.value),
+        }
+        if rowcount is not None:
+            ret["rowcount"] = rowcount
+        if start is not None:
+            ret["start"] = start
+        if data_extraction is not None:
+            ret["dataExtraction"] = data_extraction  # Extract data out of dictionary on front-end
+        if data_format == _DataFormat.APACHE_ARROW:
+            import pyarrow as pa
+
+            ret["data"] = _get_arrow_stream(pa.table(values))
+            ret["orient"] = orient
+        else:
+            lists = {}
+            for c, v in values.items():
+                if v.dtype.kind in "fc":
+                    # NaN can't be represented in JSON
+                    v = v.astype(object)
+                    v[_RingBufferDataAccessor.__get_nan_mask(values[c])] = None
+                lists[c] = v.tolist()
+            ret["data"] = [dict(zip(lists.keys(), r)) for r in zip(*lists.values())] if orient == "records" else lists
+        return ret
+
+    @staticmethod
+    def __get_int_value(value: t.Any, default: int) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value), base=10)
+        except Exception:
+            return default
+
+    def __get_page(  # noqa: C901
+        self,
+        gui: Gui,
+        var_name: str,
+        value: RingBuffer,
+        payload: t.Dict[str, t.Any],
+        columns: t.List[str],
+        data_format: _DataFormat,
+    ) -> t.Dict[str, t.Any]:
+        start = _RingBufferDataAccessor.__get_int_value(payload.get("start"), 0)
+        end = _RingBufferDataAccessor.__get_int_value(payload.get("end"), -1)
+        if payload.get("aggregates"):
+            _warn(f"Cannot aggregate {var_name}: aggregation is not supported for RingBuffer objects.")
+        filters = payload.get("filters")
+        if not isinstance(filters, list):
+            filters = []
+        filters = [fd for fd in filters if fd.get("col") in value.columns]
+        # deal with sort
+        order_by = payload.get("orderby")
+        if isinstance(order_by, str):
+            order_by = [order_by] if len(order_by) else []
+        elif not isinstance(order_by, list):
+            order_by = []
+        order_by = [c for c in order_by if c in value.columns]
+        if not filters and not order_by:
+            # only the page is copied out of the buffer
+            rowcount, start, values = value._read(columns, start, end)
+            positions = np.arange(start, start + len(values[columns[0]]))
+        else:
+            needed = list(dict.fromkeys([*columns, *(fd.get("col") for fd in filters), *order_by]))
+            _, _, values = value._read(needed)  # type: ignore[arg-type]
+            positions = np.arange(len(values[needed[0]]))
+            for fd in filters:
+                try:
+                    mask = _RingBufferDataAccessor.__get_filter_mask(values[fd.get("col")][positions], fd)
+                    positions = positions[mask]
+                except Exception as e:
+                    _warn(f"Dataframe filtering: invalid filter {fd} on {var_name}", e)
+            if order_by:
+                sort = payload.get("sort")
+                sorts = sort if isinstance(sort, list) else [sort] * len(order_by)
+                descendings = [i < len(sorts) and sorts[i] == "desc" for i in range(len(order_by))]
+                try:
+                    positions = positions[
+                        _RingBufferDataAccessor.__get_sorted_positions(
+                            {c: values[c][positions] for c in order_by},
+                            order_by,
+                            descendings,
+                            payload.get("nanposition"),
+                        )
+                    ]
+                except Exception as e:
+                    _warn(f"Cannot sort {var_name} on columns {', '.join(str(c) for c in order_by)}.", e)
+            rowcount = len(positions)
+            if start < 0 or start >= rowcount:
+                start = 0
+            if end < 0 or end >= rowcount:
+                end = rowcount - 1
+            positions = positions[start : end + 1]
+            values = {c: values[c][positions] for c in columns}
+        values[_RingBufferDataAccessor.__INDEX_COL] = positions
+        values = self.__build_transferred_cols(
+            gui,
+            [*columns, _RingBufferDataAccessor.__INDEX_COL],
+            values,
+            styles=payload.get("styles"),
+            tooltips=payload.get("tooltips"),
+            handle_nan=payload.get("handlenan", False),
+        )
+        ret_payload: t.Dict[str, t.Any] = {"pagekey": payload.get("pagekey", "unknown page")}
+        inf = payload.get("infinite")
+        if inf is not None:
+            ret_payload["infinite"] = inf
+        ret_payload["value"] = self.__format_data(values, data_format, "records", start, rowcount)
+        return ret_payload
+
+    def __get_chart_data(
+        self,
+        gui: Gui,
+        var_name: str,
+        value: RingBuffer,
+        payload: t.Dict[str, t.Any],
+        columns: t.List[str],
+        data_format: _DataFormat,
+    ) -> t.Dict[str, t.Any]:
+        decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
+        decimators = decimator_payload.get("decimators", [])
+        nb_rows_max = decimator_payload.get("width")
+        # the axes of the decimators are read with the chart columns
+        axes = [d.get(a) for d in decimators for a in ("xAxis", "yAxis", "zAxis")]
+        needed = list(dict.fromkeys([*columns, *(a for a in axes if a in value.columns)]))
+        _, _, values = value._read(needed)
+        positions = np.arange(len(values[needed[0]]))
+        for decimator_pl in decimators:
+            decimator = decimator_pl.get("decimator")
+            decimator_instance = (
+                gui._get_user_instance(decimator, PropertyType.decimator.value) if decimator is not None else None
+            )
+            if isinstance(decimator_instance, PropertyType.decimator.value):
+                x_column, y_column, z_column = (
+                    decimator_pl.get("xAxis", ""),
+                    decimator_pl.get("yAxis", ""),
+                    decimator_pl.get("zAxis", ""),
+                )
+                chart_mode = decimator_pl.get("chartMode", "")
+                if decimator_instance._zoom and "relayoutData" in decimator_payload and not z_column:
+                    relayoutData = decimator_payload.get("relayoutData", {})
+                    x0 = relayoutData.get("xaxis.range[0]")
+                    x1 = relayoutData.get("xaxis.range[1]")
+                    y0 = relayoutData.get("yaxis.range[0]")
+                    y1 = relayoutData.get("yaxis.range[1]")
+                    if (
+                        chart_mode in ["lines+markers", "markers"]
+                        and x0 is not None
+                        and x1 is not None
+                        and y0 is not None
+                        and y1 is not None
+                    ):
+                        x_values = values[x_column][positions] if x_column else positions
+                        mask = (x_values > x0) & (x_values < x1)
+                        if chart_mode == "markers":
+                            y_values = values[y_column][positions]
+                            mask &= (y_values > y0) & (y_values < y1)
+                        positions = positions[mask]
+
+                if nb_rows_max and decimator_instance._is_applicable(positions, nb_rows_max, chart_mode):
+                    try:
+                        # the decimator only reads the columns of the trace
+                        points = np.column_stack(
+                            [
+                                values[c][positions] if c else positions
+                                for c in ([x_column, y_column, z_column] if z_column else [x_column, y_column])
+                            ]
+                        )
+                        mask = decimator_instance.decimate(points, decimator_payload)
+                        positions = positions[np.asarray(mask, dtype=bool)]
+                        gui._call_on_change(f"{var_name}.{decimator}.nb_rows", len(positions))
+                    except Exception as e:
+                        _warn(f"Limit rows error with {decimator} for RingBuffer", e)
+        values = self.__build_transferred_cols(gui, columns, {c: values[c][positions] for c in columns})
+        return {
+            "pagekey": payload.get("pagekey", "unknown page"),
+            "alldata": True,
+            "value": self.__format_data(values, data_format, "list", data_extraction=True),
+        }
+
+    def get_data(
+        self, gui: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if isinstance(value, _RingBufferDataAccessor.__types):  # type: ignore
+            columns = [c for c in payload.get("columns", []) if c in value.columns]
+            if not columns:
+                columns = value.columns
+            if payload.get("alldata", False):
+                return self.__get_chart_data(gui, var_name, value, payload, columns, data_format)
+            return self.__get_page(gui, var_name, value, payload, columns, data_format)
+        return {}
@@ -0,0 +1,112 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+import typing as t
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+
+
+class _SearchIndex(object):
+    """Trigram index of the values of a string column.
+
+    The trigrams of the lower-cased values are encoded as integers (21 bits per code point)
+    and mapped to the sorted positions of the rows that hold them. Values that are shorter
+    than a trigram are indexed as a whole, their missing code points being 0.
+    A search intersects the rows of the trigrams of the searched text, then checks the
+    remaining candidates when the text is longer than a trigram.
+    """
+
+    __GRAM_SIZE = 3
+    __BITS = 21
+
+    def __init__(self, column: pd.Series) -> None:
+        bits = _SearchIndex.__BITS
+        # values that are not strings are not indexed
+        try:
+            strings = column.str.lower()
+        except AttributeError:
+            strings = None
+        self.__texts: np.ndarray = (
+            np.full(len(column), None, dtype=object) if strings is None else strings.to_numpy(dtype=object)
+        )
+        positions = np.flatnonzero([isinstance(v, str) and len(v) > 0 for v in self.__texts])
+        texts = self.__texts[positions]
+        lengths = np.fromiter((len(v) for v in texts), dtype=np.int64, count=len(texts))
+        # all the values in a single array of code points, each value followed by two separators
+        chars = np.frombuffer(
+            "".join(v + "\0\0" for v in texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32
+        ).astype(np.int64)
+        char_rows = np.repeat(positions, lengths + 2)
+        ends = np.cumsum(lengths + 2)
+        char_rows[ends - 1] = -1
+        char_rows[ends - 2] = -1
+        codes = (chars[:-2] << (2 * bits)) | (chars[1:-1] << bits) | chars[2:]
+        # the trigrams of a value, and the short values padded with the separators
+        keep = (char_rows[:-2] == char_rows[2:]) & (char_rows[:-2] >= 0)
+        keep[(ends - lengths - 2)[lengths < _SearchIndex.__GRAM_SIZE]] = True
+        codes = codes[keep]
+        rows = char_rows[:-2][keep]
+        # the rows are sorted in each trigram by the stable sort
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        rows = rows[order]
+        # a row holding the same trigram several times is only indexed once
+        unique = np.ones(len(codes), dtype=bool)
+        unique[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        codes = codes[unique]
+        self.__rows = rows[unique]
+        key_starts = np.flatnonzero(np.diff(codes)) + 1
+        self.__keys = codes[np.concatenate(([0], key_starts))] if len(codes) else codes
+        self.__bounds = np.concatenate(([0], key_starts, [len(codes)])) if len(codes) else np.zeros(1, dtype=np.int64)
+
+    def __sizeof__(self) -> int:
+        return (
+            self.__rows.nbytes
+            + self.__keys.nbytes
+            + self.__bounds.nbytes
+            + self.__texts.nbytes
+            + sum(sys.getsizeof(v) for v in self.__texts if v is not None)
+        )
+
+    def __encode(self, text: str) -> np.ndarray:
+        return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.int64)
+
+    def __get_rows(self, key_index: int) -> np.ndarray:
+        return self.__rows[self.__bounds[key_index] : self.__bounds[key_index + 1]]
+
+    def search(self, text: str) -> np.ndarray:
+        """Return the sorted positions of the rows which value contains *text*, ignoring case."""
+        bits = _SearchIndex.__BITS
+        size = _SearchIndex.__GRAM_SIZE
+        text = text.lower()
+        chars = self.__encode(text)
+        if len(text) < size:
+            # the keys that contain the text identify the rows
+            mask = (1 << bits) - 1
+            key_chars = [(self.__keys >> (bits * s)) & mask for s in (2, 1, 0)]
+            found = np.zeros(len(self.__keys), dtype=bool)
+            for offset in range(size - len(chars) + 1):
+                found |= reduce(np.logical_and, [key_chars[offset + i] == c for i, c in enumerate(chars)])
+            postings = [self.__get_rows(k) for k in np.flatnonzero(found)]
+            return np.unique(np.concatenate(postings)) if postings else np.empty(0, dtype=np.int64)
+        codes = np.unique((chars[:-2] << (2 * bits)) | (chars[1:-1] << bits) | chars[2:])
+        indexes = np.searchsorted(self.__keys, codes)
+        if np.any(indexes >= len(self.__keys)) or np.any(self.__keys[indexes] != codes):
+            return np.empty(0, dtype=np.int64)
+        postings = sorted((self.__get_rows(k) for k in indexes), key=len)
+        rows = reduce(lambda a, b: np.intersect1d(a, b, assume_unique=True), postings)
+        if len(text) > size:
+            # the trigrams may not be contiguous in the value
+            rows = rows[np.fromiter((text in self.__texts[r] for r in rows), dtype=bool, count=len(rows))]
+        return rows
@@ -0,0 +1,294 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from datetime import datetime
+
+import pandas as pd
+
+from .._warnings import _warn
+from ..gui import Gui
+from .data_format import _DataFormat
+from .pandas_data_accessor import _PandasDataAccessor
+from .sql_query import SqlQuery
+
+
+class _SqlParams(object):
+    """Query parameters, with placeholders in the style of the database driver."""
+
+    def __init__(self, paramstyle: str, params: t.Any) -> None:
+        self.__paramstyle = paramstyle
+        self.__named = paramstyle == "named" or paramstyle == "pyformat" and isinstance(params, dict)
+        self.__params: t.Any = dict(params or {}) if self.__named else list(params or [])
+
+    def add(self, value: t.Any) -> str:
+        if self.__named:
+            name = f"_tp_p{len(self.__params)}"
+            self.__params[name] = value
+            return f":{name}" if self.__paramstyle == "named" else f"%({name})s"
+        self.__params.append(value)
+        if self.__paramstyle in ("format", "pyformat"):
+            return "%s"
+        if self.__paramstyle == "numeric":
+            return f":{len(self.__params)}"
+        return "?"
+
+    def get(self) -> t.Any:
+        return self.__params
+
+
+class _SqlDataAccessor(_PandasDataAccessor):
+    """Data accessor for SQL queries.
+
+    Filters, sorts, aggregations and pages are translated into SQL so that only the rows that
+    are displayed are fetched. These rows are then formatted as pandas DataFrames are.
+    """
+
+    __types = (SqlQuery,)
+
+    __INDEX_COL = "_tp_index"
+
+    __AGGREGATE_FUNCTIONS: t.Dict[str, str] = {
+        "count": "COUNT",
+        "sum": "SUM",
+        "mean": "AVG",
+        "min": "MIN",
+        "max": "MAX",
+    }
+
+    __FILTER_OPERATORS: t.Dict[str, str] = {
+        "==": "=",
+        "!=": "<>",
+        "<": "<",
+        "<=": "<=",
+        ">": ">",
+        ">=": ">=",
+    }
+
+    __TYPE_SAMPLE_SIZE = 100
+
+    # payload entries that are handled by the database
+    __SQL_PAYLOAD_KEYS = ("filters", "orderby", "sort", "nanposition", "aggregates", "applies", "start", "end")
+
+    @staticmethod
+    def get_supported_classes() -> t.List[str]:
+        return [t.__name__ for t in _SqlDataAccessor.__types]  # type: ignore
+
+    @staticmethod
+    def __quote(value: SqlQuery, name: str) -> str:
+        if "mysql" in value._get_dialect().lower():
+            return f"`{name.replace('`', '``')}`"
+        name = name.replace('"', '""')
+        return f'"{name}"'
+
+    def __get_columns(self, gui: Gui, var_name: str, value: SqlQuery) -> t.List[str]:
+        cache = gui._accessors._get_cache()
+        columns = cache.get(var_name, value, ("columns",))
+        if columns is None:
+            params = _SqlParams(value._get_paramstyle(), value.params)
+            columns, _ = value._execute(f"SELECT * FROM ({value.query}) _tp_q WHERE 1 = 0", params.get())
+            cache.set(var_name, value, ("columns",), columns)
+        return columns
+
+    def __get_dataframe(self, value: SqlQuery, query: str, params: _SqlParams, start: int = 0) -> pd.DataFrame:
+        columns, rows = value._execute(query, params.get())
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        # the index holds the positions of the rows in the query result
+        df.index = pd.RangeIndex(start, start + len(rows))
+        return df
+
+    def get_col_types(self, var_name: str, value: t.Any) -> t.Union[None, t.Dict[str, str]]:  # type: ignore
+        if isinstance(value, _SqlDataAccessor.__types):  # type: ignore
+            col_types = None if self._cache is None else self._cache.get(var_name, value, ("col_types",))
+            if col_types is None:
+                # types are inferred from the first rows
+                params = _SqlParams(value._get_paramstyle(), value.params)
+                query = f"SELECT * FROM ({value.query}) _tp_q LIMIT {params.add(_SqlDataAccessor.__TYPE_SAMPLE_SIZE)}"
+                col_types = super().get_col_types(var_name, self.__get_dataframe(value, query, params))
+                if self._cache is not None and col_types is not None:
+                    self._cache.set(var_name, value, ("col_types",), col_types)
+            return None if col_types is None else dict(col_types)
+        return None
+
+    def __get_where(
+        self, value: SqlQuery, columns: t.List[str], filters: t.List[t.Dict[str, t.Any]], params: _SqlParams
+    ) -> str:
+        conditions = []
+        for fd in filters:
+            col = fd.get("col")
+            val = fd.get("value")
+            action = fd.get("action")
+            if col not in columns:
+                raise KeyError(col)
+            if isinstance(val, str) and len(val) > 1 and val[-1] == "Z":
+                try:
+                    val = datetime.fromisoformat(val[:-1])
+                except ValueError:
+                    pass
+            if action == "contains":
+                # the value is searched as it is: the LIKE wildcards it holds are escaped
+                pattern = "".join(f"!{c}" if c in "!%_" else c for c in str(val))
+                conditions.append(
+                    f"{_SqlDataAccessor.__quote(value, col)} LIKE {params.add(f'%{pattern}%')} ESCAPE '!'"
+                )
+            else:
+                op = _SqlDataAccessor.__FILTER_OPERATORS.get(action)  # type: ignore
+                if op is None:
+                    raise ValueError(f"Unknown filter action '{action}'")
+                conditions.append(f"{_SqlDataAccessor.__quote(value, col)} {op} {params.add(val)}")
+        return f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    def __get_rowcount(
+        self, gui: Gui, var_name: str, value: SqlQuery, source: str, params: _SqlParams, view_key: t.Tuple
+    ) -> int:
+        # counts are shared by all the pages and sorts of the same filters and aggregates
+        cache = gui._accessors._get_cache()
+        rowcount = cache.get(var_name, value, ("rowcount", view_key))
+        if rowcount is None:
+            _, rows = value._execute(f"SELECT COUNT(*) FROM {source}", params.get())
+            rowcount = cache.set(var_name, value, ("rowcount", view_key), int(rows[0][0]))
+        return rowcount
+
+    def __get_page(  # noqa: C901
+        self,
+        gui: Gui,
+        var_name: str,
+        value: SqlQuery,
+        payload: t.Dict[str, t.Any],
+    ) -> t.Tuple[pd.DataFrame, int, int]:
+        all_columns = self.__get_columns(gui, var_name, value)
+        columns = [c for c in payload.get("columns", []) if c in all_columns] or all_columns
+        base = f"({value.query}) _tp_q"
+        view_key: t.Tuple[t.Any, ...] = ()
+
+        # filtering
+        params = _SqlParams(value._get_paramstyle(), value.params)
+        source = base
+        filters = payload.get("filters")
+        if isinstance(filters, list) and len(filters) > 0:
+            filter_params = _SqlParams(value._get_paramstyle(), value.params)
+            try:
+                source = f"(SELECT * FROM {base}{self.__get_where(value, all_columns, filters, filter_params)}) _tp_f"
+                params = filter_params
+                view_key += (
+                    "filters",
+                    tuple((fd.get("col"), fd.get("action"), repr(fd.get("value"))) for fd in filters),
+                )
+            except Exception as e:
+                _warn(f"Dataframe filtering: invalid filter '{filters}' on {var_name}", e)
+
+        # aggregation
+        default_order: t.List[str] = []
+        aggregates = payload.get("aggregates")
+        applies = payload.get("applies")
+        if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
+            try:
+                selected = []
+                for col in aggregates:
+                    if col not in all_columns:
+                        raise KeyError(col)
+                    selected.append(_SqlDataAccessor.__quote(value, col))
+                for col, apply in applies.items():
+                    if col in aggregates:
+                        continue
+                    function = _SqlDataAccessor.__AGGREGATE_FUNCTIONS.get(apply)
+                    if col not in all_columns or function is None:
+                        raise ValueError(f"Unsupported aggregate '{apply}' on column '{col}'")
+                    quoted = _SqlDataAccessor.__quote(value, col)
+                    selected.append(f"{function}({quoted}) AS {quoted}")
+                keys = ", ".join(_SqlDataAccessor.__quote(value, c) for c in aggregates)
+                source = f"(SELECT {', '.join(selected)} FROM {source} GROUP BY {keys}) _tp_g"
+                columns = [c for c in columns if c in aggregates or c in applies]
+                default_order = aggregates
+                view_key += ("aggregates", tuple(aggregates), tuple(applies.items()))
+            except Exception as e:
+                _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.", e)
+
+        # real number of rows is needed to calculate the number of pages
+        rowcount = self.__get_rowcount(gui, var_name, value, source, params, view_key)
+        start = _SqlDataAccessor.__get_int_value(payload.get("start"), 0)
+        end = _SqlDataAccessor.__get_int_value(payload.get("end"), -1)
+        if start < 0 or start >= rowcount:
+            start = 0
+        if end < 0 or end >= rowcount:
+            end = rowcount - 1
+
+        # deal with sort
+        order_by = payload.get("orderby")
+        if isinstance(order_by, str):
+            order_by = [order_by] if len(order_by) else []
+        elif not isinstance(order_by, list):
+            order_by = []
+        sort = payload.get("sort")
+        sorts = sort if isinstance(sort, list) else [sort] * len(order_by)
+        nan_position = payload.get("nanposition")
+        order = []
+        for i, col in enumerate(order_by):
+            if col not in columns:
+                _warn(f"Cannot sort {var_name} on column {col}.")
+                order = []
+                break
+            descending = i < len(sorts) and sorts[i] == "desc"
+            # NULL values come last when ascending and first when descending unless specified
+            nulls_last = not descending if nan_position is None else nan_position == "last"
+            quoted = _SqlDataAccessor.__quote(value, col)
+            order.append(f"CASE WHEN {quoted} IS NULL THEN {1 if nulls_last else 0} ELSE {0 if nulls_last else 1} END")
+            order.append(f"{quoted} {'DESC' if descending else 'ASC'}")
+        if not order:
+            order = [_SqlDataAccessor.__quote(value, c) for c in default_order]
+        order_clause = f" ORDER BY {', '.join(order)}" if order else ""
+
+        # only the page is fetched
+        select = ", ".join(_SqlDataAccessor.__quote(value, c) for c in columns)
+        query = f"SELECT {select} FROM {source}{order_clause} LIMIT {params.add(end + 1 - start)} OFFSET {params.add(start)}"
+        return self.__get_dataframe(value, query, params, start), start, rowcount
+
+    def __get_all(self, gui: Gui, var_name: str, value: SqlQuery, payload: t.Dict[str, t.Any]) -> pd.DataFrame:
+        all_columns = self.__get_columns(gui, var_name, value)
+        columns = [c for c in payload.get("columns", []) if c in all_columns] or all_columns
+        select = ", ".join(_SqlDataAccessor.__quote(value, c) for c in columns)
+        params = _SqlParams(value._get_paramstyle(), value.params)
+        where = ""
+        filters = payload.get("filters")
+        if isinstance(filters, list) and len(filters) > 0:
+            filter_params = _SqlParams(value._get_paramstyle(), value.params)
+            try:
+                where = self.__get_where(value, all_columns, filters, filter_params)
+                params = filter_params
+            except Exception as e:
+                _warn(f"Dataframe filtering: invalid filter '{filters}' on {var_name}", e)
+        return self.__get_dataframe(value, f"SELECT {select} FROM ({value.query}) _tp_q{where}", params)
+
+    @staticmethod
+    def __get_int_value(value: t.Any, default: int) -> int:
+        if isinstance(value, int):
+            return value
+        try:
+            return int(str(value), base=10)
+        except Exception:
+            return default
+
+    def get_data(
+        self, gui: Gui, var_name: str, value: t.Any, payload: t.Dict[str, t.Any], data_format: _DataFormat
+    ) -> t.Dict[str, t.Any]:
+        if not isinstance(value, _SqlDataAccessor.__types):  # type: ignore
+            return {}
+        # what the database did is not done again on the fetched rows
+        local_payload = {k: v for k, v in payload.items() if k not in _SqlDataAccessor.__SQL_PAYLOAD_KEYS}
+        try:
+            if payload.get("alldata", False):
+                data = self.__get_all(gui, var_name, value, payload)
+                return super().get_data(gui, var_name, data, local_payload, data_format)
+            page, start, rowcount = self.__get_page(gui, var_name, value, payload)
+        except Exception as e:
+            _warn(f"Cannot query the database for {var_name}", e)
+            return {}
+        return self._get_page_data(gui, var_name, page, local_payload, data_format, start, rowcount)
@@ -0,0 +1,121 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+import typing as t
+from contextlib import contextmanager
+from queue import Empty, SimpleQueue
+from threading import Lock
+
+
+class SqlQuery:
+    """Tabular data that is the result of a SQL query.
+
+    A `SqlQuery` can be bound to the *data* property of tables and charts. The query is
+    never fully loaded: the filters, sorts, aggregations and pages requested by the
+    table are added to the query as `WHERE`, `ORDER BY`, `GROUP BY` and `LIMIT`/`OFFSET`
+    clauses, and the number of rows is computed by the database.
+
+    Attributes:
+        query (str): The SQL query that selects the data.
+        params (Optional[Union[Sequence, dict]]): The parameters of the query.
+    """
+
+    __MAX_IDLE_CONNECTIONS = 8
+
+    def __init__(
+        self,
+        query: str,
+        connection: t.Any,
+        params: t.Optional[t.Union[t.Sequence[t.Any], t.Dict[str, t.Any]]] = None,
+    ) -> None:
+        """Initialize a new SqlQuery.
+
+        Arguments:
+            query (str): The SQL query that selects the data. It must be usable as a sub-query.
+            connection (Any): How to connect to the database. This can be:
+
+                - A SQLAlchemy `Engine`: connections are taken from its pool.
+                - A function that returns a new DB-API connection: connections are
+                  kept in a pool owned by this object.
+                - A DB-API connection: this connection is shared by all requests, that
+                  are serialized.
+            params (Optional[Union[Sequence, dict]]): The parameters of *query*, using the
+                parameter style of the database driver.
+        """
+        self.query = query
+        self.params = params
+        self.__connection = connection
+        self.__idle_connections: SimpleQueue = SimpleQueue()
+        self.__lock = Lock()
+        self.__paramstyle: t.Optional[str] = None
+        self.__dialect: t.Optional[str] = None
+
+    def __is_engine(self) -> bool:
+        return hasattr(self.__connection, "raw_connection") and hasattr(self.__connection, "dialect")
+
+    def _get_paramstyle(self) -> str:
+        if self.__paramstyle is None:
+            if self.__is_engine():
+                self.__paramstyle = self.__connection.dialect.paramstyle
+            else:
+                with self._connect() as connection:
+                    module = sys.modules.get(type(connection).__module__.split(".")[0])
+                    self.__paramstyle = getattr(module, "paramstyle", "qmark")
+        return self.__paramstyle  # type: ignore
+
+    def _get_dialect(self) -> str:
+        if self.__dialect is None:
+            if self.__is_engine():
+                self.__dialect = self.__connection.dialect.name
+            else:
+                with self._connect() as connection:
+                    self.__dialect = type(connection).__module__.split(".")[0]
+        return self.__dialect  # type: ignore
+
+    @contextmanager
+    def _connect(self) -> t.Iterator[t.Any]:
+        if self.__is_engine():
+            # closing a pooled connection returns it to the pool
+            connection = self.__connection.raw_connection()
+            try:
+                yield connection
+            finally:
+                connection.close()
+        elif callable(self.__connection) and not hasattr(self.__connection, "cursor"):
+            try:
+                connection = self.__idle_connections.get_nowait()
+            except Empty:
+                connection = self.__connection()
+            try:
+                yield connection
+                # don't keep a transaction open on idle connections
+                connection.rollback()
+            except Exception:
+                connection.close()
+                raise
+            if self.__idle_connections.qsize() < SqlQuery.__MAX_IDLE_CONNECTIONS:
+                self.__idle_connections.put(connection)
+            else:
+                connection.close()
+        else:
+            with self.__lock:
+                yield self.__connection
+
+    def _execute(self, query: str, params: t.Union[t.List[t.Any], t.Dict[str, t.Any]]) -> t.Tuple[t.List[str], list]:
+        with self._connect() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, params)
+                columns = [d[0] for d in cursor.description]
+                return columns, cursor.fetchall()
+            finally:
+                cursor.close()
@@ -91,17 +91,20 @@ def _df_data_filter(
     payload: t.Dict[str, t.Any],
     is_copied: bool,
 ):
-    df = dataframe.copy() if not is_copied else dataframe
-    if not x_column_name:
-        index = 0
-        while f"tAiPy_index_{index}" in df.columns:
-            index += 1
-        x_column_name = f"tAiPy_index_{index}"
-        df[x_column_name] = df.index
-    column_list = [x_column_name, y_column_name, z_column_name] if z_column_name else [x_column_name, y_column_name]
-    points = df[column_list].to_numpy()
+    column_list = [y_column_name, z_column_name] if z_column_name else [y_column_name]
+    if x_column_name:
+        points = dataframe[[x_column_name, *column_list]].to_numpy()
+    else:
+        # use the index as x values without copying the whole dataframe
+        values = dataframe[column_list].to_numpy()
+        x_values = dataframe.index.to_numpy()
+        try:
+            dtype = np.result_type(x_values.dtype, values.dtype)
+        except TypeError:
+            dtype = np.dtype(object)
+        points = np.column_stack((x_values.astype(dtype, copy=False), values.astype(dtype, copy=False)))
     mask = decimator.decimate(points, payload)
-    return df[mask], is_copied
+    return dataframe.take(np.flatnonzero(mask)), is_copied
 
 
 def _df_relayout(
@@ -120,25 +123,23 @@ def _df_relayout(
     # if chart data is invalid
     if x0 is None or x1 is None or y0 is None or y1 is None:
         return dataframe, is_copied
-    df = dataframe.copy() if not is_copied else dataframe
-    is_copied = True
-    has_x_col = True
-
-    if not x_column:
-        index = 0
-        while f"tAiPy_index_{index}" in df.columns:
-            index += 1
-        x_column = f"tAiPy_index_{index}"
-        df[x_column] = df.index
-        has_x_col = False
-
+    x_values = dataframe[x_column] if x_column else dataframe.index
     # if chart_mode is empty
     if chart_mode == "lines+markers":
         # only filter by x column
-        df = df.loc[(df[x_column] > x0) & (df[x_column] < x1)]
+        mask = (x_values > x0) & (x_values < x1)
     else:
         # filter by both x and y columns
-        df = df.loc[(df[x_column] > x0) & (df[x_column] < x1) & (df[y_column] > y0) & (df[y_column] < y1)]  # noqa
-    if not has_x_col:
-        df.drop(x_column, axis=1, inplace=True)
-    return df, is_copied
+        mask = (x_values > x0) & (x_values < x1) & (dataframe[y_column] > y0) & (dataframe[y_column] < y1)  # noqa
+    # only the rows in range are copied
+    return dataframe.take(np.flatnonzero(np.asarray(mask))), True
+
+
+def _get_arrow_stream(table: t.Any) -> bytes:
+    # The stream is returned as bytes: these are sent as a binary attachment of the Socket.IO message.
+    import pyarrow as pa
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import importlib
 import inspect
 import json
@@ -23,8 +24,10 @@ import tempfile
 import time
 import typing as t
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from importlib import metadata, util
 from importlib.util import find_spec
+from threading import Lock
 from types import FrameType, SimpleNamespace
 from urllib.parse import unquote, urlencode, urlparse
 
@@ -45,13 +48,13 @@ from ._page import _Page
 from ._renderers import _EmptyPage
 from ._renderers._markdown import _TaipyMarkdownExtension
 from ._renderers.factory import _Factory
-from ._renderers.json import _TaipyJsonEncoder
+from ._renderers.json import _dumps, _TaipyJsonEncoder, _TaipyJsonFragment
 from ._renderers.utils import _get_columns_dict
 from ._warnings import TaipyGuiWarning, _warn
 from .builder import _ElementApiGenerator
 from .config import Config, ConfigParameter, _Config
 from .data.content_accessor import _ContentAccessor
-from .data.data_accessor import _DataAccessor, _DataAccessors
+from .data.data_accessor import _AppendedRows, _DataAccessor, _DataAccessors
 from .data.data_format import _DataFormat
 from .data.data_scope import _DataScopes
 from .extension.library import Element, ElementLibrary
@@ -309,6 +312,19 @@ class Gui:
         self._config = _Config()
         self.__content_accessor = None
         self._accessors = _DataAccessors()
+        # data requests of each client, replayed on the rows appended to their data
+        self.__data_requests: t.Dict[str, t.Dict[str, t.Optional[t.Dict[str, t.Dict[str, t.Any]]]]] = {}
+        # variables that rows were appended to: only their data requests are kept
+        self.__appended_vars: t.Set[str] = set()
+        # changes of the state of the clients: what user functions computed from a previous state is obsolete
+        self.__state_versions: t.Dict[str, int] = {}
+        self.__shared_state_version = 0
+        # rows being appended, indexed by the id of the new value
+        self.__appended_rows: t.Dict[int, _AppendedRows] = {}
+        # infinite tables pages prepared ahead of their requests
+        self.__read_ahead_executor: t.Optional[ThreadPoolExecutor] = None
+        self.__read_ahead_pending: t.Set[t.Tuple[t.Any, ...]] = set()
+        self.__read_ahead_lock = Lock()
         self.__state: t.Optional[State] = None
         self.__bindings = _Bindings(self)
         self.__locals_context = _LocalsContext()
@@ -560,6 +576,29 @@ class Gui:
                 sids.add(sid)
         g.client_id = client_id
 
+    def _get_state_version(self) -> t.Tuple[int, int]:
+        return (self.__shared_state_version, self.__state_versions.get(self._get_client_id(), 0))
+
+    def __set_state_changed(self) -> None:
+        if self._is_broadcasting():
+            self.__shared_state_version += 1
+        else:
+            client_id = self._get_client_id()
+            self.__state_versions[client_id] = self.__state_versions.get(client_id, 0) + 1
+
+    def _handle_disconnect(self) -> None:
+        # the data requests of a client are dropped when it has no connection anymore
+        sid = getattr(request, "sid", None) if request else None
+        if not sid:
+            return
+        for client_id, sids in list(self.__client_id_2_sid.items()):
+            if sid in sids:
+                sids.discard(sid)
+                if not sids:
+                    del self.__client_id_2_sid[client_id]
+                    self.__data_requests.pop(client_id, None)
+                    self.__state_versions.pop(client_id, None)
+
     def __is_var_modified_in_context(self, var_name: str, derived_vars: t.Set[str]) -> bool:
         modified_vars: t.Optional[t.Set[str]] = getattr(g, "modified_vars", None)
         der_vars: t.Optional[t.Set[str]] = getattr(g, "derived_vars", None)
@@ -874,6 +913,7 @@ class Gui:
                 }
             )
             self.__append_libraries_to_status(base_json)
+            base_json["data_transfers"] = self._accessors._get_transfers()
             try:
                 base_json.update(json.loads(template.read_text()))
             except Exception as e:  # pragma: no cover
@@ -931,6 +971,8 @@ class Gui:
         return ("", 200)
 
     _data_request_counter = 1
+    __MAX_DATA_REQUESTS = 8
+    __READ_AHEAD_IGNORED_KEYS = ("start", "end", "pagekey", "etag")
 
     def __send_var_list_update(  # noqa C901
         self,
@@ -938,6 +980,7 @@ class Gui:
         front_var: t.Optional[str] = None,
     ):
         ws_dict = {}
+        self.__set_state_changed()
         values = {v: _getscopeattr_drill(self, v) for v in modified_vars}
         for k, v in values.items():
             if isinstance(v, (_TaipyData, _TaipyContentHtml)) and v.get_name() in modified_vars:
@@ -947,6 +990,22 @@ class Gui:
         for _var in modified_vars:
             newvalue = values.get(_var)
             if isinstance(newvalue, _TaipyData):
+                # values computed from the previous data are obsolete
+                self._accessors._invalidate(_var)
+                var_requests = self.__data_requests.get(self._get_client_id(), {})
+                requests = var_requests.pop(_var, None)
+                data = newvalue.get()
+                appended = self.__appended_rows.get(id(data._dict if isinstance(data, _MapDict) else data))
+                if appended is not None:
+                    self.__appended_vars.add(_var)
+                if appended is not None and requests is not None and not self._is_broadcasting():
+                    # only the appended rows are sent
+                    appended_data = self.__get_appended_data(_var, newvalue, requests, appended)
+                    if appended_data is not None:
+                        var_requests[_var] = requests
+                        for ret_payload in appended_data:
+                            self.__send_ws_update_with_dict({_var: ret_payload})
+                        continue
                 # A changing integer that triggers a data request
                 newvalue = Gui._data_request_counter
                 Gui._data_request_counter = (Gui._data_request_counter % 100) + 1
@@ -978,7 +1037,8 @@ class Gui:
                 debug_warnings: t.List[warnings.WarningMessage] = []
                 with warnings.catch_warnings(record=True) as warns:
                     warnings.resetwarnings()
-                    json.dumps(newvalue, cls=_TaipyJsonEncoder)
+                    # the value is encoded once: the message holds the encoded value
+                    encoded = _dumps(newvalue)
                     if len(warns):
                         keep_value = True
                         for w in list(warns):
@@ -992,6 +1052,7 @@ class Gui:
                             continue
                 for w in debug_warnings:
                     warnings.warn(w.message, w.category)
+                newvalue = _TaipyJsonFragment(encoded)
             ws_dict[_var] = newvalue
         # TODO: What if value == newvalue?
         self.__send_ws_update_with_dict(ws_dict)
@@ -1020,9 +1081,210 @@ class Gui:
                                 e,
                             )
             if not isinstance(ret_payload, dict):
-                ret_payload = self._accessors._get_data(self, var_name, newvalue, payload)
+                read_range = self.__get_read_ahead_range(payload)
+                if read_range is not None:
+                    ret_payload = self.__get_read_ahead_data(var_name, newvalue, payload, read_range)
+                if not isinstance(ret_payload, dict):
+                    ret_payload = self._accessors._get_data(self, var_name, newvalue, payload)
+                if isinstance(payload, dict):
+                    self.__store_data_request(var_name, payload, Gui.__set_page_etag(payload, ret_payload))
+                if read_range is not None:
+                    self.__read_ahead(var_name, newvalue, payload, ret_payload, read_range)
             self.__send_ws_update_with_dict({var_name: ret_payload})
 
+    def __get_read_ahead_range(self, payload: t.Any) -> t.Optional[t.Tuple[t.Tuple[t.Any, ...], int, int]]:
+        # infinite tables request the rows that follow the ones they hold, with the same parameters
+        if self._get_config("data_read_ahead_pages", 0) < 1 or not isinstance(payload, dict):
+            return None
+        if not payload.get("infinite"):
+            return None
+        try:
+            start = int(payload.get("start", 0))
+            end = int(payload.get("end", -1))
+        except (TypeError, ValueError):
+            return None
+        if start < 0 or end < start:
+            return None
+        view = repr(sorted((k, v) for k, v in payload.items() if k not in Gui.__READ_AHEAD_IGNORED_KEYS))
+        return ("read_ahead", self._get_client_id(), view), start, end
+
+    def __get_read_ahead_data(
+        self,
+        var_name: str,
+        value: _TaipyData,
+        payload: t.Dict[str, t.Any],
+        read_range: t.Tuple[t.Tuple[t.Any, ...], int, int],
+    ) -> t.Optional[t.Dict[str, t.Any]]:
+        key, start, end = read_range
+        prepared = self._accessors._get_cache().get(var_name, value.get(), key + (start, end))
+        return None if prepared is None else {**prepared, "pagekey": payload.get("pagekey")}
+
+    def __read_ahead(
+        self,
+        var_name: str,
+        value: _TaipyData,
+        payload: t.Dict[str, t.Any],
+        ret_payload: t.Dict[str, t.Any],
+        read_range: t.Tuple[t.Tuple[t.Any, ...], int, int],
+    ) -> None:
+        key, start, end = read_range
+        ret_value = ret_payload.get("value")
+        rowcount = ret_value.get("rowcount") if isinstance(ret_value, dict) else None
+        if not isinstance(rowcount, int):
+            return
+        size = end + 1 - start
+        last = min(rowcount, end + 1 + size * self._get_config("data_read_ahead_pages", 0))
+        ranges = [(s, min(s + size, rowcount) - 1) for s in range(end + 1, last, size)]
+        cache = self._accessors._get_cache()
+        ranges = [r for r in ranges if cache.get(var_name, value.get(), key + r) is None]
+        if not ranges:
+            return
+        with self.__read_ahead_lock:
+            if key in self.__read_ahead_pending:
+                return
+            self.__read_ahead_pending.add(key)
+            if self.__read_ahead_executor is None:
+                self.__read_ahead_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="TaipyReadAhead")
+        self.__read_ahead_executor.submit(
+            self.__prepare_pages,
+            self._get_client_id(),
+            self._get_locals_context(),
+            var_name,
+            value,
+            payload,
+            key,
+            ranges,
+        )
+
+    def __prepare_pages(
+        self,
+        client_id: str,
+        module_context: str,
+        var_name: str,
+        value: _TaipyData,
+        payload: t.Dict[str, t.Any],
+        key: t.Tuple[t.Any, ...],
+        ranges: t.List[t.Tuple[int, int]],
+    ) -> None:
+        # prepared pages are stamped with the value they were computed from: they are dropped when it changes
+        try:
+            with self.get_flask_app().app_context():
+                self.__set_client_id_in_context(client_id)
+                with self._set_locals_context(module_context):
+                    cache = self._accessors._get_cache()
+                    for start, end in ranges:
+                        ret_payload = self._accessors._get_data(
+                            self, var_name, value, {**payload, "start": start, "end": end}
+                        )
+                        cache.set(var_name, value.get(), key + (start, end), ret_payload)
+        except Exception as e:  # pragma: no cover
+            _warn(f"Cannot prepare the rows of {var_name}", e)
+        finally:
+            with self.__read_ahead_lock:
+                self.__read_ahead_pending.discard(key)
+
+    @staticmethod
+    def __set_page_etag(payload: t.Dict[str, t.Any], ret_payload: t.Dict[str, t.Any]) -> bool:
+        # a page which content did not change is not sent again
+        value = ret_payload.get("value")
+        if not isinstance(value, dict) or ret_payload.get("alldata") or ret_payload.get("infinite") is not None:
+            return False
+        etag = value.get("etag")
+        if etag is None:
+            # the accessor did not fingerprint the page: this is only done when the front-end refreshes a page it holds
+            if payload.get("etag") is None:
+                return False
+            data = value.get("data")
+            if data is None:
+                return False
+            try:
+                content = data if isinstance(data, bytes) else json.dumps(data, cls=_TaipyJsonEncoder).encode()
+            except Exception:
+                return False
+            digest = hashlib.blake2b(repr((value.get("start"), value.get("rowcount"))).encode(), digest_size=16)
+            digest.update(content)
+            etag = value["etag"] = digest.hexdigest()
+        if etag != payload.get("etag"):
+            return False
+        ret_payload["value"] = {"notModified": True, "etag": etag}
+        return True
+
+    def __store_data_request(self, var_name: str, payload: t.Dict[str, t.Any], not_modified: bool = False) -> None:
+        if var_name not in self.__appended_vars:
+            return
+        var_requests = self.__data_requests.setdefault(self._get_client_id(), {})
+        requests = var_requests.setdefault(var_name, {})
+        if requests is None:
+            return
+        # appended rows are merged into the page the front-end holds, whatever its fingerprint
+        request = {k: v for k, v in payload.items() if k != "etag"}
+        if not_modified:
+            request["notmodified"] = True
+        requests[str(payload.get("pagekey"))] = request
+        if len(requests) > Gui.__MAX_DATA_REQUESTS:
+            # too many pages to follow: appends will refresh all the data
+            var_requests[var_name] = None
+
+    def __get_appended_data(
+        self, var_name: str, value: _TaipyData, requests: t.Dict[str, t.Dict[str, t.Any]], appended: _AppendedRows
+    ) -> t.Optional[t.List[t.Dict[str, t.Any]]]:
+        ret = []
+        for payload in requests.values():
+            if any(payload.get(k) for k in ("filters", "search", "aggregates", "orderby")):
+                # the appended rows may not be the last ones
+                return None
+            if payload.get("notmodified"):
+                # the page was not sent: the front-end did not store it
+                return None
+            if payload.get("alldata"):
+                if (payload.get("decimatorPayload") or {}).get("decimators"):
+                    return None
+                ret_payload = self._accessors._get_data(
+                    self, var_name, _TaipyData(appended.rows, value.get_name()), payload
+                )
+            elif payload.get("infinite"):
+                if appended.start == appended.end:
+                    continue
+                ret_payload = self._accessors._get_data(
+                    self, var_name, value, {**payload, "start": appended.start, "end": appended.end - 1}
+                )
+            else:
+                try:
+                    page_start = int(payload.get("start", 0))
+                    page_end = int(payload.get("end", -1))
+                except (TypeError, ValueError):
+                    return None
+                start = max(appended.start, page_start)
+                end = appended.end - 1 if page_end < 0 else min(appended.end - 1, page_end)
+                if start > end:
+                    # the page is complete: only the number of rows changed
+                    ret_payload = {"pagekey": payload.get("pagekey"), "value": {"rowcount": appended.end, "data": []}}
+                else:
+                    ret_payload = self._accessors._get_data(
+                        self, var_name, value, {**payload, "start": start, "end": end}
+                    )
+            if not ret_payload:
+                return None
+            if not payload.get("infinite"):
+                # the front-end adds these rows to the ones it holds
+                ret_payload["append"] = True
+                if isinstance(ret_payload.get("value"), dict):
+                    ret_payload["value"].pop("etag", None)
+            ret.append(ret_payload)
+        return ret
+
+    def _append_rows(self, var_name: str, rows: t.Any) -> None:
+        value = _getscopeattr_drill(self, var_name)
+        appended = self._accessors._append_rows(_TaipyData(value, var_name), rows)
+        if appended is None:
+            _warn(f"Cannot append rows to variable '{var_name}' of type {type(value).__name__}.")
+            return
+        self.__appended_rows[id(appended.value)] = appended
+        try:
+            setattr(self._bindings(), var_name, appended.value)
+        finally:
+            self.__appended_rows.pop(id(appended.value), None)
+
     def __request_var_update(self, payload: t.Any):
         if isinstance(payload, dict) and isinstance(payload.get("names"), list):
             if payload.get("refresh", False):
@@ -2278,6 +2540,12 @@ class Gui:
 
         # Register data accessor communication data format (JSON, Apache Arrow)
         self._accessors._set_data_format(_DataFormat.APACHE_ARROW if app_config["use_arrow"] else _DataFormat.JSON)
+        # Format picked for each transfer, from its size
+        self._accessors._set_arrow_min_cells(app_config["arrow_min_cells"])
+        # Memory budget for the values computed from bound data (sort permutations...)
+        self._accessors._set_cache_max_size(app_config["data_cache_max_size"])
+        # Compression of the large Apache Arrow transfers
+        self._accessors._set_compression(app_config["data_compression"], app_config["data_compression_threshold"])
 
         # Use multi user or not
         self._bindings()._set_single_client(bool(app_config["single_client"]))
@@ -80,6 +80,7 @@ class State:
         "_context_list",
     )
     __methods = (
+        "append_rows",
         "assign",
         "broadcast",
         "get_gui",
@@ -223,6 +224,31 @@ class State:
         val = attrgetter(name)(self)
         _attrsetter(self, name, val)
 
+    def append_rows(self, name: str, rows: t.Any):
+        """Append rows to a tabular data variable.
+
+        The variable is set to a new value that holds the rows of its current value followed
+        by *rows*. Instead of requesting all their data again, the tables and charts that
+        display the variable only receive the appended rows, that they add to the rows
+        they already hold.<br/>
+        Tables that are sorted, filtered or grouped, and charts that use a decimator,
+        request all their data again.
+
+        This is supported for pandas and Polars DataFrames, Numpy arrays, lists of
+        values and dictionaries of lists.
+
+        Arguments:
+            name (str): The name of the variable holding the data.
+            rows (Any): The rows to append. This can be a value of the same type as
+                the variable, a dictionary of lists or a list of records.
+        """
+        gui: "Gui" = super().__getattribute__(State.__gui_attr)
+        if name not in super().__getattribute__(State.__attrs[1]):
+            raise AttributeError(f"Variable '{name}' is not accessible.")
+        with self._notebook_context(gui), self._set_context(gui):
+            encoded_name = gui._bind_var(name)
+            gui._append_rows(encoded_name, rows)
+
     def broadcast(self, name: str, value: t.Any):
         """Update a variable on all clients.
 
@@ -23,12 +23,16 @@ def pytest_configure(config):
     if (find_spec("src") and find_spec("src.taipy")) and (not find_spec("taipy") or not find_spec("taipy.gui")):
         import src.taipy.gui
         import src.taipy.gui._renderers.builder
+        import src.taipy.gui._renderers.json
         import src.taipy.gui._warnings
         import src.taipy.gui.builder
+        import src.taipy.gui.data.arrow_dataset
         import src.taipy.gui.data.decimator.lttb
         import src.taipy.gui.data.decimator.minmax
         import src.taipy.gui.data.decimator.rdp
         import src.taipy.gui.data.decimator.scatter_decimator
+        import src.taipy.gui.data.ring_buffer
+        import src.taipy.gui.data.sql_query
         import src.taipy.gui.data.utils
         import src.taipy.gui.extension
         import src.taipy.gui.utils._map_dict
@@ -37,11 +41,15 @@ def pytest_configure(config):
 
         sys.modules["taipy.gui._warnings"] = sys.modules["src.taipy.gui._warnings"]
         sys.modules["taipy.gui._renderers.builder"] = sys.modules["src.taipy.gui._renderers.builder"]
+        sys.modules["taipy.gui._renderers.json"] = sys.modules["src.taipy.gui._renderers.json"]
         sys.modules["taipy.gui.utils._variable_directory"] = sys.modules["src.taipy.gui.utils._variable_directory"]
         sys.modules["taipy.gui.utils.expr_var_name"] = sys.modules["src.taipy.gui.utils.expr_var_name"]
         sys.modules["taipy.gui.utils._map_dict"] = sys.modules["src.taipy.gui.utils._map_dict"]
         sys.modules["taipy.gui.extension"] = sys.modules["src.taipy.gui.extension"]
         sys.modules["taipy.gui.data.utils"] = sys.modules["src.taipy.gui.data.utils"]
+        sys.modules["taipy.gui.data.arrow_dataset"] = sys.modules["src.taipy.gui.data.arrow_dataset"]
+        sys.modules["taipy.gui.data.ring_buffer"] = sys.modules["src.taipy.gui.data.ring_buffer"]
+        sys.modules["taipy.gui.data.sql_query"] = sys.modules["src.taipy.gui.data.sql_query"]
         sys.modules["taipy.gui.data.decimator.lttb"] = sys.modules["src.taipy.gui.data.decimator.lttb"]
         sys.modules["taipy.gui.data.decimator.rdp"] = sys.modules["src.taipy.gui.data.decimator.rdp"]
         sys.modules["taipy.gui.data.decimator.minmax"] = sys.modules["src.taipy.gui.data.decimator.minmax"]
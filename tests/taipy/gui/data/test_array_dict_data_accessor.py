@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 from importlib import util
 
 from taipy.gui import Gui
@@ -26,7 +27,7 @@ def test_simple_data(gui: Gui, helpers):
     value = ret_data["value"]
     assert value
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 3
 
 
@@ -46,10 +47,10 @@ def test_slice(gui: Gui, helpers):
     accessor = _ArrayDictDataAccessor()
     value = accessor.get_data(gui, "x", an_array, {"start": 0, "end": 1}, _DataFormat.JSON)["value"]
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 2
     value = accessor.get_data(gui, "x", an_array, {"start": "0", "end": "1"}, _DataFormat.JSON)["value"]
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 2
 
 
@@ -57,7 +58,7 @@ def test_sort(gui: Gui, helpers):
     accessor = _ArrayDictDataAccessor()
     a_dict = {"name": ["A", "B", "C"], "value": [3, 2, 1]}
     query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "name", "sort": "desc"}
-    data = accessor.get_data(gui, "x", a_dict, query, _DataFormat.JSON)["value"]["data"]
+    data = json.loads(accessor.get_data(gui, "x", a_dict, query, _DataFormat.JSON)["value"]["data"])
     assert data[0]["name"] == "C"
 
 
@@ -67,7 +68,7 @@ def test_aggregate(gui: Gui, helpers, small_dataframe):
     query = {"columns": ["name", "value"], "start": 0, "end": -1, "aggregates": ["name"], "applies": {"value": "sum"}}
     value = accessor.get_data(gui, "x", a_dict, query, _DataFormat.JSON)["value"]
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     agregValue = next(v.get("value") for v in data if v.get("name") == "A")
     assert agregValue == 5
 
@@ -80,7 +81,7 @@ def test_array_of_array(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["rowcount"] == 2
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 2
     assert len(data[0]) == 4  # including _tp_index
 
@@ -93,7 +94,7 @@ def test_empty_array(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["rowcount"] == 0
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 0
 
 
@@ -105,7 +106,7 @@ def test_array_of_diff_array(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["multi"] is True
-    data = value["data"]
+    data = [json.loads(d) for d in value["data"]]
     assert len(data) == 2
     assert len(data[0]["0/0"]) == 3
     assert len(data[1]["1/0"]) == 2
@@ -133,7 +134,7 @@ def test_array_of_dicts(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["multi"] is True
-    data = value["data"]
+    data = [json.loads(d) for d in value["data"]]
     assert len(data) == 2
     assert len(data[0]["temperatures"]) == 5
     assert len(data[1]["seasons"]) == 4
@@ -159,7 +160,24 @@ def test_array_of_Mapdicts(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["multi"] is True
-    data = value["data"]
+    data = [json.loads(d) for d in value["data"]]
     assert len(data) == 2
     assert len(data[0]["temperatures"]) == 5
     assert len(data[1]["seasons"]) == 4
+
+
+def test_conversion_cache(gui: Gui, helpers):
+    accessor = _ArrayDictDataAccessor()
+    a_list = [1, 2]
+    accessor.get_data(gui, "x", a_list, {"start": 0, "end": -1}, _DataFormat.JSON)
+    cache = gui._accessors._get_cache()
+    df = cache.get("x", a_list, ("dataframe",))
+    assert df is not None
+    accessor.get_data(gui, "x", a_list, {"start": 0, "end": 0}, _DataFormat.JSON)
+    assert cache.get("x", a_list, ("dataframe",)) is df
+    # growing the list changes its stamp
+    a_list.append(3)
+    value = accessor.get_data(gui, "x", a_list, {"start": 0, "end": -1}, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    gui._accessors._invalidate("x")
+    assert cache.get("x", a_list, ("dataframe",)) is None
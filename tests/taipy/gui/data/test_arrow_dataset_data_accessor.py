@@ -0,0 +1,156 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+
+import numpy
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui.data import ArrowDataset, ArrowFile
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.utils import _TaipyData
+
+pa = pytest.importorskip("pyarrow")
+
+import pyarrow.dataset as ds  # noqa: E402
+import pyarrow.parquet as pq  # noqa: E402
+
+from taipy.gui.data.arrow_dataset_data_accessor import _ArrowDatasetDataAccessor  # noqa: E402
+
+
+@pytest.fixture(scope="function")
+def parquet_dir(tmp_path):
+    # 3 files of 100 rows, with row groups of 30 rows
+    for i in range(3):
+        table = pa.table(
+            {
+                "id": numpy.arange(i * 100, (i + 1) * 100),
+                "name": [str(x % 7) for x in range(100)],
+                "value": numpy.arange(100, dtype=float) % 13,
+            }
+        )
+        pq.write_table(table, tmp_path / f"part{i}.parquet", row_group_size=30)
+    yield tmp_path
+
+
+def test_dispatch(gui: Gui, helpers, parquet_dir):
+    col_types = {"id": "int64", "name": "object", "value": "float64"}
+    for value in (ds.dataset(parquet_dir), ArrowDataset(parquet_dir)):
+        assert gui._accessors._get_col_types("x", _TaipyData(value, "x")) == col_types
+
+
+def test_slice(gui: Gui, helpers, parquet_dir):
+    accessor = _ArrowDatasetDataAccessor()
+    dataset = ArrowDataset(parquet_dir)
+    value = accessor.get_data(gui, "x", dataset, {"columns": ["id"], "start": 95, "end": 204}, _DataFormat.JSON)[
+        "value"
+    ]
+    assert value["rowcount"] == 300
+    assert [d["id"] for d in value["data"]] == list(range(95, 205))
+    assert value["data"][0] == {"id": 95, "_tp_index": 95}
+    value = accessor.get_data(gui, "x", dataset, {"start": 0, "end": 1}, _DataFormat.APACHE_ARROW)["value"]
+    table = pa.ipc.open_stream(value["data"]).read_all()
+    assert table.column_names == ["id", "name", "value", "_tp_index"]
+    assert table.num_rows == 2
+
+
+def test_sort_and_filter(gui: Gui, helpers, parquet_dir):
+    accessor = _ArrowDatasetDataAccessor()
+    dataset = ds.dataset(parquet_dir)
+    df = dataset.to_table().to_pandas()
+    query = {"columns": ["id", "name"], "start": 10, "end": 19, "orderby": ["name", "id"], "sort": ["desc", "asc"]}
+    data = accessor.get_data(gui, "x", dataset, query, _DataFormat.JSON)["value"]["data"]
+    expected = df.sort_values(["name", "id"], ascending=[False, True])["id"].tolist()[10:20]
+    assert [d["id"] for d in data] == expected
+    query = {
+        "columns": ["id", "name"],
+        "start": 2,
+        "end": 3,
+        "filters": [{"col": "name", "action": "==", "value": "3"}, {"col": "id", "action": ">", "value": 150}],
+    }
+    value = accessor.get_data(gui, "x", dataset, query, _DataFormat.JSON)["value"]
+    expected = df[(df["name"] == "3") & (df["id"] > 150)]["id"].tolist()
+    assert value["rowcount"] == len(expected)
+    assert [d["id"] for d in value["data"]] == expected[2:4]
+    # the index holds the positions in the dataset
+    rows = df.index[(df["name"] == "3") & (df["id"] > 150)].tolist()
+    assert [d["_tp_index"] for d in value["data"]] == rows[2:4]
+    # the rows of each piece are counted once for the filters
+    filters_key = (("name", "==", "'3'"), ("id", ">", "150"))
+    rowcounts = gui._accessors._get_cache().get("x", dataset, ("piece_rowcounts", ("filters", filters_key)))
+    assert rowcounts[1].sum() == len(expected)
+    value = accessor.get_data(gui, "x", dataset, {**query, "start": 4, "end": 5}, _DataFormat.JSON)["value"]
+    assert [d["id"] for d in value["data"]] == expected[4:6]
+    assert [d["_tp_index"] for d in value["data"]] == rows[4:6]
+    # sorted filtered rows
+    value = accessor.get_data(gui, "x", dataset, {**query, "orderby": "id", "sort": "desc"}, _DataFormat.JSON)["value"]
+    assert [d["_tp_index"] for d in value["data"]] == rows[::-1][2:4]
+    query["filters"] = [{"col": "name", "action": ">", "value": 3}]
+    with pytest.warns(UserWarning):
+        value = accessor.get_data(gui, "x", dataset, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 300
+    # row counts are cached
+    assert gui._accessors._get_cache().get("x", dataset, ("rowcount", ())) == 300
+
+
+def test_aggregate(gui: Gui, helpers, parquet_dir):
+    accessor = _ArrowDatasetDataAccessor()
+    dataset = ds.dataset(parquet_dir)
+    query = {"columns": ["name", "id"], "start": 0, "end": 1, "aggregates": ["name"], "applies": {"id": "sum"}}
+    value = accessor.get_data(gui, "x", dataset, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 7
+    df = dataset.to_table().to_pandas()
+    assert [d["id"] for d in value["data"]] == df.groupby("name")["id"].sum().tolist()[:2]
+
+
+def test_aggregate_without_ordered_group_by(gui: Gui, helpers, parquet_dir, monkeypatch):
+    # pyarrow < 13
+    monkeypatch.setattr(inspect.getmodule(_ArrowDatasetDataAccessor), "_has_ordered_group_by", False)
+    accessor = _ArrowDatasetDataAccessor()
+    dataset = ds.dataset(parquet_dir)
+    applies = {"id": "sum", "value": "last"}
+    query = {"columns": ["name", "id", "value"], "start": 0, "end": 1, "aggregates": ["name"], "applies": applies}
+    value = accessor.get_data(gui, "x", dataset, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 7
+    expected = dataset.to_table().to_pandas().groupby("name").agg(applies)
+    assert [d["id"] for d in value["data"]] == expected["id"].tolist()[:2]
+    assert [d["value"] for d in value["data"]] == expected["value"].tolist()[:2]
+
+
+def test_get_all_data(gui: Gui, helpers, parquet_dir):
+    accessor = _ArrowDatasetDataAccessor()
+    dataset = ds.dataset(parquet_dir)
+    value = accessor.get_data(gui, "x", dataset, {"columns": ["id"], "alldata": True}, _DataFormat.JSON)["value"]
+    assert value["data"] == {"id": list(range(300))}
+
+
+def test_memory_mapped_file(gui: Gui, helpers, tmp_path):
+    path = tmp_path / "data.arrow"
+    table = pa.table({"id": numpy.arange(1000), "value": numpy.arange(1000, dtype=float) % 13})
+    with pa.ipc.new_file(str(path), table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=128):
+            writer.write_batch(batch)
+    allocated = pa.total_allocated_bytes()
+    value = ArrowFile(path)
+    assert gui._accessors._get_col_types("x", _TaipyData(value, "x")) == {"id": "int64", "value": "float64"}
+    # the file content is not copied in memory
+    assert pa.total_allocated_bytes() - allocated < table.nbytes
+    accessor = _ArrowDatasetDataAccessor()
+    page = accessor.get_data(gui, "x", value, {"columns": ["id"], "start": 120, "end": 139}, _DataFormat.JSON)["value"]
+    assert page["rowcount"] == 1000
+    assert [d["id"] for d in page["data"]] == list(range(120, 140))
+    assert [d["_tp_index"] for d in page["data"]] == list(range(120, 140))
+    query = {"columns": ["id", "value"], "start": 0, "end": 4, "orderby": ["value", "id"], "sort": ["desc", "desc"]}
+    page = accessor.get_data(gui, "x", value, query, _DataFormat.APACHE_ARROW)["value"]
+    result = pa.ipc.open_stream(page["data"]).read_all()
+    assert result.column("id").to_pylist() == [i for i in range(999, -1, -1) if i % 13 == 12][:5]
+    assert result.column("_tp_index").to_pylist() == result.column("id").to_pylist()
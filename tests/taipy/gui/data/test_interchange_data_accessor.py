@@ -0,0 +1,101 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+from collections import OrderedDict
+
+import pandas as pd
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.interchange_data_accessor import _InterchangeDataAccessor
+from taipy.gui.utils import _TaipyData
+
+
+class _SubFrame(pd.DataFrame):
+    @property
+    def _constructor(self):
+        return _SubFrame
+
+
+class _InterchangeFrame:
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.__df = df
+
+    def __dataframe__(self, nan_as_null: bool = False, allow_copy: bool = True):
+        return self.__df.__dataframe__(nan_as_null, allow_copy)
+
+
+class _ArrowStream:
+    def __init__(self, table) -> None:
+        self.__table = table
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self.__table.__arrow_c_stream__(requested_schema)
+
+
+def test_subclass_dispatch(gui: Gui, helpers):
+    df = _SubFrame({"name": ["A", "B", "C"], "value": [3, 2, 1]})
+    assert gui._accessors._get_col_types("x", _TaipyData(df, "x")) == {"name": "object", "value": "int64"}
+    value = gui._accessors._get_data(gui, "x", _TaipyData(df, "x"), {"start": 0, "end": -1})["value"]
+    assert value["rowcount"] == 3
+    a_dict = OrderedDict(name=["A", "B"])
+    assert gui._accessors._get_col_types("y", _TaipyData(a_dict, "y")) == {"name": "object"}
+
+
+def test_interchange_protocol(gui: Gui, helpers):
+    frame = _InterchangeFrame(pd.DataFrame({"name": ["A", "B", "C"], "value": [3, 2, 1]}))
+    assert gui._accessors._get_col_types("x", _TaipyData(frame, "x")) == {"name": "object", "value": "int64"}
+    payload = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value", "sort": "asc"}
+    value = gui._accessors._get_data(gui, "x", _TaipyData(frame, "x"), payload)["value"]
+    assert value["rowcount"] == 3
+    # the JSON data of DataFrames is encoded, if pyarrow can't import the frame
+    data = json.loads(value["data"]) if isinstance(value["data"], bytes) else value["data"]
+    assert [d["name"] for d in data] == ["C", "B", "A"]
+
+
+def test_interchange_protocol_with_pandas(gui: Gui, helpers):
+    # pyarrow.interchange is not available before pyarrow 11
+    accessor = _InterchangeDataAccessor()
+    accessor._InterchangeDataAccessor__has_arrow_interchange = False
+    frame = _InterchangeFrame(pd.DataFrame({"name": ["A", "B", "C"], "value": [3, 2, 1]}))
+    assert accessor.get_col_types("x", frame) == {"name": "object", "value": "int64"}
+    payload = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value", "sort": "asc"}
+    value = accessor.get_data(gui, "x", frame, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert [d["name"] for d in json.loads(value["data"])] == ["C", "B", "A"]
+
+
+def test_imported_table_size(gui: Gui, helpers):
+    pa = pytest.importorskip("pyarrow")
+    frame = _InterchangeFrame(pd.DataFrame({"value": range(100_000)}))
+    gui._accessors._get_col_types("x", _TaipyData(frame, "x"))
+    # the imported table counts in the memory budget of the cache
+    assert gui._accessors._get_cache().get_size() >= pa.table({"value": range(100_000)}).nbytes
+
+
+def test_arrow_stream(gui: Gui, helpers):
+    pa = pytest.importorskip("pyarrow")
+    if not hasattr(pa.Table, "__arrow_c_stream__"):
+        pytest.skip("The Arrow PyCapsule interface needs pyarrow 14")
+    stream = _ArrowStream(pa.table({"id": list(range(100))}))
+    assert gui._accessors._get_col_types("x", _TaipyData(stream, "x")) == {"id": "int64"}
+    value = gui._accessors._get_data(gui, "x", _TaipyData(stream, "x"), {"columns": ["id"], "start": 10, "end": 11})[
+        "value"
+    ]
+    assert value["rowcount"] == 100
+    assert [d["id"] for d in value["data"]] == [10, 11]
+
+
+def test_unsupported_type(gui: Gui, helpers):
+    with pytest.warns(UserWarning):
+        assert gui._accessors._get_col_types("x", _TaipyData(object(), "x")) == {}
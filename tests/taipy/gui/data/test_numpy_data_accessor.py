@@ -0,0 +1,60 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+
+import numpy
+
+from taipy.gui import Gui
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.numpy_data_accessor import _NumpyDataAccessor
+from taipy.gui.utils import _TaipyData
+
+
+def test_slice(gui: Gui, helpers):
+    accessor = _NumpyDataAccessor()
+    an_array = numpy.arange(3000).reshape(1000, 3)
+    value = accessor.get_data(gui, "x", an_array, {"start": 500, "end": 502}, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 1000
+    assert value["start"] == 500
+    assert [d["_tp_index"] for d in json.loads(value["data"])] == [500, 501, 502]
+    assert [d["2"] for d in json.loads(value["data"])] == [1502, 1505, 1508]
+    # no data frame is built for the whole array
+    assert gui._accessors._get_cache().get("x", an_array, ("dataframe",)) is None
+
+
+def test_etag(gui: Gui, helpers):
+    accessor = _NumpyDataAccessor()
+    an_array = numpy.arange(50)
+    query = {"start": 0, "end": 9, "etag": ""}
+    etag = accessor.get_data(gui, "x", an_array, query, _DataFormat.JSON)["value"]["etag"]
+    query["etag"] = etag
+    assert accessor.get_data(gui, "x", an_array, query, _DataFormat.JSON)["value"] == {
+        "notModified": True,
+        "etag": etag,
+    }
+    # the page did not change but the number of rows did
+    value = accessor.get_data(gui, "x", numpy.arange(60), query, _DataFormat.JSON)["value"]
+    assert value.get("notModified") is None
+    assert value["rowcount"] == 60
+    assert value["etag"] != etag
+
+
+def test_sort(gui: Gui, helpers):
+    accessor = _NumpyDataAccessor()
+    an_array = numpy.array([("A", 3), ("B", 1), ("C", 2)], dtype=[("name", "U1"), ("value", "i8")])
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value", "sort": "asc"}
+    value = accessor.get_data(gui, "x", an_array, query, _DataFormat.JSON)["value"]
+    assert [d["name"] for d in json.loads(value["data"])] == ["B", "C", "A"]
+    df = gui._accessors._get_cache().get("x", an_array, ("dataframe",))
+    assert df is not None
+    assert gui._accessors._get_col_types("x", _TaipyData(an_array, "x")) == {"name": "object", "value": "int64"}
+    assert gui._accessors._get_cache().get("x", an_array, ("dataframe",)) is df
@@ -9,17 +9,23 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import gzip
 import inspect
+import json
+import tracemalloc
 from datetime import datetime
 from importlib import util
 
+import numpy
 import pandas  # type: ignore
+import pytest
 from flask import g
 
 from taipy.gui import Gui
 from taipy.gui.data.data_format import _DataFormat
 from taipy.gui.data.decimator import ScatterDecimator
 from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+from taipy.gui.utils import _TaipyData
 
 
 def test_simple_data(gui: Gui, helpers, small_dataframe):
@@ -30,7 +36,7 @@ def test_simple_data(gui: Gui, helpers, small_dataframe):
     value = ret_data["value"]
     assert value
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 3
 
 
@@ -47,6 +53,81 @@ def test_simple_data_with_arrow(gui: Gui, helpers, small_dataframe):
         assert isinstance(data, bytes)
 
 
+def test_arrow_stream(gui: Gui, helpers, small_dataframe):
+    if util.find_spec("pyarrow"):
+        import pyarrow as pa
+
+        accessor = _PandasDataAccessor()
+        pd = pandas.DataFrame(data=small_dataframe)
+        query = {"columns": ["name", "value"], "start": 1, "end": 2}
+        value = accessor.get_data(gui, "x", pd, query, _DataFormat.APACHE_ARROW)["value"]
+        table = pa.ipc.open_stream(value["data"]).read_all()
+        # the row positions are only sent in the index column
+        assert table.column_names == ["name", "value", "_tp_index"]
+        assert table.column("_tp_index").to_pylist() == [1, 2]
+        assert table.column("name").to_pylist() == ["B", "C"]
+
+
+def test_json_encoding(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [1.5, numpy.nan, numpy.inf],
+            "nullable": pandas.array([1, None, 3], dtype="Int64"),
+            "str": ["a", None, 'b,"c"'],
+            "bool": [True, False, True],
+        }
+    )
+    value = accessor.get_data(gui, "x", pd, {"start": 0, "end": -1}, _DataFormat.JSON)["value"]
+    assert isinstance(value["data"], bytes)
+    # NaN, infinite and missing values are null
+    assert json.loads(value["data"]) == [
+        {"int": 1, "float": 1.5, "nullable": 1, "str": "a", "bool": True, "_tp_index": 0},
+        {"int": 2, "float": None, "nullable": None, "str": None, "bool": False, "_tp_index": 1},
+        {"int": 3, "float": None, "nullable": 3, "str": 'b,"c"', "bool": True, "_tp_index": 2},
+    ]
+    value = accessor.get_data(gui, "x", pd, {"columns": ["float", "str"], "alldata": True}, _DataFormat.JSON)["value"]
+    assert json.loads(value["data"]) == {"float": [1.5, None, None], "str": ["a", None, 'b,"c"']}
+
+
+def test_arrow_compression(gui: Gui, helpers):
+    pa = pytest.importorskip("pyarrow")
+    df = pandas.DataFrame({"value": numpy.arange(10_000) % 10})
+    gui.run(run_server=False, use_arrow=True, data_compression_threshold=1000)
+    query = {"columns": ["value"], "alldata": True}
+    value = gui._accessors._get_data(gui, "x", _TaipyData(df, "x"), query)["value"]
+    assert "compression" not in value
+    # the element asks for compression
+    value = gui._accessors._get_data(gui, "x", _TaipyData(df, "x"), {**query, "compression": True})["value"]
+    assert value["compression"] == "gzip"
+    table = pa.ipc.open_stream(gzip.decompress(value["data"])).read_all()
+    assert table.column("value").to_pylist() == df["value"].tolist()
+    # small transfers are not compressed
+    gui._accessors._set_compression(True, 1000)
+    value = gui._accessors._get_data(gui, "x", _TaipyData(df.head(10), "x"), query)["value"]
+    assert "compression" not in value
+
+
+def test_data_format(gui: Gui, helpers):
+    pytest.importorskip("pyarrow")
+    gui.run(run_server=False, arrow_min_cells=100)
+    data = _TaipyData(pandas.DataFrame({"a": range(1000), "b": range(1000)}), "x")
+    # 10 rows of 2 columns
+    value = gui._accessors._get_data(gui, "x", data, {"columns": ["a", "b"], "start": 0, "end": 9})["value"]
+    assert value["format"] == "JSON"
+    value = gui._accessors._get_data(gui, "x", data, {"columns": ["a", "b"], "start": 0, "end": 99})["value"]
+    assert value["format"] == "ARROW"
+    # the element asks for a format
+    query = {"columns": ["a", "b"], "alldata": True, "dataformat": "json"}
+    value = gui._accessors._get_data(gui, "x", data, query)["value"]
+    assert value["format"] == "JSON"
+    # a list of values holds a single column
+    value = gui._accessors._get_data(gui, "y", _TaipyData(list(range(200)), "y"), {"alldata": True})["value"]
+    assert value["format"] == "ARROW"
+    assert gui._accessors._get_transfers() == {"JSON": 2, "ARROW": 2}
+
+
 def test_get_all_simple_data(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor()
     pd = pandas.DataFrame(data=small_dataframe)
@@ -55,7 +136,7 @@ def test_get_all_simple_data(gui: Gui, helpers, small_dataframe):
     assert ret_data["alldata"] is True
     value = ret_data["value"]
     assert value
-    data = value["data"]
+    data = json.loads(value["data"])
     assert data == small_dataframe
 
 
@@ -64,21 +145,178 @@ def test_slice(gui: Gui, helpers, small_dataframe):
     pd = pandas.DataFrame(data=small_dataframe)
     value = accessor.get_data(gui, "x", pd, {"start": 0, "end": 1}, _DataFormat.JSON)["value"]
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 2
     value = accessor.get_data(gui, "x", pd, {"start": "0", "end": "1"}, _DataFormat.JSON)["value"]
-    data = value["data"]
+    data = json.loads(value["data"])
     assert len(data) == 2
 
 
+def test_etag(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+    query = {"columns": ["name", "value"], "start": 0, "end": 1}
+    # pages are fingerprinted when the request holds an etag
+    assert "etag" not in accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    query["etag"] = ""
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    etag = value["etag"]
+    assert etag
+    query["etag"] = etag
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    assert value == {"notModified": True, "etag": etag}
+    # a change outside of the page keeps its fingerprint
+    pd.loc[2, "value"] = 10
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    assert value.get("notModified") is True
+    query["end"] = 2
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    assert value["etag"] != etag
+    assert len(json.loads(value["data"])) == 3
+    query["etag"] = value["etag"]
+    pd.loc[2, "value"] = 11
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    assert value.get("notModified") is None
+    assert json.loads(value["data"])[2]["value"] == 11
+
+
 def test_sort(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor()
     pd = pandas.DataFrame(data=small_dataframe)
     query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "name", "sort": "desc"}
-    data = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"]
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
     assert data[0]["name"] == "C"
 
 
+def test_sort_cache(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+    cache = gui._accessors._get_cache()
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value", "sort": "desc"}
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert data[0]["value"] == 3
+    assert len(cache) == 1
+    query["sort"] = "asc"
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert data[0]["value"] == 1
+    assert len(cache) == 1
+    pd.loc[0, "value"] = 4
+    gui._accessors._invalidate("x")
+    assert len(cache) == 0
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert data[-1]["value"] == 4
+
+
+def test_sort_cache_max_size(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+    cache = gui._accessors._get_cache()
+    gui._accessors._set_cache_max_size(len(pd) * 8)
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": "value"}
+    accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert len(cache) == 1
+    query["orderby"] = "name"
+    accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert len(cache) == 1
+    assert cache.get_size() <= cache.get_max_size()
+    gui._accessors._set_cache_max_size(0)
+    assert len(cache) == 0
+
+
+def test_multi_sort(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(
+        data={
+            "name": ["B", "A", "B", "A", None],
+            "value": [1.0, 2.0, numpy.nan, 1.0, 3.0],
+            "mixed": [1, "a", 2, "b", 3],
+        }
+    )
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": ["name", "value"], "sort": ["asc", "desc"]}
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert [d["_tp_index"] for d in data] == [1, 3, 2, 0, 4]
+    query["nanposition"] = "last"
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert [d["_tp_index"] for d in data] == [1, 3, 0, 2, 4]
+    query = {"columns": ["value"], "start": 0, "end": -1, "orderby": "value", "nanposition": "first"}
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert [d["_tp_index"] for d in data] == [2, 0, 3, 1, 4]
+    query = {"columns": ["mixed"], "start": 0, "end": -1, "orderby": "mixed", "sort": "desc"}
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert [d["mixed"] for d in data] == ["b", "a", 3, 2, 1]
+
+
+def test_partial_sort(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    size = 10_000
+    rng = numpy.random.default_rng(42)
+    pd = pandas.DataFrame(
+        data={
+            "int": rng.integers(0, 50, size),
+            "float": rng.random(size).round(2),
+            "date": pandas.Timestamp("2023-01-01") + pandas.to_timedelta(rng.integers(0, 20, size), unit="D"),
+        }
+    )
+    cache = gui._accessors._get_cache()
+    for col in ["int", "float", "date"]:
+        for sort in ["asc", "desc"]:
+            for start, end in [(0, 99), (100, 199), (0, 999)]:
+                query = {"columns": [col], "start": start, "end": end, "orderby": col, "sort": sort}
+                cache.invalidate()
+                partial = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+                cache.invalidate()
+                # a deep page triggers the full sort
+                accessor.get_data(gui, "x", pd, dict(query, start=size - 100, end=size - 1), _DataFormat.JSON)
+                full = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+                assert [d["_tp_index"] for d in partial] == [d["_tp_index"] for d in full]
+    pd.loc[3, "float"] = numpy.nan
+    cache.invalidate()
+    query = {"columns": ["float"], "start": 0, "end": 9, "orderby": "float", "sort": "desc"}
+    data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+    assert data[0]["_tp_index"] == 3
+
+
+def test_paging_memory(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    size = 1_000_000
+    pd = pandas.DataFrame(data={"a": numpy.arange(size), "b": numpy.linspace(0, 1, size)})
+    df_size = pd.memory_usage(index=True).sum()
+    query = {"columns": ["a", "b"], "start": 0, "end": 99, "orderby": "b", "sort": "desc"}
+    # warm the sort cache
+    accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    for q in [query, {"columns": ["a", "b"], "start": size - 100, "end": size - 1}]:
+        tracemalloc.start()
+        data = json.loads(accessor.get_data(gui, "x", pd, q, _DataFormat.JSON)["value"]["data"])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert len(data) == 100
+        assert peak < df_size / 20
+
+
+def test_column_projection(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    size = 2_000
+    pd = pandas.DataFrame(numpy.random.rand(size, 1000), columns=[f"c{i}" for i in range(1000)])
+    pd["date"] = pandas.date_range("2020-01-01", periods=size)
+    for query in [
+        {"columns": ["c0", "date"], "start": 0, "end": size - 1},
+        {"columns": ["c0", "date"], "alldata": True},
+        {"columns": ["c0", "date"], "alldata": True, "filters": [{"col": "c1", "action": ">", "value": -1}]},
+    ]:
+        tracemalloc.start()
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # the other columns are not copied
+        assert peak < pd.memory_usage(index=True).sum() / 10
+        if isinstance(data, dict):
+            assert set(data.keys()) == {"c0", "date_str"}
+            assert len(data["c0"]) == size
+        else:
+            assert set(data[0].keys()) == {"c0", "date_str", "_tp_index"}
+            assert len(data) == size
+
+
 def test_aggregate(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor()
     pd = pandas.DataFrame(data=small_dataframe)
@@ -88,8 +326,16 @@ def test_aggregate(gui: Gui, helpers, small_dataframe):
     query = {"columns": ["name", "value"], "start": 0, "end": -1, "aggregates": ["name"], "applies": {"value": "sum"}}
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
     assert value["rowcount"] == 3
-    data = value["data"]
+    data = json.loads(value["data"])
     assert next(v.get("value") for v in data if v.get("name") == "A") == 5
+    cache = gui._accessors._get_cache()
+    assert len(cache) == 1
+    query.update({"start": 1, "orderby": "value", "sort": "desc"})
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert [v.get("value") for v in json.loads(value["data"])] == [3, 2]
+    # the aggregated frame is reused, only the sort permutation is added
+    assert len(cache) == 2
 
 
 def test_filters(gui: Gui, helpers, small_dataframe):
@@ -105,7 +351,7 @@ def test_filters(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "name", "action": "!=", "value": ""}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 4
+    assert len(json.loads(value["value"]["data"])) == 4
 
     query = {
         "columns": ["name", "value"],
@@ -114,7 +360,7 @@ def test_filters(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "name", "action": "==", "value": ""}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 0
+    assert len(json.loads(value["value"]["data"])) == 0
 
     query = {
         "columns": ["name", "value"],
@@ -123,7 +369,7 @@ def test_filters(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "name", "action": "==", "value": "A"}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 2
+    assert len(json.loads(value["value"]["data"])) == 2
 
     query = {
         "columns": ["name", "value"],
@@ -132,7 +378,7 @@ def test_filters(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "name", "action": "==", "value": "A"}, {"col": "value", "action": "==", "value": 2}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 0
+    assert len(json.loads(value["value"]["data"])) == 0
 
     query = {
         "columns": ["name", "value"],
@@ -141,8 +387,81 @@ def test_filters(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "name", "action": "!=", "value": "A"}, {"col": "value", "action": "==", "value": 2}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 1
-    assert value["value"]["data"][0]["_tp_index"] == 1
+    assert len(json.loads(value["value"]["data"])) == 1
+    assert json.loads(value["value"]["data"])[0]["_tp_index"] == 1
+
+
+def test_filters_contains(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+    pd["label"] = ["first", None, "third"]
+    query = {
+        "columns": ["name", "value"],
+        "start": 0,
+        "end": -1,
+        "filters": [{"col": "label", "action": "contains", "value": "ir"}],
+    }
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert value["value"]["rowcount"] == 2
+    assert [d["_tp_index"] for d in json.loads(value["value"]["data"])] == [0, 2]
+
+
+def test_filters_cache(gui: Gui, helpers, small_dataframe):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+    cache = gui._accessors._get_cache()
+    query = {
+        "columns": ["name", "value"],
+        "start": 0,
+        "end": -1,
+        "filters": [{"col": "value", "action": ">", "value": 1}],
+    }
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert len(json.loads(value["value"]["data"])) == 2
+    # one mask and one combined row selection
+    assert len(cache) == 2
+    query["filters"].append({"col": "name", "action": "!=", "value": "C"})
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert len(json.loads(value["value"]["data"])) == 1
+    # the mask for 'value > 1' is reused
+    assert len(cache) == 4
+    query["filters"] = [{"col": "value", "action": "~", "value": 1}]
+    with pytest.warns(UserWarning):
+        value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert len(json.loads(value["value"]["data"])) == 3
+
+
+def test_search(gui: Gui, helpers):
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(
+        data={
+            "name": ["Alice Smith", "Bob", "alicia", None, "Al"],
+            "city": ["Paris", "London", "Lisbon", "Berlin", "Malibu"],
+            "value": [1, 2, 3, 4, 5],
+        }
+    )
+    cache = gui._accessors._get_cache()
+    query = {"columns": ["name", "city", "value"], "start": 0, "end": -1, "search": "ALI"}
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert [d["_tp_index"] for d in json.loads(value["value"]["data"])] == [0, 2, 4]
+    # one index per string column and the searched rows
+    assert len(cache) == 3
+    query["search"] = "li"
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert [d["_tp_index"] for d in json.loads(value["value"]["data"])] == [0, 2, 3, 4]
+    assert len(cache) == 4
+    query["search"] = "ce sm"
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert [d["_tp_index"] for d in json.loads(value["value"]["data"])] == [0]
+    # only the displayed columns are searched, with the filters
+    query.update(
+        {"columns": ["name", "value"], "search": "li", "filters": [{"col": "value", "action": ">", "value": 1}]}
+    )
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert [d["_tp_index"] for d in json.loads(value["value"]["data"])] == [2]
+    query.update({"search": "xyz", "filters": []})
+    value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
+    assert value["value"]["rowcount"] == 0
 
 
 def test_filter_by_date(gui: Gui, helpers, small_dataframe):
@@ -160,7 +479,7 @@ def test_filter_by_date(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "a date", "action": ">", "value": datetime.fromisocalendar(2022, 28, 3).isoformat() + "Z"}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 0
+    assert len(json.loads(value["value"]["data"])) == 0
     query = {
         "columns": ["name", "value"],
         "start": 0,
@@ -168,7 +487,7 @@ def test_filter_by_date(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "a date", "action": ">", "value": datetime.fromisocalendar(2022, 28, 2).isoformat() + "Z"}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 1
+    assert len(json.loads(value["value"]["data"])) == 1
     query = {
         "columns": ["name", "value"],
         "start": 0,
@@ -176,7 +495,7 @@ def test_filter_by_date(gui: Gui, helpers, small_dataframe):
         "filters": [{"col": "a date", "action": "<", "value": datetime.fromisocalendar(2022, 28, 3).isoformat() + "Z"}],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 2
+    assert len(json.loads(value["value"]["data"])) == 2
     query = {
         "columns": ["name", "value"],
         "start": 0,
@@ -187,7 +506,7 @@ def test_filter_by_date(gui: Gui, helpers, small_dataframe):
         ],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 0
+    assert len(json.loads(value["value"]["data"])) == 0
     query = {
         "columns": ["name", "value"],
         "start": 0,
@@ -198,7 +517,7 @@ def test_filter_by_date(gui: Gui, helpers, small_dataframe):
         ],
     }
     value = accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)
-    assert len(value["value"]["data"]) == 1
+    assert len(json.loads(value["value"]["data"])) == 1
 
 
 def test_decimator(gui: Gui, helpers, small_dataframe):
@@ -238,5 +557,80 @@ def test_decimator(gui: Gui, helpers, small_dataframe):
         assert ret_data
         value = ret_data["value"]
         assert value
-        data = value["data"]
+        data = json.loads(value["data"])
         assert len(data) == 2
+
+
+def test_styles(gui: Gui, helpers, small_dataframe, monkeypatch):
+    style_calls = []
+
+    threshold = 1  # noqa: F841
+
+    def row_style(state, index, row):
+        style_calls.append(index)
+        return "high" if row["value"] > state.threshold else "low"
+
+    def page_style(state, values: pandas.Series, index, rows, column_name):
+        style_calls.append(len(values))
+        return values.map(lambda v: "high" if v > 1 else "low")
+
+    accessor = _PandasDataAccessor()
+    pd = pandas.DataFrame(data=small_dataframe)
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", "<|Hello {row_style}|button|><|{threshold}|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+
+    cid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={cid}")
+    with gui.get_flask_app().test_request_context(f"/taipy-jsx/test/?client_id={cid}", data={"client_id": cid}):
+        g.client_id = cid
+        style_calls.clear()
+        query = {"columns": ["name", "value"], "start": 0, "end": 1, "styles": {"tp_line": "row_style"}}
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["row_style"] for d in data] == ["low", "high"]
+        assert style_calls == [0, 1]
+        # only the rows that are not cached are evaluated
+        query["end"] = 2
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["row_style"] for d in data] == ["low", "high", "high"]
+        assert style_calls == [0, 1, 2]
+
+        style_calls.clear()
+        query = {"columns": ["name", "value"], "start": 1, "end": 2, "styles": {"value": "page_style"}}
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["tps__value__page_style"] for d in data] == ["high", "high"]
+        assert style_calls == [2]
+
+        # user functions read whole rows even if their columns are not sent
+        query = {"columns": ["name"], "start": 0, "end": 1, "styles": {"tp_line": "row_style"}}
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["row_style"] for d in data] == ["low", "high"]
+        assert "value" not in data[0]
+
+        # the results of a client are not used for the others
+        gui._bindings()._get_or_create_scope("other")
+        g.client_id = "other"
+        style_calls.clear()
+        query = {"columns": ["name", "value"], "start": 0, "end": 1, "styles": {"tp_line": "row_style"}}
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["row_style"] for d in data] == ["low", "high"]
+        assert style_calls == [0, 1]
+
+        # the results are computed again when the state changes
+        style_calls.clear()
+        gui._Gui__state.threshold = 0
+        data = json.loads(accessor.get_data(gui, "x", pd, query, _DataFormat.JSON)["value"]["data"])
+        assert [d["row_style"] for d in data] == ["high", "high"]
+        assert style_calls == [0, 1]
+
+        # only the results of the sent rows are kept when there are too many
+        monkeypatch.setattr(_PandasDataAccessor, "_PandasDataAccessor__MAX_USER_FUNCTION_RESULTS", 2)
+        style_calls.clear()
+        accessor.get_data(gui, "x", pd, {**query, "start": 1, "end": 2}, _DataFormat.JSON)
+        accessor.get_data(gui, "x", pd, {**query, "start": 0, "end": 0}, _DataFormat.JSON)
+        assert style_calls == [2, 0]
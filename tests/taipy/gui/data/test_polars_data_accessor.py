@@ -0,0 +1,203 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+from datetime import datetime
+from importlib import util
+
+import pandas  # type: ignore
+import pytest
+from flask import g
+
+from taipy.gui import Gui
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.decimator import ScatterDecimator
+from taipy.gui.utils import _TaipyData
+
+polars = pytest.importorskip("polars")
+
+from taipy.gui.data.polars_data_accessor import _PolarsDataAccessor  # noqa: E402
+
+
+def test_simple_data(gui: Gui, helpers, small_dataframe):
+    accessor = _PolarsDataAccessor()
+    df = polars.DataFrame(small_dataframe)
+    value = accessor.get_data(gui, "x", df, {"start": 0, "end": -1}, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert value["data"] == [
+        {"_tp_index": 0, "name": "A", "value": 1},
+        {"_tp_index": 1, "name": "B", "value": 2},
+        {"_tp_index": 2, "name": "C", "value": 3},
+    ]
+    value = accessor.get_data(gui, "x", df.lazy(), {"start": 1, "end": 1}, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert value["data"] == [{"_tp_index": 1, "name": "B", "value": 2}]
+
+
+def test_simple_data_with_arrow(gui: Gui, helpers, small_dataframe):
+    if util.find_spec("pyarrow"):
+        accessor = _PolarsDataAccessor()
+        df = polars.DataFrame(small_dataframe)
+        value = accessor.get_data(gui, "x", df, {"start": 0, "end": -1}, _DataFormat.APACHE_ARROW)["value"]
+        assert value["rowcount"] == 3
+        assert isinstance(value["data"], bytes)
+
+
+def test_get_all_simple_data(gui: Gui, helpers, small_dataframe):
+    accessor = _PolarsDataAccessor()
+    df = polars.DataFrame(small_dataframe)
+    ret_data = accessor.get_data(gui, "x", df, {"alldata": True}, _DataFormat.JSON)
+    assert ret_data["alldata"] is True
+    assert ret_data["value"]["data"] == small_dataframe
+
+
+def test_dispatch(gui: Gui, helpers, small_dataframe):
+    df = polars.DataFrame(small_dataframe)
+    assert gui._accessors._get_col_types("x", _TaipyData(df, "x")) == {"name": "object", "value": "int64"}
+    assert gui._accessors._get_col_types("x", _TaipyData(df.lazy(), "x")) == {"name": "object", "value": "int64"}
+    # pandas DataFrames still use the pandas accessor
+    pd = pandas.DataFrame(small_dataframe)
+    assert gui._accessors._get_col_types("x", _TaipyData(pd, "x")) == {"name": "object", "value": "int64"}
+
+
+def test_sort_and_filter(gui: Gui, helpers):
+    accessor = _PolarsDataAccessor()
+    df = polars.DataFrame({"name": ["B", "A", "B", "A", None], "value": [1.0, 2.0, float("nan"), 1.0, 3.0]})
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "orderby": ["name", "value"], "sort": ["asc", "desc"]}
+    data = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]["data"]
+    assert [d["_tp_index"] for d in data] == [1, 3, 2, 0, 4]
+    assert data[2]["value"] is None
+    query = {"columns": ["value"], "start": 0, "end": -1, "orderby": "value", "nanposition": "first"}
+    data = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]["data"]
+    assert [d["_tp_index"] for d in data] == [2, 0, 3, 1, 4]
+    query = {
+        "columns": ["name", "value"],
+        "start": 0,
+        "end": -1,
+        "filters": [{"col": "name", "action": "contains", "value": "A"}, {"col": "value", "action": ">", "value": 1}],
+    }
+    value = accessor.get_data(gui, "x", df.lazy(), query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 1
+    assert value["data"] == [{"_tp_index": 1, "name": "A", "value": 2.0}]
+    query["filters"] = [{"col": "name", "action": ">", "value": 1}]
+    with pytest.warns(UserWarning):
+        value = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 5
+
+
+def test_aggregate(gui: Gui, helpers, small_dataframe):
+    accessor = _PolarsDataAccessor()
+    df = polars.concat([polars.DataFrame(small_dataframe), polars.DataFrame({"name": ["A"], "value": [4]})])
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "aggregates": ["name"], "applies": {"value": "sum"}}
+    value = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert value["data"] == [
+        {"name": "A", "value": 5, "_tp_index": 0},
+        {"name": "B", "value": 2, "_tp_index": 1},
+        {"name": "C", "value": 3, "_tp_index": 2},
+    ]
+
+
+def test_dates(gui: Gui, helpers):
+    accessor = _PolarsDataAccessor()
+    tz = Gui._get_timezone()
+    Gui._set_timezone("UTC")
+    df = polars.DataFrame({"date": [datetime(2023, 1, 1), datetime(2023, 6, 1, 12, 30)], "value": [1, 2]})
+    query = {
+        "columns": ["date", "value"],
+        "start": 0,
+        "end": -1,
+        "filters": [{"col": "date", "action": ">", "value": "2023-03-01T00:00:00.000Z"}],
+    }
+    try:
+        data = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]["data"]
+    finally:
+        Gui._set_timezone(tz)
+    assert data == [{"_tp_index": 1, "value": 2, "date_str": "2023-06-01T12:30:00.000000Z"}]
+
+
+def test_decimator(gui: Gui, helpers):
+    a_decimator = ScatterDecimator()  # noqa: F841
+
+    accessor = _PolarsDataAccessor()
+    df = polars.DataFrame({"x": [i % 2 for i in range(200)], "y": [i % 2 for i in range(200)], "z": [0] * 200})
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", "<|Hello {a_decimator}|button|id={btn_id}|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+
+    cid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={cid}")
+    with gui.get_flask_app().test_request_context(f"/taipy-jsx/test/?client_id={cid}", data={"client_id": cid}):
+        g.client_id = cid
+
+        ret_data = accessor.get_data(
+            gui,
+            "x",
+            df,
+            {
+                "columns": ["x", "y"],
+                "alldata": True,
+                "decimatorPayload": {
+                    "decimators": [{"decimator": "a_decimator", "chartMode": "markers", "xAxis": "x", "yAxis": "y"}],
+                    "width": 100,
+                    "height": 100,
+                },
+            },
+            _DataFormat.JSON,
+        )
+        data = ret_data["value"]["data"]
+        assert list(data.keys()) == ["x", "y"]
+        # 3 points are kept in each of the 2 grid cells
+        assert data["x"] == [0, 1, 0, 1, 0, 1]
+
+
+def test_styles(gui: Gui, helpers, small_dataframe):
+    def row_style(state, index, row):
+        return "high" if row["value"] > 1 else "low"
+
+    def page_style(state, values: polars.Series, index, rows, column_name):
+        return values.map_elements(lambda v: "high" if v > 2 else "low", return_dtype=polars.String)
+
+    accessor = _PolarsDataAccessor()
+    df = polars.DataFrame(small_dataframe)
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", "<|Hello {row_style}|button|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+
+    cid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={cid}")
+    with gui.get_flask_app().test_request_context(f"/taipy-jsx/test/?client_id={cid}", data={"client_id": cid}):
+        g.client_id = cid
+        query = {
+            "columns": ["name", "value"],
+            "start": 0,
+            "end": -1,
+            "styles": {"tp_line": "row_style", "value": "page_style"},
+        }
+        data = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]["data"]
+        assert [d["row_style"] for d in data] == ["low", "high", "high"]
+        assert [d["tps__value__page_style"] for d in data] == ["low", "low", "high"]
+
+        # user functions read whole rows even if their columns are not sent
+        query = {"columns": ["name"], "start": 0, "end": -1, "styles": {"tp_line": "row_style"}}
+        data = accessor.get_data(gui, "x", df, query, _DataFormat.JSON)["value"]["data"]
+        assert [d["row_style"] for d in data] == ["low", "high", "high"]
+        assert "value" not in data[0]
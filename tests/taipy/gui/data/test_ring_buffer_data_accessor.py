@@ -0,0 +1,149 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+from threading import Thread
+
+import numpy as np
+import pytest
+from flask import g
+
+from taipy.gui import Gui
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.decimator import MinMaxDecimator
+from taipy.gui.data.ring_buffer import RingBuffer
+from taipy.gui.data.ring_buffer_data_accessor import _RingBufferDataAccessor
+from taipy.gui.utils import _TaipyData
+
+
+def get_buffer(nb_rows: int) -> RingBuffer:
+    buffer = RingBuffer({"id": np.int64, "name": object, "value": np.float64}, capacity=10)
+    buffer.extend(
+        {"id": np.arange(nb_rows), "name": [f"n{i % 3}" for i in range(nb_rows)], "value": np.arange(nb_rows) / 2}
+    )
+    return buffer
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(["x", "y"], capacity=4)
+    buffer.append({"x": 1, "y": 10})
+    buffer.extend([(2, 20), (3, 30)])
+    assert len(buffer) == 3
+    buffer.extend({"x": [4, 5, 6], "y": [40, 50, 60]})
+    assert len(buffer) == 4
+    assert buffer.to_dict()["x"].tolist() == [3, 4, 5, 6]
+    buffer.extend({"x": range(7, 17), "y": range(70, 170, 10)})
+    assert buffer.to_dict()["y"].tolist() == [130, 140, 150, 160]
+    with pytest.raises(ValueError):
+        buffer.extend({"x": [1], "y": [1, 2]})
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_dispatch(gui: Gui, helpers):
+    assert gui._accessors._get_col_types("x", _TaipyData(get_buffer(3), "x")) == {
+        "id": "int64",
+        "name": "object",
+        "value": "float64",
+    }
+
+
+def test_page(gui: Gui, helpers):
+    accessor = _RingBufferDataAccessor()
+    buffer = get_buffer(25)
+    value = accessor.get_data(gui, "x", buffer, {"columns": ["id", "name"], "start": 2, "end": 4}, _DataFormat.JSON)[
+        "value"
+    ]
+    assert value["rowcount"] == 10
+    assert value["start"] == 2
+    # rows 15 to 24 are kept
+    assert value["data"] == [
+        {"id": 17, "name": "n2", "_tp_index": 2},
+        {"id": 18, "name": "n0", "_tp_index": 3},
+        {"id": 19, "name": "n1", "_tp_index": 4},
+    ]
+
+
+def test_sort_and_filter(gui: Gui, helpers):
+    accessor = _RingBufferDataAccessor()
+    buffer = get_buffer(25)
+    buffer.append({"id": 25, "name": None, "value": np.nan})
+    payload = {
+        "columns": ["id", "value"],
+        "start": 0,
+        "end": -1,
+        "orderby": ["name", "value"],
+        "sort": ["desc", "asc"],
+        "filters": [{"col": "id", "action": ">", "value": 19}],
+    }
+    value = accessor.get_data(gui, "x", buffer, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 6
+    assert [d["id"] for d in value["data"]] == [25, 20, 23, 22, 21, 24]
+    assert value["data"][0]["value"] is None
+    payload["filters"] = [{"col": "name", "action": "contains", "value": "1"}]
+    payload["orderby"] = "id"
+    payload["sort"] = "desc"
+    value = accessor.get_data(gui, "x", buffer, payload, _DataFormat.JSON)["value"]
+    assert [d["id"] for d in value["data"]] == [22, 19, 16]
+    assert [d["_tp_index"] for d in value["data"]] == [6, 3, 0]
+
+
+def test_chart_data(gui: Gui, helpers):
+    a_decimator = MinMaxDecimator(n_out=100)  # noqa: F841
+
+    accessor = _RingBufferDataAccessor()
+    buffer = RingBuffer(["x", "y"], capacity=1000)
+    buffer.extend({"x": np.arange(1500), "y": np.sin(np.arange(1500) / 50)})
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", "<|Hello {a_decimator}|button|>")
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+
+    cid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={cid}")
+    with gui.get_flask_app().test_request_context(f"/taipy-jsx/test/?client_id={cid}", data={"client_id": cid}):
+        g.client_id = cid
+        payload = {
+            "columns": ["x", "y"],
+            "alldata": True,
+            "decimatorPayload": {
+                "decimators": [{"decimator": "a_decimator", "xAxis": "x", "yAxis": "y", "chartMode": "lines+markers"}],
+                "width": 100,
+            },
+        }
+        value = accessor.get_data(gui, "x", buffer, payload, _DataFormat.JSON)["value"]
+        assert value["dataExtraction"] is True
+        assert len(value["data"]["x"]) <= 100
+        # rows 500 to 1499 are kept
+        assert value["data"]["x"][0] >= 500
+        assert value["data"]["x"] == sorted(value["data"]["x"])
+
+
+def test_concurrent_writes(gui: Gui, helpers):
+    buffer = RingBuffer(["a", "b"], capacity=100)
+
+    def write(offset: int):
+        for i in range(1000):
+            buffer.append((offset + i, offset + i))
+
+    threads = [Thread(target=write, args=(i * 1000,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    values = buffer.to_dict()
+    assert len(buffer) == 100
+    # the columns of each row are written together
+    assert values["a"].tolist() == values["b"].tolist()
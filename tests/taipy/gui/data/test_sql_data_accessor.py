@@ -0,0 +1,139 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import sqlite3
+
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.sql_data_accessor import _SqlDataAccessor
+from taipy.gui.data.sql_query import SqlQuery
+from taipy.gui.utils import _TaipyData
+
+
+@pytest.fixture(scope="function")
+def db_path(tmp_path):
+    path = str(tmp_path / "data.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE items (id INTEGER, name TEXT, value REAL)")
+    connection.executemany(
+        "INSERT INTO items VALUES (?, ?, ?)",
+        [(i, ["A", "B", "C"][i % 3], None if i % 10 == 0 else float(i % 7)) for i in range(100)],
+    )
+    connection.commit()
+    connection.close()
+    yield path
+
+
+def test_dispatch(gui: Gui, helpers, db_path):
+    query = SqlQuery("SELECT * FROM items", lambda: sqlite3.connect(db_path))
+    assert gui._accessors._get_col_types("x", _TaipyData(query, "x")) == {
+        "id": "int64",
+        "name": "object",
+        "value": "float64",
+    }
+    # the types are inferred once
+    assert gui._accessors._get_cache().get("x", query, ("col_types",)) is not None
+
+
+def test_page(gui: Gui, helpers, db_path):
+    accessor = _SqlDataAccessor()
+    query = SqlQuery("SELECT * FROM items WHERE id < ?", lambda: sqlite3.connect(db_path), [50])
+    payload = {"columns": ["id", "name"], "start": 10, "end": 12, "etag": ""}
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 50
+    assert value["start"] == 10
+    assert json.loads(value["data"]) == [
+        {"id": 10, "name": "B", "_tp_index": 10},
+        {"id": 11, "name": "C", "_tp_index": 11},
+        {"id": 12, "name": "A", "_tp_index": 12},
+    ]
+
+    # the fingerprint of a page depends on the rows of the query
+    query = SqlQuery("SELECT * FROM items WHERE id < ?", lambda: sqlite3.connect(db_path), [60])
+    payload = {"columns": ["id", "name"], "start": 10, "end": 12, "etag": value["etag"]}
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 60
+    assert value["etag"] != payload["etag"]
+    payload["etag"] = value["etag"]
+    assert accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"] == {
+        "notModified": True,
+        "etag": value["etag"],
+    }
+
+
+def test_sort_and_filter(gui: Gui, helpers, db_path):
+    accessor = _SqlDataAccessor()
+    query = SqlQuery("SELECT * FROM items", lambda: sqlite3.connect(db_path))
+    payload = {
+        "columns": ["id", "name", "value"],
+        "start": 0,
+        "end": 3,
+        "orderby": ["name", "value"],
+        "sort": ["desc", "asc"],
+        "filters": [{"col": "id", "action": "<", "value": 30}],
+    }
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 30
+    # NULL values come last when ascending
+    data = json.loads(value["data"])
+    assert [(d["name"], d["value"]) for d in data] == [("C", 0.0), ("C", 1.0), ("C", 1.0), ("C", 2.0)]
+    payload.update({"sort": ["desc", "desc"], "end": 0})
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    data = json.loads(value["data"])
+    assert data[0]["name"] == "C" and data[0]["value"] is None
+    # counts are cached per filter set
+    cache = gui._accessors._get_cache()
+    filters_key = (("id", "<", "30"),)
+    assert cache.get("x", query, ("rowcount", ("filters", filters_key))) == 30
+    payload["filters"] = [{"col": "name", "action": "contains", "value": "B"}]
+    assert accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]["rowcount"] == 33
+    # LIKE wildcards are searched as they are
+    for pattern in ("_", "%", "!"):
+        payload["filters"] = [{"col": "name", "action": "contains", "value": pattern}]
+        assert accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]["rowcount"] == 0
+    payload["filters"] = [{"col": "unknown", "action": "==", "value": 1}]
+    with pytest.warns(UserWarning):
+        assert accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]["rowcount"] == 100
+
+
+def test_aggregate(gui: Gui, helpers, db_path):
+    accessor = _SqlDataAccessor()
+    query = SqlQuery("SELECT * FROM items", lambda: sqlite3.connect(db_path))
+    payload = {"columns": ["name", "id"], "start": 0, "end": -1, "aggregates": ["name"], "applies": {"id": "sum"}}
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 3
+    assert json.loads(value["data"]) == [
+        {"name": "A", "id": sum(range(0, 100, 3)), "_tp_index": 0},
+        {"name": "B", "id": sum(range(1, 100, 3)), "_tp_index": 1},
+        {"name": "C", "id": sum(range(2, 100, 3)), "_tp_index": 2},
+    ]
+
+
+def test_get_all_data(gui: Gui, helpers, db_path):
+    accessor = _SqlDataAccessor()
+    connection = sqlite3.connect(db_path, check_same_thread=False)
+    query = SqlQuery("SELECT id, name FROM items WHERE id < 3", connection)
+    value = accessor.get_data(gui, "x", query, {"alldata": True}, _DataFormat.JSON)["value"]
+    assert json.loads(value["data"]) == {"id": [0, 1, 2], "name": ["A", "B", "C"]}
+    connection.close()
+
+
+def test_sqlalchemy_engine(gui: Gui, helpers, db_path):
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    accessor = _SqlDataAccessor()
+    query = SqlQuery("SELECT * FROM items", sqlalchemy.create_engine(f"sqlite:///{db_path}"))
+    payload = {"columns": ["id"], "start": 0, "end": 1, "orderby": "id", "sort": "desc"}
+    value = accessor.get_data(gui, "x", query, payload, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 100
+    assert [d["id"] for d in json.loads(value["data"])] == [99, 98]
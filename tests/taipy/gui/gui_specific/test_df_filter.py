@@ -16,7 +16,7 @@ from taipy.gui.data.decimator.lttb import LTTB
 from taipy.gui.data.decimator.minmax import MinMaxDecimator
 from taipy.gui.data.decimator.rdp import RDP
 from taipy.gui.data.decimator.scatter_decimator import ScatterDecimator
-from taipy.gui.data.utils import _df_data_filter
+from taipy.gui.data.utils import _df_data_filter, _df_relayout
 
 
 def test_data_filter_1(csvdata):
@@ -44,3 +44,24 @@ def test_data_filter_5(csvdata):
         csvdata[:1500], None, "Daily hospital occupancy", "", ScatterDecimator(), {"width": 200, "height": 100}, False
     )
     assert df.shape[0] == 1150
+
+
+def test_data_filter_no_copy(csvdata):
+    df = csvdata[:1500]
+    columns = df.columns.tolist()
+    filtered_df, _ = _df_data_filter(df, None, "Daily hospital occupancy", "", MinMaxDecimator(100), {}, False)
+    assert filtered_df.shape[0] == 100
+    assert df.columns.tolist() == columns
+    assert filtered_df.columns.tolist() == columns
+
+
+def test_df_relayout(csvdata):
+    df = csvdata[:1500]
+    columns = df.columns.tolist()
+    relayout_df, is_copied = _df_relayout(df, None, "Daily hospital occupancy", "lines+markers", 100, 200, 0, 1, False)
+    assert is_copied
+    assert relayout_df.shape[0] == 99
+    assert (relayout_df.index > 100).all() and (relayout_df.index < 200).all()
+    assert relayout_df.columns.tolist() == columns
+    relayout_df, _ = _df_relayout(df, None, "Daily hospital occupancy", "markers", 100, 200, 0, 1000, False)
+    assert (relayout_df["Daily hospital occupancy"] < 1000).all()
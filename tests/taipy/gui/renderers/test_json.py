@@ -0,0 +1,23 @@
+# Copyright 2023 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from taipy.gui import Gui
+from taipy.gui._renderers.json import _dumps, _TaipyJsonFragment
+
+
+def test_json_fragment(gui: Gui, helpers):
+    gui.run(run_server=False)
+    fragment = _TaipyJsonFragment(_dumps({"values": [1, 2.5, None]}))
+    message = {"type": "MU", "payload": [{"name": "x", "payload": {"value": fragment}}, {"name": "y", "value": 1}]}
+    # the encoded value is inserted as it is
+    assert gui._server.get_flask().json.dumps(message, separators=(",", ":")) == (
+        '{"type":"MU","payload":[{"name":"x","payload":{"value":{"values":[1,2.5,null]}}},{"name":"y","value":1}]}'
+    )
@@ -10,8 +10,13 @@
 # specific language governing permissions and limitations under the License.
 
 import inspect
+import json
+import time
+
+import pandas as pd
 
 from taipy.gui import Gui, Markdown
+from taipy.gui.data.ring_buffer import RingBuffer
 
 
 def test_du_table_data_fetched(gui: Gui, helpers, csvdata):
@@ -49,12 +54,20 @@ def test_du_table_data_fetched(gui: Gui, helpers, csvdata):
                 "end": 9,
                 "orderby": "",
                 "sort": "asc",
+                "etag": "",
             },
         },
     )
     # assert for received message (message that would be sent to the front-end client)
     received_messages = ws_client.get_received()
     assert received_messages
+    # fingerprint of the page
+    value = received_messages[0]["args"]["payload"][0]["payload"]["value"]
+    etag = value.pop("etag")
+    assert etag
+    # the rows are sent as encoded JSON
+    assert isinstance(value["data"], bytes)
+    value["data"] = json.loads(value["data"])
     helpers.assert_outward_ws_message(
         received_messages[0],
         "MU",
@@ -137,3 +150,173 @@ def test_du_table_data_fetched(gui: Gui, helpers, csvdata):
             "format": "JSON",
         },
     )
+    # the page the front-end holds did not change
+    ws_client.emit(
+        "message",
+        {
+            "client_id": sid,
+            "type": "DU",
+            "name": "_TpD_tpec_TpExPr_csvdata_TPMDL_0",
+            "payload": {
+                "columns": ["Day", "Entity", "Code", "Daily hospital occupancy"],
+                "pagekey": "0-100--asc",
+                "start": 0,
+                "end": 9,
+                "orderby": "",
+                "sort": "asc",
+                "etag": etag,
+            },
+        },
+    )
+    helpers.assert_outward_ws_message(
+        ws_client.get_received()[0],
+        "MU",
+        "_TpD_tpec_TpExPr_csvdata_TPMDL_0",
+        {"notModified": True, "etag": etag},
+    )
+
+
+def test_du_page_etag(gui: Gui, helpers):
+    buffer = RingBuffer(["x", "y"], capacity=10)
+    buffer.extend([(1, 10), (2, 20), (3, 30)])
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", Markdown("<|{buffer}|table|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    var_name = "_TpD_tpec_TpExPr_buffer_TPMDL_0"
+
+    def request_page(**kwargs):
+        payload = {"columns": ["x", "y"], "start": 0, "end": 9, "pagekey": "0-9", **kwargs}
+        ws_client.emit("message", {"client_id": sid, "type": "DU", "name": var_name, "payload": payload})
+        return ws_client.get_received()[0]["args"]["payload"][0]["payload"]["value"]
+
+    # the accessor does not fingerprint its pages: this is only done when a held page is refreshed
+    assert "etag" not in request_page()
+    etag = request_page(etag="")["etag"]
+    assert etag
+    assert request_page(etag=etag) == {"notModified": True, "etag": etag}
+    buffer.append((4, 40))
+    assert request_page(etag=etag)["etag"] != etag
+
+
+def test_du_appended_rows(gui: Gui, helpers):
+    def add_rows(state, id):
+        state.append_rows("df_data", {"name": ["D", "E"], "value": [4, 5]})
+
+    df_data = pd.DataFrame({"name": ["A", "B", "C"], "value": [1, 2, 3]})  # noqa: F841
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", Markdown("<|{df_data}|table|> <|Add|button|on_action=add_rows|id=my_button|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    var_name = "_TpD_tpec_TpExPr_df_data_TPMDL_0"
+
+    def request_data():
+        for pagekey, payload in [
+            ("page", {"columns": ["name", "value"], "start": 0, "end": 5}),
+            ("infinite", {"columns": ["name"], "start": 0, "end": 99, "infinite": True}),
+            ("chart", {"columns": ["value"], "alldata": True}),
+        ]:
+            ws_client.emit(
+                "message",
+                {"client_id": sid, "type": "DU", "name": var_name, "payload": {**payload, "pagekey": pagekey}},
+            )
+        ws_client.get_received()
+
+    def add_rows_and_get_updates():
+        ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "add_rows"})
+        messages = [p for m in ws_client.get_received() if m["args"]["type"] == "MU" for p in m["args"]["payload"]]
+        return [m["payload"] for m in messages if m["name"].startswith(var_name)]
+
+    request_data()
+    # requests are only followed once rows were appended to the variable: the first append refreshes all the data
+    updates = add_rows_and_get_updates()
+    assert len(updates) == 1 and isinstance(updates[0]["value"], int)
+    request_data()
+    appended = {u["pagekey"]: u for u in add_rows_and_get_updates()}
+    assert len(gui._bindings()._get_all_scopes()[sid].df_data) == 7
+    # the page only receives the row that fits, the other clients all the appended rows
+    assert appended["page"]["append"] is True
+    assert appended["page"]["value"]["rowcount"] == 7
+    assert [r["_tp_index"] for r in json.loads(appended["page"]["value"]["data"])] == [5]
+    assert appended["infinite"]["infinite"] is True
+    assert appended["infinite"]["value"]["start"] == 5
+    assert [r["name"] for r in json.loads(appended["infinite"]["value"]["data"])] == ["D", "E"]
+    assert appended["chart"]["append"] is True
+    assert json.loads(appended["chart"]["value"]["data"]) == {"value": [4, 5]}
+    # sorting makes the table request all the data again
+    ws_client.emit(
+        "message",
+        {
+            "client_id": sid,
+            "type": "DU",
+            "name": var_name,
+            "payload": {"columns": ["name"], "start": 0, "end": 3, "orderby": "value", "pagekey": "sorted"},
+        },
+    )
+    ws_client.get_received()
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "add_rows"})
+    received_messages = [p for m in ws_client.get_received() if m["args"]["type"] == "MU" for p in m["args"]["payload"]]
+    refresh = next(m for m in received_messages if m["name"].startswith(var_name))
+    assert isinstance(refresh["payload"]["value"], int)
+    # the requests of a client are dropped when it disconnects
+    assert sid in gui._Gui__data_requests
+    ws_client.disconnect()
+    assert sid not in gui._Gui__data_requests
+
+
+def test_du_read_ahead(gui: Gui, helpers):
+    df_data = pd.DataFrame({"name": [f"n{i}" for i in range(30)], "value": range(30)})  # noqa: F841
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", Markdown("<|{df_data}|table|>"))
+    gui.run(run_server=False, data_read_ahead_pages=2)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    var_name = "_TpD_tpec_TpExPr_df_data_TPMDL_0"
+    cache = gui._accessors._get_cache()
+
+    def request_rows(start: int, end: int):
+        payload = {"columns": ["name"], "start": start, "end": end, "infinite": True, "pagekey": f"{start}-{end}"}
+        ws_client.emit("message", {"client_id": sid, "type": "DU", "name": var_name, "payload": payload})
+        received_messages = [
+            p for m in ws_client.get_received() if m["args"]["type"] == "MU" for p in m["args"]["payload"]
+        ]
+        return next(m["payload"] for m in received_messages if m["name"].startswith(var_name))
+
+    assert [r["name"] for r in json.loads(request_rows(0, 9)["value"]["data"])] == [f"n{i}" for i in range(10)]
+    # the next two pages are prepared in the background
+    for _ in range(100):
+        if len(cache) >= 2:
+            break
+        time.sleep(0.05)
+    assert len(cache) == 2
+    get_data = gui._accessors._get_data
+    calls = []
+    gui._accessors._get_data = lambda *args: calls.append(args) or get_data(*args)
+    ret_payload = request_rows(10, 19)
+    assert not calls
+    assert ret_payload["pagekey"] == "10-19"
+    assert ret_payload["value"]["start"] == 10
+    assert [r["name"] for r in json.loads(ret_payload["value"]["data"])] == [f"n{i}" for i in range(10, 20)]
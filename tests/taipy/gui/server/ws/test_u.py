@@ -59,3 +59,14 @@ def test_ws_u_number(gui: Gui, helpers):
     gui._set_frame(inspect.currentframe())
 
     ws_u_assert_template(gui, helpers, value_before_update, value_after_update, payload)
+
+
+def test_ws_u_list(gui: Gui, helpers):
+    value_before_update = [1, 2]
+    value_after_update = [1, 2.5, "a", None]
+    payload = {"value": value_after_update}
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    ws_u_assert_template(gui, helpers, value_before_update, value_after_update, payload)